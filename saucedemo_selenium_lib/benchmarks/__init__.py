@@ -0,0 +1 @@
+"""Package containing benchmarks of the library"""
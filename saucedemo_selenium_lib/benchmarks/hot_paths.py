@@ -0,0 +1,244 @@
+""" SaucedemoUtils Hot Paths Benchmark
+
+Time the SaucedemoUtils operations every test goes through against a local stand-in Saucedemo server. Each iteration
+opens a new browser session, runs the operations and closes it. For each operation p50/p95 duration and number of
+WebDriver commands are reported, together with memory of the browser and of the benchmark process. Results can be
+saved as a JSON baseline and later runs compared with it.
+"""
+import contextlib
+import json
+import os
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from saucedemo_selenium_lib.data_models import SortOptions, WebBrowsers
+from saucedemo_selenium_lib.saucedemo_utils.simulated_driver import SimulatedWebDriver
+from saucedemo_selenium_lib.saucedemo_utils.wait_timeouts import percentile
+from saucedemo_selenium_lib.test_result.calibration import get_process_tree, get_processes_usage
+
+OPERATIONS = (
+    "open_saucedemo_website",
+    "login",
+    "click_at_element",
+    "save_field_value",
+    "get_product_names",
+    "sort_product_list",
+    "take_screenshot",
+    "close_browser",
+)
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+# Smallest p50 increase in ms counted as a regression. Sub-millisecond operations vary by more than the threshold share
+DEFAULT_MIN_DELTA_MS = 1.0
+# p50 of fewer iterations is mostly noise, durations are only compared when both runs have this many iterations
+MIN_COMPARED_ITERATIONS = 5
+USERNAME = "standard_user"
+PASSWORD = "secret_sauce"
+
+# WebDriver classes whose commands are counted
+COUNTED_WEBDRIVER_CLASSES = [WebDriver, SimulatedWebDriver]
+
+
+class CommandCounter:
+    """Count WebDriver commands executed while it is active
+
+    execute() of COUNTED_WEBDRIVER_CLASSES is wrapped, so commands of all drivers created in the process are counted.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.commands = {}
+
+    @contextlib.contextmanager
+    def counting(self):
+        originals = {cls: cls.__dict__["execute"] for cls in COUNTED_WEBDRIVER_CLASSES}
+
+        def wrap(execute):
+            def counted_execute(driver, driver_command, *args, **kwargs):
+                self.count += 1
+                self.commands[driver_command] = self.commands.get(driver_command, 0) + 1
+                return execute(driver, driver_command, *args, **kwargs)
+
+            return counted_execute
+
+        for cls, execute in originals.items():
+            cls.execute = wrap(execute)
+        try:
+            yield self
+        finally:
+            for cls, execute in originals.items():
+                cls.execute = execute
+
+
+def _get_browser_rss(saucedemo_utils):
+    service = getattr(saucedemo_utils.driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is None:
+        # Remote and simulated drivers have no local browser process
+        return 0
+    return get_processes_usage(get_process_tree(process.pid))[0]
+
+
+def run_iteration(host_url, browser, headless, output_path, counter):
+    """Run the operations once in a new browser session
+
+    Returns:
+        (dict of operations and (duration in seconds, number of WebDriver commands), browser RSS in bytes)
+    """
+    from saucedemo_selenium_lib.saucedemo_utils.saucedemo_utils import SaucedemoUtils
+
+    saucedemo_utils = SaucedemoUtils(
+        host_url,
+        USERNAME,
+        PASSWORD,
+        headless=headless,
+        output_path=output_path,
+        download_path=output_path,
+        log_file="benchmark",
+        browser=browser,
+    )
+    measurements = {}
+    browser_rss = 0
+
+    def measure(operation, function, *args, **kwargs):
+        commands = counter.count
+        start_time = time.perf_counter()
+        result = function(*args, **kwargs)
+        measurements[operation] = (time.perf_counter() - start_time, counter.count - commands)
+        return result
+
+    try:
+        measure("open_saucedemo_website", saucedemo_utils.open_saucedemo_website)
+        measure("login", saucedemo_utils.login)
+        measure("get_product_names", saucedemo_utils.get_product_names)
+        measure("sort_product_list", saucedemo_utils.sort_product_list, SortOptions.PRICE_LOW_TO_HIGH)
+        measure(
+            "click_at_element",
+            saucedemo_utils.click_at_element,
+            (By.ID, "item_4_title_link"),
+            track_warning_errors=False,
+        )
+        saucedemo_utils.driver.get(f"{host_url}/checkout-step-one.html")
+        measure(
+            "save_field_value",
+            saucedemo_utils.save_field_value,
+            (By.ID, "first-name"),
+            "Benchmark",
+            track_warning_errors=False,
+        )
+        measure("take_screenshot", saucedemo_utils.take_screenshot, screenshot_path=output_path)
+        browser_rss = _get_browser_rss(saucedemo_utils)
+    finally:
+        measure("close_browser", saucedemo_utils.close_browser)
+    return measurements, browser_rss
+
+
+def run_hot_paths_benchmark(host_url=None, iterations=5, browser=WebBrowsers.CHROME, headless=True, latency=0.0):
+    """Run hot paths benchmark
+
+    Args:
+        host_url: Url of Saucedemo webapp. A stand-in server is started if it is None
+        iterations: Number of browser sessions
+        browser: WebBrowsers value
+        headless: Run browser in headless mode
+        latency: Latency in seconds of the stand-in server responses
+
+    Returns:
+        dict with p50 and p95 in ms and mean number of WebDriver commands of each operation, and peak browser and
+        benchmark process RSS in MB
+    """
+    from saucedemo_selenium_lib.standin.server import StandinServer
+
+    server = None
+    if host_url is None:
+        server = StandinServer(latency=latency).start()
+        host_url = server.url
+    counter = CommandCounter()
+    measurements = {operation: [] for operation in OPERATIONS}
+    browser_rss = 0
+    try:
+        with tempfile.TemporaryDirectory() as output_path, counter.counting():
+            for _ in range(iterations):
+                iteration, rss = run_iteration(host_url, browser, headless, output_path, counter)
+                for operation, measurement in iteration.items():
+                    measurements[operation].append(measurement)
+                browser_rss = max(browser_rss, rss)
+    finally:
+        if server is not None:
+            server.stop()
+
+    operations = {}
+    for operation, values in measurements.items():
+        if not values:
+            continue
+        durations = [duration for duration, _ in values]
+        operations[operation] = {
+            "p50_ms": round(percentile(durations, 50) * 1000, 1),
+            "p95_ms": round(percentile(durations, 95) * 1000, 1),
+            "commands": round(sum(commands for _, commands in values) / len(values), 1),
+        }
+    return {
+        "browser": browser.value,
+        "iterations": iterations,
+        "operations": operations,
+        "commands": dict(sorted(counter.commands.items(), key=lambda item: -item[1])),
+        "browser_rss_mb": round(browser_rss / 1024 ** 2, 1),
+        "process_rss_mb": round(get_processes_usage([os.getpid()])[0] / 1024 ** 2, 1),
+    }
+
+
+def are_durations_comparable(results, baseline):
+    """Return True if results and baseline have enough iterations for their p50 durations to be compared"""
+    return min(results.get("iterations", 0), baseline.get("iterations", 0)) >= MIN_COMPARED_ITERATIONS
+
+
+def compare_with_baseline(
+    results, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD, min_delta_ms=DEFAULT_MIN_DELTA_MS
+):
+    """Compare benchmark results with a baseline
+
+    An operation regressed if it runs more WebDriver commands than in the baseline or its p50 duration is both more
+    than threshold(share) and more than min_delta_ms slower. Durations are only compared if both runs have at least
+    MIN_COMPARED_ITERATIONS iterations.
+
+    Returns:
+        list of dicts with operation, baseline and current p50 and commands and 'regressed'
+    """
+    compare_durations = are_durations_comparable(results, baseline)
+    comparison = []
+    for operation, current in results["operations"].items():
+        base = baseline.get("operations", {}).get(operation)
+        if base is None:
+            continue
+        slower = (
+            compare_durations
+            and current["p50_ms"] > base["p50_ms"] * (1 + threshold)
+            and current["p50_ms"] - base["p50_ms"] > min_delta_ms
+        )
+        comparison.append(
+            {
+                "operation": operation,
+                "baseline_p50_ms": base["p50_ms"],
+                "p50_ms": current["p50_ms"],
+                "change": f"{(current['p50_ms'] - base['p50_ms']) / base['p50_ms']:+.0%}" if base["p50_ms"] else "-",
+                "baseline_commands": base["commands"],
+                "commands": current["commands"],
+                "regressed": slower or current["commands"] > base["commands"],
+            }
+        )
+    return comparison
+
+
+def load_baseline(baseline_file):
+    try:
+        with open(baseline_file) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(baseline_file, results):
+    with open(baseline_file, "w") as file:
+        json.dump(results, file, indent=2)
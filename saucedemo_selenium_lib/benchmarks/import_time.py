@@ -0,0 +1,99 @@
+""" Import Time Benchmark
+
+Measure import time of the library entry points in fresh interpreters with `python -X importtime` and check them
+against budgets. Besides the time budget, an entry point must not import heavy dependencies it only needs lazily e.g
+the CLI must not import pytest just to show --help.
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+# { <module>: {"preload": <modules already imported where the module is used>, "budget": <seconds>,
+#              "forbidden": <modules that must not be imported>} }
+IMPORT_BUDGETS = {
+    "saucedemo_selenium_lib.test_result.cli": {
+        "preload": (),
+        "budget": 0.15,
+        "forbidden": ("pytest", "lxml", "openpyxl", "yaml", "selenium.webdriver", "webdriver_manager"),
+    },
+    # Loaded through pytest11 entry point in the main pytest process and every xdist worker
+    "saucedemo_selenium_lib.test_result.pytest_plugin": {
+        "preload": ("pytest",),
+        "budget": 0.05,
+        "forbidden": ("lxml", "openpyxl", "yaml", "selenium.webdriver", "webdriver_manager"),
+    },
+    "saucedemo_selenium_lib.saucedemo_utils.saucedemo_utils": {
+        "preload": (),
+        "budget": 0.3,
+        "forbidden": ("pytest", "lxml", "openpyxl", "yaml", "webdriver_manager"),
+    },
+}
+
+
+def _parse_import_time(stderr, module):
+    """Return cumulative import time in seconds of a module from -X importtime output"""
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module and parts[2].startswith(f" {module}"):
+            return int(parts[1]) / 1_000_000
+    raise ValueError(f"Import time of {module} not found in -X importtime output")
+
+
+def measure_import(module, preload=(), python=sys.executable):
+    """Import a module in a fresh interpreter
+
+    Args:
+        module: Module to import
+        preload: Modules imported before the module. Their import time is not counted
+
+    Returns:
+        (import time in seconds, names of all imported modules)
+    """
+    code = "; ".join(
+        [f"import {name}" for name in (*preload, module)]
+        + ["import sys, json", "print(json.dumps(sorted(sys.modules)))"]
+    )
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse_import_time(process.stderr, module), json.loads(process.stdout)
+
+
+def _is_imported(name, modules):
+    return any(module == name or module.startswith(f"{name}.") for module in modules)
+
+
+def run_import_benchmark(budgets=None, runs=5):
+    """Measure import time of modules and check them against their budgets
+
+    Args:
+        budgets: Dict of modules and their budgets. Default is IMPORT_BUDGETS
+        runs: Number of times each module is imported. Median import time is compared to the budget
+
+    Returns:
+        list of dicts with module, median and budget import times in ms, forbidden modules that were imported and
+        'ok' which is False if the budget is exceeded or a forbidden module was imported
+    """
+    results = []
+    for module, budget in (budgets or IMPORT_BUDGETS).items():
+        times = []
+        modules = []
+        for _ in range(runs):
+            import_time, modules = measure_import(module, preload=budget["preload"])
+            times.append(import_time)
+        median = statistics.median(times)
+        imported = [name for name in budget["forbidden"] if _is_imported(name, modules)]
+        results.append(
+            {
+                "module": module,
+                "median_ms": round(median * 1000, 1),
+                "budget_ms": round(budget["budget"] * 1000, 1),
+                "forbidden_imported": ", ".join(imported) or "-",
+                "ok": median <= budget["budget"] and not imported,
+            }
+        )
+    return results
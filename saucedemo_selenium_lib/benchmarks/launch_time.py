@@ -0,0 +1,69 @@
+""" Browser Launch Time Benchmark
+
+Time how long SaucedemoUtils takes to launch a local browser session and quit it, with a fresh profile and with the
+fast profile of browser_profiles, and report the saving. Launches alternate between the two, so changes of machine
+load affect both alike. The profile template is built before the first timed launch, as it is once per worker in a
+run.
+"""
+import tempfile
+import time
+
+from saucedemo_selenium_lib.data_models import WebBrowsers
+from saucedemo_selenium_lib.saucedemo_utils.browser_profiles import get_profile_template
+from saucedemo_selenium_lib.saucedemo_utils.wait_timeouts import percentile
+
+
+def time_launch(browser, headless, fast_profile, output_path):
+    """Return seconds taken to launch a browser session and quit it"""
+    from saucedemo_selenium_lib.saucedemo_utils.saucedemo_utils import SaucedemoUtils
+
+    saucedemo_utils = SaucedemoUtils(
+        "about:blank",
+        headless=headless,
+        output_path=output_path,
+        download_path=output_path,
+        log_file="benchmark",
+        browser=browser,
+        fast_profile=fast_profile,
+    )
+    start_time = time.perf_counter()
+    saucedemo_utils._setup_web_driver()
+    saucedemo_utils.driver.quit()
+    duration = time.perf_counter() - start_time
+    saucedemo_utils.close_browser()
+    return duration
+
+
+def run_launch_benchmark(browser=WebBrowsers.CHROME, headless=True, iterations=5):
+    """Run launch time benchmark
+
+    Args:
+        browser: WebBrowsers value, Chrome or Firefox
+        headless: Run browser in headless mode
+        iterations: Number of launches with each profile
+
+    Returns:
+        dict with p50 and p95 launch time in ms of each profile and the saving of p50 in ms and share
+    """
+    get_profile_template(browser)
+    durations = {"fresh": [], "fast": []}
+    with tempfile.TemporaryDirectory() as output_path:
+        for _ in range(iterations):
+            durations["fresh"].append(time_launch(browser, headless, False, output_path))
+            durations["fast"].append(time_launch(browser, headless, True, output_path))
+
+    profiles = {
+        profile: {
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+        }
+        for profile, values in durations.items()
+    }
+    saving = profiles["fresh"]["p50_ms"] - profiles["fast"]["p50_ms"]
+    return {
+        "browser": browser.value,
+        "iterations": iterations,
+        "profiles": profiles,
+        "saving_ms": round(saving, 1),
+        "saving": round(saving / profiles["fresh"]["p50_ms"], 3) if profiles["fresh"]["p50_ms"] else 0.0,
+    }
@@ -1,12 +1,159 @@
+import functools
+import json
 import os
-import yaml
 
-from saucedemo_selenium_lib.data_models import WebBrowsers
+from saucedemo_selenium_lib.data_models import WebBrowsers, PageLoadStrategies
 from saucedemo_selenium_lib.exceptions import SaucedemoTestError
 
 config_path = os.path.abspath(os.path.join(__file__, "../../../config.yml"))
 
 
+def get_config_loader():
+    """Return YAML loader of config files. libyaml based loader is much faster, it is available when PyYAML is built
+    with libyaml. yaml is imported only when a config file is parsed, workers use exported configs"""
+    import yaml
+
+    return getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+
+# Envar used to pass parsed configs to xdist workers so that they do not parse config file
+EXPORTED_CONFIGS_ENVAR = "SAUCEDEMO_EXPORTED_CONFIGS"
+
+# { <config file path>: (<file modification time>, <configs dict>) }
+_configs_cache = {}
+
+
+def load_configs(config_file):
+    """Return configs dict of a config file
+
+    Configs exported with export_configs are used if they are of the same config file and it was not modified since.
+    Otherwise, the file is parsed once and cached until it is modified.
+
+    Raises:
+        FileNotFoundError if config file does not exist
+    """
+    config_file = os.path.abspath(config_file)
+    modified_time = os.stat(config_file).st_mtime_ns
+    exported = os.environ.get(EXPORTED_CONFIGS_ENVAR)
+    if exported:
+        cached = _configs_cache.get(exported)
+        if cached is None:
+            cached = _configs_cache[exported] = (None, json.loads(exported))
+        if cached[1]["config_file"] == config_file and cached[1]["modified_time"] == modified_time:
+            return cached[1]["configs"]
+
+    cached = _configs_cache.get(config_file)
+    if cached is not None and cached[0] == modified_time:
+        return cached[1]
+    import yaml
+
+    with open(config_file) as file:
+        configs = yaml.load(file, Loader=get_config_loader())
+    _configs_cache[config_file] = (modified_time, configs)
+    return configs
+
+
+def export_configs(config_file):
+    """Parse config file and export the configs in an envar. Processes started afterwards e.g xdist workers
+    inherit the envar and use the exported configs instead of parsing the config file. Exported configs contain
+    credentials, clear them with clear_exported_configs when the processes are done"""
+    config_file = os.path.abspath(config_file)
+    configs = load_configs(config_file)
+    os.environ[EXPORTED_CONFIGS_ENVAR] = json.dumps(
+        {"config_file": config_file, "modified_time": os.stat(config_file).st_mtime_ns, "configs": configs},
+        default=str,
+    )
+
+
+def clear_exported_configs():
+    os.environ.pop(EXPORTED_CONFIGS_ENVAR, None)
+
+
+# Envar used to pass host of every xdist worker when tests are run against a pool of hosts
+HOST_POOL_ENVAR = "SAUCEDEMO_HOST_POOL"
+
+ROUND_ROBIN = "round-robin"
+LEAST_LOADED = "least-loaded"
+HOST_POOL_STRATEGIES = (ROUND_ROBIN, LEAST_LOADED)
+
+
+def get_host_pool_capacity(hosts):
+    """Return maximum number of workers hosts can take. None if any of the hosts has no 'max_workers' cap"""
+    caps = [host.get("max_workers") for host in hosts]
+    if any(cap is None for cap in caps):
+        return None
+    return sum(caps)
+
+
+def assign_workers_to_hosts(hosts, num_workers, strategy=ROUND_ROBIN):
+    """Assign xdist workers to hosts of a pool
+
+    A host is not assigned more workers than its optional 'max_workers' cap in the config file.
+
+    Args:
+        hosts: List of host configs of the pool
+        num_workers: Number of xdist workers
+        strategy: 'round-robin' assigns workers to hosts in turns. 'least-loaded' assigns each worker to the host with
+                  the lowest share of its cap in use, so hosts with higher caps get more workers
+
+    Returns:
+        list of indexes in hosts, one per worker i.e worker gw<n> runs against host at index n
+    """
+    if strategy not in HOST_POOL_STRATEGIES:
+        raise SaucedemoTestError(f"Unknown host pool strategy: {strategy}. Available strategies: {HOST_POOL_STRATEGIES}")
+    caps = [host.get("max_workers") for host in hosts]
+    assigned = [0] * len(hosts)
+    assignment = []
+    next_host = 0
+    for worker in range(num_workers):
+        available = [index for index, cap in enumerate(caps) if cap is None or assigned[index] < cap]
+        if not available:
+            raise SaucedemoTestError(
+                f"Hosts pool can not take more than {worker} workers. Increase 'max_workers' of the hosts or "
+                f"decrease number of processes"
+            )
+        if strategy == LEAST_LOADED:
+            host = min(available, key=lambda index: assigned[index] / (caps[index] or num_workers))
+        else:
+            host = min(available, key=lambda index: (index - next_host) % len(hosts))
+            next_host = host + 1
+        assigned[host] += 1
+        assignment.append(host)
+    return assignment
+
+
+def export_host_pool(workers_hosts):
+    """Export hosts of xdist workers in an envar inherited by the workers
+
+    Args:
+        workers_hosts: List of (host index, host url) of each worker
+    """
+    os.environ[HOST_POOL_ENVAR] = json.dumps(
+        [{"host_index": host_index, "url": url} for host_index, url in workers_hosts]
+    )
+
+
+def clear_host_pool():
+    os.environ.pop(HOST_POOL_ENVAR, None)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_host_pool(exported):
+    return json.loads(exported)
+
+
+def get_worker_host():
+    """Return host config dict with 'host_index' and 'url' of the current xdist worker. None if tests are not run
+    against a pool of hosts or not in an xdist worker"""
+    exported = os.environ.get(HOST_POOL_ENVAR)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not exported or not worker:
+        return None
+    workers_hosts = _load_host_pool(exported)
+    # Workers are named gw0, gw1, ... Restarted workers get new names, so they are wrapped around
+    return workers_hosts[int(worker[2:]) % len(workers_hosts)]
+
+
 class TestConfig:
     """For managing Test configs and defining common constants"""
 
@@ -35,6 +182,11 @@ class TestConfig:
         # fetched from a config file.
         self._config_file = config_file
         self._host_index = host_index
+        if host_url is None:
+            # In a host pool run every worker has its own host
+            worker_host = get_worker_host()
+            if worker_host is not None:
+                self._host_index = worker_host["host_index"]
         self._host_url = host_url
         self._username = username
         self._password = password
@@ -67,6 +219,19 @@ class TestConfig:
         """Config file path"""
         return self._config_file
 
+    @property
+    def host_index(self):
+        return self._host_index
+
+    @property
+    def hosts(self):
+        """Return list of host configs in the config file"""
+        configs = self._get_configs_dict()
+        try:
+            return configs["hosts"]
+        except KeyError:
+            raise Exception("Hosts are not available in the configs")
+
     @property
     def browser(self):
         return self._browser
@@ -78,9 +243,7 @@ class TestConfig:
     def _get_configs_dict(self):
         """Get dictionary of configs"""
         try:
-            with open(self._config_file) as file:
-                configs = yaml.load(file, Loader=yaml.FullLoader)
-                return configs
+            return load_configs(self._config_file)
         except FileNotFoundError as e:
             # Config file should be created locally before running the tests
             raise SaucedemoTestError(
@@ -110,6 +273,23 @@ class TestConfig:
             raise Exception("Host users password is not available in the configs")
 
 
+# Envar with page load strategy of SaucedemoUtils, the runner uses it to pass the strategy to xdist workers
+PAGE_LOAD_STRATEGY_ENVAR = "PAGE_LOAD_STRATEGY"
+
+
+def get_page_load_strategy(page_load_strategy=None):
+    """Return given page load strategy or the one in PAGE_LOAD_STRATEGY envar. Default is 'normal'
+
+    Raises:
+        SaucedemoTestError if it is not a PageLoadStrategies value
+    """
+    if page_load_strategy is None:
+        page_load_strategy = os.environ.get(PAGE_LOAD_STRATEGY_ENVAR) or PageLoadStrategies.NORMAL
+    if page_load_strategy not in PageLoadStrategies.get_public_attribute_values():
+        raise SaucedemoTestError(f"Unknown page load strategy: {page_load_strategy}")
+    return page_load_strategy
+
+
 class SaucedemoTimeOuts:
     PRODUCT_SHOULD_BE_PRESENT_TIMEOUT = 10
     LONG_LOADING_TIMEOUT = 30
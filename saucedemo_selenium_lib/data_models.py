@@ -1,5 +1,6 @@
 """For defining common data structure"""
 from enum import Enum
+from typing import NamedTuple, Optional
 
 
 class BaseDataClass:
@@ -18,4 +19,134 @@ class WebBrowsers(Enum):
 
     CHROME = "chrome"
     FIREFOX = "firefox"
+    # In-memory driver without a browser, see saucedemo_utils.simulated_driver
+    SIMULATED = "simulated"
+
+
+
+class PageLoadStrategies(BaseDataClass):
+    """WebDriver page load strategies i.e when navigation returns
+
+    normal waits for all resources to load, eager for the document to be parsed and none returns at once
+    """
+
+    NORMAL = "normal"
+    EAGER = "eager"
+    NONE = "none"
+
+
+class SaucedemoProduct(NamedTuple):
+    """Product of Saucedemo inventory"""
+
+    id: int
+    name: str
+    description: str
+    price: float
+
+    @property
+    def slug(self):
+        """Slug used in ids of the product buttons e.g 'add-to-cart-sauce-labs-backpack'"""
+        return self.name.lower().replace(" ", "-")
+
+    @property
+    def display_price(self):
+        return f"${self.price:.2f}"
+
+
+# Products of Saucedemo inventory with their Saucedemo ids, in the default(name A to Z) order
+SAUCEDEMO_PRODUCTS = (
+    SaucedemoProduct(
+        4,
+        "Sauce Labs Backpack",
+        "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled "
+        "laptop and tablet protection.",
+        29.99,
+    ),
+    SaucedemoProduct(
+        0,
+        "Sauce Labs Bike Light",
+        "A red light isn't the desired state in testing but it sure helps when riding your bike at night. "
+        "Water-resistant with 3 lighting modes, 1 AAA battery included.",
+        9.99,
+    ),
+    SaucedemoProduct(
+        1,
+        "Sauce Labs Bolt T-Shirt",
+        "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed "
+        "cotton, heather gray with red bolt.",
+        15.99,
+    ),
+    SaucedemoProduct(
+        5,
+        "Sauce Labs Fleece Jacket",
+        "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling "
+        "everything from a relaxing day outdoors to a busy day at the office.",
+        49.99,
+    ),
+    SaucedemoProduct(
+        2,
+        "Sauce Labs Onesie",
+        "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, "
+        "two-needle hemmed sleeved and bottom won't unravel.",
+        7.99,
+    ),
+    SaucedemoProduct(
+        3,
+        "Test.allTheThings() T-Shirt (Red)",
+        "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few "
+        "tests. Super-soft and comfy ringspun combed cotton.",
+        15.99,
+    ),
+)
+SAUCEDEMO_PRODUCTS_BY_NAME = {product.name: product for product in SAUCEDEMO_PRODUCTS}
+
+
+class VerificationMismatch(NamedTuple):
+    """Expectation of SaucedemoUtils.verify_many that is not met
+
+    actual is None if no element of the locator was found
+    """
+
+    locator: tuple
+    expected: str
+    actual: Optional[str]
+
+    @property
+    def is_missing(self):
+        return self.actual is None
+
+
+class SortOptions(BaseDataClass):
+    """Visible texts of products sort options"""
+
+    NAME_A_TO_Z = "Name (A to Z)"
+    NAME_Z_TO_A = "Name (Z to A)"
+    PRICE_LOW_TO_HIGH = "Price (low to high)"
+    PRICE_HIGH_TO_LOW = "Price (high to low)"
+
+
+class SortOrder(NamedTuple):
+    """Order of the products list for a sort option"""
+
+    value: str  # value of the option in the sort select
+    field: str  # 'name' or 'price'
+    descending: bool
+
+
+SORT_ORDERS = {
+    SortOptions.NAME_A_TO_Z: SortOrder("az", "name", False),
+    SortOptions.NAME_Z_TO_A: SortOrder("za", "name", True),
+    SortOptions.PRICE_LOW_TO_HIGH: SortOrder("lohi", "price", False),
+    SortOptions.PRICE_HIGH_TO_LOW: SortOrder("hilo", "price", True),
+}
+
+
+class SortVerification(NamedTuple):
+    """Result of checking order of the products list
+
+    out_of_order is the first pair of product names or prices in wrong order, None if the list is sorted
+    """
+
+    is_sorted: bool
+    out_of_order: Optional[tuple] = None
 
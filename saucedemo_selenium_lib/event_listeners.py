@@ -8,6 +8,20 @@ class SeleniumEventListener(AbstractEventListener):
     def __init__(self, saucedemo_utils):
         self.saucedemo_utils = saucedemo_utils
 
+    def after_navigate_to(self, url, driver):
+        """Elements of the previous page are stale"""
+        self.saucedemo_utils.element_cache.invalidate()
+
+    def after_navigate_back(self, driver):
+        self.saucedemo_utils.element_cache.invalidate()
+
+    def after_navigate_forward(self, driver):
+        self.saucedemo_utils.element_cache.invalidate()
+
+    def after_click(self, element, driver):
+        """Clicks can navigate or re-render the page"""
+        self.saucedemo_utils.element_cache.invalidate()
+
     def before_quit(self, driver):
         """Fired just before the browser is being closed. Check for dialog boxes after the tests is finished
         and take screenshot if the warning or errors are found"""
@@ -1,3 +1,4 @@
+import contextlib
 import os
 from datetime import datetime
 import hashlib
@@ -39,3 +40,20 @@ def create_folder_if_non_exist(folder_path):
         print(f"Folder: {folder_path} does not exist")
         print(f"Creating a folder: {folder_path}")
         os.mkdir(folder_path)
+
+
+@contextlib.contextmanager
+def environment_variables(variables):
+    """Set envars of a dict while the context is active and restore their previous values when it exits, also on
+    errors. Envars with None values are left as they are"""
+    variables = {name: value for name, value in variables.items() if value is not None}
+    previous = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
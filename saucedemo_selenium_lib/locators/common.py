@@ -1,6 +1,8 @@
 """Locators for common elements/component locators on saucedemo website"""
 from selenium.webdriver.common.by import By
 
+from saucedemo_selenium_lib.locators.registry import LOCATORS
+
 
 class CommonLocators:
     MENU_BUTTON = (By. CLASS_NAME, "bm-burger-button")
@@ -14,4 +16,24 @@ class CommonLocators:
     RESET_APP_STATE = (By. ID, "reset_sidebar_link")
     PRODUCT = (By. CLASS_NAME, "inventory_item")
     PRODUCT_NAMES = (By. CLASS_NAME, "inventory_item_name")
-    PRODUCT_PRICES = (By. CLASS_NAME, "inventory_item_price")
\ No newline at end of file
+    PRODUCT_PRICES = (By. CLASS_NAME, "inventory_item_price")
+
+    # Parameterized locators, formatted with their parameters e.g PRODUCT_NAME_BY_TEXT.format(product_name=name)
+    PRODUCT_NAME_BY_TEXT = LOCATORS.register(
+        "CommonLocators.PRODUCT_NAME_BY_TEXT",
+        By.XPATH,
+        "//div[contains(@class, 'inventory_item_name') and contains(., '{product_name}')]",
+    )
+    PRODUCT_IMAGE_BY_NAME = LOCATORS.register(
+        "CommonLocators.PRODUCT_IMAGE_BY_NAME",
+        By.XPATH,
+        "//img[contains(@class, 'inventory_item_img') and contains(@alt, '{product_name}')]",
+    )
+    REMOVE_PRODUCT_BUTTON = LOCATORS.register(
+        "CommonLocators.REMOVE_PRODUCT_BUTTON",
+        By.XPATH,
+        "//button[contains(@id, 'remove-{product_slug}') and contains(., 'Remove')]",
+    )
+
+
+LOCATORS.register_locators(CommonLocators)
@@ -0,0 +1,30 @@
+"""Saucedemo pages that can be opened with their url and readiness conditions showing they can be used"""
+from typing import Callable, NamedTuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from saucedemo_selenium_lib.locators.registry import LOCATORS
+
+
+class SaucedemoPage(NamedTuple):
+    path: str  # path relative to host url
+    ready_locator: tuple  # element rendered when the page can be used
+    # expected condition of ready_locator met when the page can be used, waited for once after navigation
+    ready_condition: Callable = EC.presence_of_element_located
+
+
+class SaucedemoPages:
+    LOGIN = SaucedemoPage("", (By.ID, "user-name"), EC.element_to_be_clickable)
+    INVENTORY = SaucedemoPage("inventory.html", (By.CLASS_NAME, "inventory_item"))
+    # opened with product id e.g inventory-item.html?id=4
+    INVENTORY_ITEM = SaucedemoPage("inventory-item.html", (By.CLASS_NAME, "inventory_details_name"))
+    CART = SaucedemoPage("cart.html", (By.ID, "checkout"))
+    CHECKOUT_INFORMATION = SaucedemoPage("checkout-step-one.html", (By.ID, "first-name"), EC.element_to_be_clickable)
+    CHECKOUT_OVERVIEW = SaucedemoPage("checkout-step-two.html", (By.ID, "finish"))
+    CHECKOUT_COMPLETE = SaucedemoPage("checkout-complete.html", (By.CLASS_NAME, "complete-header"))
+
+
+for _name, _page in vars(SaucedemoPages).items():
+    if isinstance(_page, SaucedemoPage):
+        LOCATORS.add_name(_page.ready_locator, f"SaucedemoPages.{_name}")
@@ -0,0 +1,263 @@
+""" Locator Registry
+
+Central registry of named locators. Parameterized locators are registered once as templates and formatted with
+parameters when they are used e.g
+
+    PRODUCT_IMAGE_BY_NAME = LOCATORS.register(
+        "CommonLocators.PRODUCT_IMAGE_BY_NAME",
+        By.XPATH,
+        "//img[contains(@class, 'inventory_item_img') and contains(@alt, '{product_name}')]",
+    )
+    locator = PRODUCT_IMAGE_BY_NAME.format(product_name="Sauce Labs Backpack")
+
+XPath templates are compiled to CSS selectors when the two match the same elements, browsers evaluate CSS selectors
+much faster. Only paths of descendant and child steps with predicates on attributes are compiled:
+@attr, @attr='value', contains(@attr, 'value') and starts-with(@attr, 'value'). XPaths matching texts e.g
+contains(., 'text') have no CSS equivalent and are kept.
+
+Names of formatted locators are kept, so locator costs can be reported by name.
+"""
+import re
+
+from selenium.webdriver.common.by import By
+
+from saucedemo_selenium_lib.exceptions import SaucedemoTestError
+
+XPATH_TOKEN = re.compile(
+    r"""\s*(?:(?P<path>\.//|//|/)|(?P<literal>'[^']*'|"[^"]*")|(?P<attribute>@[\w-]+)"""
+    r"""|(?P<punctuation>[\[\](),=])|(?P<name>\*|[a-zA-Z_][\w.-]*))"""
+)
+CSS_IDENTIFIER = re.compile(r"^[a-zA-Z_][\w-]*$")
+# CSS attribute operators of XPath functions with the same meaning
+XPATH_FUNCTION_OPERATORS = {"contains": "*=", "starts-with": "^="}
+
+
+def _tokenize_xpath(xpath):
+    tokens = []
+    position = 0
+    xpath = xpath.strip()
+    while position < len(xpath):
+        match = XPATH_TOKEN.match(xpath, position)
+        if match is None or match.end() == position:
+            return None
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "literal":
+            value = value[1:-1]
+        tokens.append((kind, value))
+    return tokens
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def xpath_to_css(xpath):
+    """Compile an XPath to an equivalent CSS selector
+
+    Placeholders of templates e.g '{product_name}' in literals are kept as they are.
+
+    Returns:
+        CSS selector or None if the XPath has no CSS equivalent
+    """
+    tokens = _tokenize_xpath(xpath)
+    if not tokens or tokens[0] not in (("path", "//"), ("path", ".//")):
+        return None
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else (None, None)
+
+    def take(kind, value=None):
+        nonlocal position
+        token = peek()
+        if token[0] != kind or (value is not None and token[1] != value):
+            raise ValueError(f"Expected {value or kind}")
+        position += 1
+        return token[1]
+
+    def condition():
+        kind, value = peek()
+        if kind == "attribute":
+            attribute = take("attribute")[1:]
+            if peek() == ("punctuation", "="):
+                take("punctuation", "=")
+                literal = take("literal")
+                if attribute == "id" and CSS_IDENTIFIER.match(literal):
+                    return f"#{literal}"
+                return f"[{attribute}={_css_string(literal)}]"
+            return f"[{attribute}]"
+        if kind == "name" and value in XPATH_FUNCTION_OPERATORS:
+            take("name")
+            take("punctuation", "(")
+            attribute = take("attribute")[1:]
+            take("punctuation", ",")
+            literal = take("literal")
+            take("punctuation", ")")
+            return f"[{attribute}{XPATH_FUNCTION_OPERATORS[value]}{_css_string(literal)}]"
+        raise ValueError("Unsupported predicate")
+
+    try:
+        selector = []
+        while position < len(tokens):
+            separator = take("path")
+            if selector:
+                selector.append(" " if separator == "//" else " > ")
+            elif separator == "/":
+                raise ValueError("Absolute paths are not supported")
+            name = take("name")
+            selector.append("" if name == "*" else name)
+            step_has_condition = name != "*"
+            while peek() == ("punctuation", "["):
+                take("punctuation", "[")
+                selector.append(condition())
+                while peek() == ("name", "and"):
+                    take("name", "and")
+                    selector.append(condition())
+                take("punctuation", "]")
+                step_has_condition = True
+            if not step_has_condition:
+                selector.append("*")
+    except ValueError:
+        return None
+    return "".join(selector)
+
+
+def get_locator_key(locator):
+    """Return key of a Selenium locator tuple e.g 'id=user-name'"""
+    return f"{locator[0]}={locator[1]}"
+
+
+def get_browser_locator(locator):
+    """Return locator as the browser evaluates it i.e ('css selector' or 'xpath', value)
+
+    Selenium sends id, class name and name locators as CSS selectors. None is returned for link text locators, they
+    are not evaluated by a selector engine.
+    """
+    by, value = locator
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return by, value
+    if by == By.ID:
+        return By.CSS_SELECTOR, f"[id={_css_string(value)}]"
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f"[name={_css_string(value)}]"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return None
+
+
+class LocatorTemplate:
+    """Named locator with optional '{parameter}' placeholders in its value
+
+    Args:
+        registry: LocatorRegistry the template is registered in
+        name: Name of the locator
+        by: Selenium By strategy
+        value: Locator value. Placeholders must be inside quoted literals of XPaths
+    """
+
+    def __init__(self, registry, name, by, value):
+        self._registry = registry
+        self._name = name
+        self._source = (by, value)
+        css = xpath_to_css(value) if by == By.XPATH else None
+        if css is not None:
+            self._by, self._value = By.CSS_SELECTOR, css
+        else:
+            self._by, self._value = by, value
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def source(self):
+        """Locator tuple as it was registered"""
+        return self._source
+
+    @property
+    def compiled(self):
+        """Locator tuple after compilation, with placeholders"""
+        return self._by, self._value
+
+    @property
+    def is_compiled_to_css(self):
+        return self._by != self._source[0]
+
+    def format(self, **parameters):
+        """Return Selenium locator tuple with the parameters
+
+        Raises:
+            SaucedemoTestError if a parameter can not be quoted in the locator
+        """
+        if not parameters:
+            return self._by, self._value
+        if self._by == By.CSS_SELECTOR:
+            quoted = {name: _css_string(str(value))[1:-1] for name, value in parameters.items()}
+        else:
+            quoted = {name: str(value) for name, value in parameters.items()}
+            for name, value in quoted.items():
+                # XPath 1.0 literals can not escape quotes
+                if "'" in value or '"' in value:
+                    raise SaucedemoTestError(f"Parameter {name} of locator {self._name} can not be quoted: {value}")
+        locator = (self._by, self._value.format(**quoted))
+        self._registry.add_name(locator, self._name)
+        return locator
+
+    __call__ = format
+
+    def __repr__(self):
+        return f"LocatorTemplate({self._name!r}, {self._by!r}, {self._value!r})"
+
+
+class LocatorRegistry:
+    """Named locators and templates of the library"""
+
+    def __init__(self):
+        self._templates = {}
+        self._names = {}
+
+    def register(self, name, by, value):
+        """Register a locator template and return it
+
+        Raises:
+            SaucedemoTestError if another locator is registered with the same name
+        """
+        template = self._templates.get(name)
+        if template is not None:
+            if template.source != (by, value):
+                raise SaucedemoTestError(f"Locator {name} is already registered as {template.source}")
+            return template
+        template = self._templates[name] = LocatorTemplate(self, name, by, value)
+        if "{" not in value:
+            self.add_name(template.format(), name)
+        return template
+
+    def register_locators(self, locators_class):
+        """Register locator tuples of a class like CommonLocators as '<class name>.<attribute>'"""
+        for attribute, locator in vars(locators_class).items():
+            if attribute.startswith("_") or not isinstance(locator, tuple) or len(locator) != 2 or not locator[1]:
+                continue
+            self.add_name(locator, f"{locators_class.__name__}.{attribute}")
+
+    def add_name(self, locator, name):
+        self._names.setdefault(get_locator_key(locator), name)
+
+    def get_name(self, locator):
+        """Return name of a locator tuple. None if it is not registered"""
+        return self._names.get(get_locator_key(locator))
+
+    def __getitem__(self, name):
+        return self._templates[name]
+
+    def __iter__(self):
+        return iter(self._templates.values())
+
+    def __len__(self):
+        return len(self._templates)
+
+
+LOCATORS = LocatorRegistry()
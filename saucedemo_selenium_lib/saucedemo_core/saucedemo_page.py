@@ -5,7 +5,6 @@ from selenium.webdriver.support.select import Select
 from saucedemo_selenium_lib.saucedemo_utils import saucedemo_utils as sl
 from saucedemo_selenium_lib.saucedemo_utils.input_elements import (
     InputElementByLocator,
-    InputElementByXPath,
 )
 from saucedemo_selenium_lib.locators.common import (
     CommonLocators,
@@ -30,10 +29,11 @@ class BaseSaucedemoPage:
         """
         Verify given input value is correct
         """
-        element = InputElementByLocator(self._saucedemo_utils.driver, locator)
+        element = InputElementByLocator(
+            self._saucedemo_utils.driver, locator, wait_timeouts=self._saucedemo_utils.wait_timeouts
+        )
         element_value = element.get_value()
-        print(f"Given value: {value}")
-        print(f"Actual Input value: {element_value}")
+        self.saucedemo_utils.logger.debug(f"Given value: {value}, actual input value: {element_value}")
         if element_value == str(value):
             return True
         else:
@@ -43,6 +43,19 @@ class BaseSaucedemoPage:
         """Sort the product list using sort type"""
         self.saucedemo_utils.sort_product_list(sort_type)
 
+    def sort_and_verify(self, sort_type: str):
+        """Sort the product list and check its order in the page
+
+        Args:
+            sort_type: SortOptions value. All four Saucedemo sort options are supported
+
+        Returns:
+            SortVerification, is_sorted is False and out_of_order has the first pair in wrong order if the list is
+            not sorted
+        """
+        self.saucedemo_utils.sort_product_list(sort_type)
+        return self.saucedemo_utils.verify_product_list_order(sort_type)
+
     def log_in_saucedemo(self):
         """Open saucedemo and login"""
         self._saucedemo_utils.open_saucedemo_website()
@@ -59,6 +72,17 @@ class BaseSaucedemoPage:
         self.verify_if_product_is_present(product_name)
         self.saucedemo_utils.click_at_a_product_in_products_list(product_name)
 
+    def open_product_by_name(self, product_name):
+        """Open product page with its url. Faster than select_product_by_name for tests that only need the page"""
+        self.saucedemo_utils.open_product_page(product_name)
+
+    def navigate_to(self, page):
+        """Open a page of SaucedemoPages e.g the cart or checkout pages with its url
+
+        User must be logged in
+        """
+        self.saucedemo_utils.open_page(page)
+
     def select_product_by_image(self, product_name):
         """
         Click on a product image to open an object page
@@ -99,9 +123,10 @@ class BaseSaucedemoPage:
 
     def _click_remove_product_button(self, product_name: str):
         product_name_slug = self._convert_string_to_slug(product_name)
-        button = InputElementByXPath(
+        button = InputElementByLocator(
             self._saucedemo_utils.driver,
-            f"//button[contains(@id, 'remove-{product_name_slug}') and contains(., 'Remove')]",
+            CommonLocators.REMOVE_PRODUCT_BUTTON.format(product_slug=product_name_slug),
+            wait_timeouts=self._saucedemo_utils.wait_timeouts,
         ).find_element()
         button.click()
 
@@ -129,6 +154,17 @@ class BaseSaucedemoPage:
         except (NoSuchElementException, TimeoutException):
             return False
 
+    def verify_many(self, expectations):
+        """Verify texts or values of many locators with one script call, see SaucedemoUtils.verify_many
+
+        Args:
+            expectations: list of (locator, expected text or value)
+
+        Returns:
+            list of VerificationMismatch, empty if all texts and values are as expected
+        """
+        return self._saucedemo_utils.verify_many(expectations)
+
     def select_option_by_option_text(self, select_locator, option_text):
         """Select selection option by option displayed text"""
         self.saucedemo_utils.logger.info(
@@ -0,0 +1,135 @@
+""" Fast Browser Profiles
+
+Start local browsers from a minimal, pre-initialized profile instead of a fresh one, so they skip first run setup and
+background services e.g component updater, sync, translate and background networking that slow down every launch.
+
+A profile template of each browser is built once per process (xdist worker) in a temporary dir and removed when the
+process exits. Each browser session gets its own clone of the template, copy-on-write where the file system supports
+reflinks, which SaucedemoUtils removes when the browser is closed. Chrome is also started with CHROME_FAST_ARGUMENTS.
+Profiles are local dirs, so remote(grid) browsers only get the arguments.
+
+Fast profiles are enabled with fast_profile argument of SaucedemoUtils or FAST_PROFILE envar.
+"""
+import atexit
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from saucedemo_selenium_lib.data_models import WebBrowsers
+
+FAST_PROFILE_ENVAR = "FAST_PROFILE"
+
+# Chrome arguments disabling startup-heavy features and background services
+CHROME_FAST_ARGUMENTS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--metrics-recording-only",
+    "--password-store=basic",
+    "--use-mock-keychain",
+]
+# Files of Chrome profile template, relative to the user data dir
+CHROME_PROFILE_FILES = {
+    "Local State": {
+        "browser": {"has_seen_welcome_page": True},
+        "user_experience_metrics": {"reporting_enabled": False},
+    },
+    os.path.join("Default", "Preferences"): {
+        "browser": {"has_seen_welcome_page": True, "check_default_browser": False},
+        "translate": {"enabled": False},
+        "safebrowsing": {"enabled": False},
+        "credentials_enable_service": False,
+        "profile": {"password_manager_enabled": False},
+    },
+}
+# Preferences of Firefox profile template, written to its user.js
+FIREFOX_PROFILE_PREFERENCES = {
+    "app.update.enabled": False,
+    "app.update.auto": False,
+    "app.normandy.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "browser.startup.page": 0,
+    "browser.aboutwelcome.enabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "extensions.update.enabled": False,
+    "network.captive-portal-service.enabled": False,
+    "network.connectivity-service.enabled": False,
+}
+
+
+def is_fast_profile_enabled(fast_profile=None):
+    """Return fast_profile or FAST_PROFILE envar if it is None"""
+    if fast_profile is not None:
+        return bool(fast_profile)
+    return os.environ.get(FAST_PROFILE_ENVAR, "0").lower() not in ("", "0", "false")
+
+
+def _build_chrome_template(profile_path):
+    for file_name, content in CHROME_PROFILE_FILES.items():
+        file_path = os.path.join(profile_path, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as file:
+            json.dump(content, file)
+    # Chrome skips first run setup when the sentinel file exists
+    open(os.path.join(profile_path, "First Run"), "w").close()
+
+
+def _build_firefox_template(profile_path):
+    with open(os.path.join(profile_path, "user.js"), "w") as file:
+        for name, value in FIREFOX_PROFILE_PREFERENCES.items():
+            file.write(f"user_pref({json.dumps(name)}, {json.dumps(value)});\n")
+
+
+# { <WebBrowsers value>: <profile template dir> }
+_profile_templates = {}
+
+
+def get_profile_template(browser: WebBrowsers):
+    """Return profile template dir of browser, built on the first call in this process"""
+    template_path = _profile_templates.get(browser.value)
+    if template_path is None:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        template_path = tempfile.mkdtemp(prefix=f"saucedemo-{browser.value}-profile-{worker}-")
+        if browser == WebBrowsers.FIREFOX:
+            _build_firefox_template(template_path)
+        else:
+            _build_chrome_template(template_path)
+        atexit.register(shutil.rmtree, template_path, ignore_errors=True)
+        _profile_templates[browser.value] = template_path
+    return template_path
+
+
+def clone_profile(browser: WebBrowsers):
+    """Clone profile template of browser for a browser session
+
+    Returns:
+        dir of the clone. It is owned by the caller, who removes it when the browser is closed
+    """
+    template_path = get_profile_template(browser)
+    clone_path = tempfile.mkdtemp(prefix=f"{os.path.basename(template_path)}-session-")
+    try:
+        # Copy-on-write clone on file systems with reflinks e.g btrfs and xfs, a regular copy elsewhere
+        subprocess.run(
+            ["cp", "-a", "--reflink=auto", f"{template_path}/.", clone_path],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        shutil.copytree(template_path, clone_path, dirs_exist_ok=True)
+    return clone_path
@@ -0,0 +1,136 @@
+""" Element Cache
+
+WebElements found by SaucedemoUtils, kept per browser session by locator and document, so repeated interactions with
+an element of a page that did not change skip finding it again.
+
+Cached elements belong to the current document, a counter increased whenever the page may have changed:
+
+* navigation and clicks of the event-firing driver, through SeleniumEventListener hooks
+* WebDriver commands sent with the driver directly that can navigate or re-render the page i.e get, back, forward,
+  refresh, clicks, pointer actions, keys with Enter and scripts other than the read-only helpers of Selenium
+* StaleElementReferenceException raised while a cached element is used
+
+Pages can also re-render by themselves e.g on timers, so a cached element is always checked in the browser before it
+is served, which raises StaleElementReferenceException for elements of a replaced DOM. Only visibility and
+clickability are served from the cache, their check on a cached element takes one browser round trip instead of a
+find and a check. Presence is not cached: checking that an element is attached takes a round trip like finding it
+again, so it would save nothing. Other conditions always find their elements too.
+"""
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support import expected_conditions as EC
+
+# Commands that may change the page
+INVALIDATING_COMMANDS = (
+    Command.GET,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+    Command.CLICK_ELEMENT,
+    Command.W3C_ACTIONS,
+    Command.SWITCH_TO_FRAME,
+    Command.SWITCH_TO_WINDOW,
+    Command.CLOSE,
+)
+SCRIPT_COMMANDS = (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC)
+# Markers of scripts that only read the page e.g atoms of WebElement.get_attribute and is_displayed
+READ_ONLY_SCRIPT_MARKERS = (
+    "/* getAttribute */",
+    "/* isDisplayed */",
+    "/* locatorCost */",
+    "/* verifyMany */",
+    "/* productsOrder */",
+)
+SUBMITTING_KEYS = (Keys.ENTER, Keys.RETURN)
+
+
+# Expected conditions of locators and the conditions checking the same on a cached element
+ELEMENT_CONDITIONS = {
+    EC.visibility_of_element_located: EC.visibility_of,
+    EC.element_to_be_clickable: EC.element_to_be_clickable,
+}
+
+
+def _is_invalidating(driver_command, params):
+    if driver_command in INVALIDATING_COMMANDS:
+        return True
+    if driver_command in SCRIPT_COMMANDS:
+        script = (params or {}).get("script", "").lstrip()
+        return not script.startswith(READ_ONLY_SCRIPT_MARKERS)
+    if driver_command == Command.SEND_KEYS_TO_ELEMENT:
+        text = (params or {}).get("text", "")
+        return any(key in text for key in SUBMITTING_KEYS)
+    return False
+
+
+class ElementCache:
+    """Elements of a browser session by locator in the current document"""
+
+    def __init__(self):
+        self._document = 0
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def document(self):
+        """Counter of the current document, increased when the cache is invalidated"""
+        return self._document
+
+    def invalidate(self):
+        self._document += 1
+        self._elements.clear()
+
+    def get(self, locator):
+        """Return cached element of locator in the current document or None"""
+        return self._elements.get(tuple(locator))
+
+    def put(self, locator, element):
+        self._elements[tuple(locator)] = element
+
+    def observe(self, driver):
+        """Invalidate the cache when commands that may change the page are sent with driver
+
+        The event-firing driver only sees commands sent through it, the library and tests mostly use the driver
+        directly.
+        """
+        execute = driver.execute
+
+        def observed_execute(driver_command, params=None):
+            if _is_invalidating(driver_command, params):
+                self.invalidate()
+            return execute(driver_command, params)
+
+        driver.execute = observed_execute
+
+    def find(self, driver, condition, locator):
+        """Check condition on the cached element of locator
+
+        Returns:
+            (True, value of the condition) if the condition can be checked on a cached element. (False, None) if the
+            element is not cached, the condition is not supported or the element is stale, the condition must then be
+            waited for with the locator
+        """
+        if condition not in ELEMENT_CONDITIONS:
+            return False, None
+        element = self.get(locator)
+        if element is None:
+            self.misses += 1
+            return False, None
+        try:
+            value = ELEMENT_CONDITIONS[condition](element)(driver)
+        except StaleElementReferenceException:
+            self.invalidate()
+            self.misses += 1
+            return False, None
+        if not value:
+            # e.g not clickable yet. Waiting with the locator finds the element again
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def store(self, condition, locator, value):
+        """Cache element returned by a condition of locator"""
+        if condition in ELEMENT_CONDITIONS and value:
+            self.put(locator, value)
@@ -5,6 +5,7 @@ from typing import Tuple
 from selenium.common.exceptions import (
     NoSuchElementException,
     ElementClickInterceptedException,
+    StaleElementReferenceException,
 )
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -16,38 +17,60 @@ from saucedemo_selenium_lib.config import SaucedemoTimeOuts
 class BaseInputElement:
     """Made purpose is to update and get html field values"""
 
-    def __init__(self, driver, locator):
+    def __init__(self, driver, locator, wait_timeouts=None):
         self._driver = driver
         self._locator = locator
         self._parent = None
         self._child = None
         self._element = None
+        self._wait_timeouts = wait_timeouts
+
+    def _wait(self, condition, locator):
+        """Wait until condition of the locator is met. Waits are timed by WaitTimeouts of SaucedemoUtils if it is
+        given, otherwise the fixed timeout is used"""
+        timeout = SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
+        if self._wait_timeouts is not None:
+            return self._wait_timeouts.wait(self._driver, condition, locator, timeout)
+        return WebDriverWait(self._driver, timeout).until(condition(locator))
+
+    def _with_element(self, action):
+        """Call action with the element. If a cached element went stale, the element is found again once"""
+        try:
+            return action(self.find_element())
+        except StaleElementReferenceException:
+            element_cache = self._wait_timeouts.element_cache if self._wait_timeouts is not None else None
+            if element_cache is None:
+                raise
+            element_cache.invalidate()
+            return action(self.find_element())
 
     def set_value(self, value, press_enter=False):
-        element = self.find_element()
-        element.clear()
-        element.send_keys(value)
-        if press_enter:
+        def set_element_value(element):
+            element.clear()
             element.send_keys(value)
+            if press_enter:
+                element.send_keys(value)
+
+        self._with_element(set_element_value)
 
     def update_value(self, value, press_enter=False):
         """
         This is for updating fields that produce error when selenium element.clear() is called. It first select the value and replace it with new one.
         """
-        element = self.find_element()
-        element.send_keys(f"{Keys.CONTROL}a")
-        element.send_keys(value)
 
+        def update_element_value(element):
+            element.send_keys(f"{Keys.CONTROL}a")
+            element.send_keys(value)
+
+        self._with_element(update_element_value)
         if press_enter:
-            element.send_keys(Keys.ENTER)
+            self._with_element(lambda element: element.send_keys(Keys.ENTER))
 
     def set_file_value(self, path):
-        element = self.find_element()
-        element.send_keys(path)
+        self._with_element(lambda element: element.send_keys(path))
 
     def get_value(self):
-        element = self.find_element()
-        return element.get_attribute("value")
+        return self._with_element(lambda element: element.get_attribute("value"))
 
     def click_once_not_obscured_by_loading_screen(self, element):
         try:
@@ -70,9 +93,7 @@ class InputElementByClass(BaseInputElement):
     def find_element(self):
         try:
 
-            element = WebDriverWait(
-                self._driver, SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
-            ).until(EC.presence_of_element_located((By.CLASS_NAME, self._locator)))
+            element = self._wait(EC.presence_of_element_located, (By.CLASS_NAME, self._locator))
             return element
 
         except NoSuchElementException as e:
@@ -82,9 +103,7 @@ class InputElementByClass(BaseInputElement):
 class InputElementById(BaseInputElement):
     def find_element(self):
         try:
-            element = WebDriverWait(
-                self._driver, SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
-            ).until(EC.element_to_be_clickable((By.ID, self._locator)))
+            element = self._wait(EC.element_to_be_clickable, (By.ID, self._locator))
             return element
 
         except NoSuchElementException as e:
@@ -94,9 +113,7 @@ class InputElementById(BaseInputElement):
 class InputElementByName(BaseInputElement):
     def find_element(self):
         try:
-            element = WebDriverWait(
-                self._driver, SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
-            ).until(EC.presence_of_element_located((By.NAME, self._locator)))
+            element = self._wait(EC.presence_of_element_located, (By.NAME, self._locator))
             return element
 
         except NoSuchElementException as e:
@@ -106,9 +123,7 @@ class InputElementByName(BaseInputElement):
 class InputElementByXPath(BaseInputElement):
     def find_element(self):
         try:
-            element = WebDriverWait(
-                self._driver, SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
-            ).until(EC.presence_of_element_located((By.XPATH, self._locator)))
+            element = self._wait(EC.presence_of_element_located, (By.XPATH, self._locator))
             return element
 
         except NoSuchElementException as e:
@@ -120,14 +135,12 @@ class InputElementByLocator(BaseInputElement):
     Pass in locator as tuple or list (locator, name_value)
     """
 
-    def __init__(self, driver, locator: Tuple):
-        super().__init__(driver, locator)
+    def __init__(self, driver, locator: Tuple, wait_timeouts=None):
+        super().__init__(driver, locator, wait_timeouts=wait_timeouts)
 
     def find_element(self):
         try:
-            element = WebDriverWait(
-                self._driver, SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT
-            ).until(EC.presence_of_element_located(self._locator))
+            element = self._wait(EC.presence_of_element_located, self._locator)
             return element
 
         except NoSuchElementException as e:
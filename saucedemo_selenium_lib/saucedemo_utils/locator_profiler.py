@@ -0,0 +1,170 @@
+""" Locator Profiler
+
+Measure how long the browser takes to evaluate the locators a run uses, on the live page they are used on.
+
+A locator is measured once per process, right after the first wait for it succeeds, with LOCATOR_COST_SCRIPT. Later
+uses are only counted. Costs are kept in JSON files in a stats dir, one file per process (xdist worker), written when
+the process exits. The most expensive locators of a run are those with the highest cost times uses.
+
+Profiling is enabled by setting PROFILE_LOCATORS envar to the stats dir, the runner does it with profile_locators.
+"""
+import atexit
+import json
+import os
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from saucedemo_selenium_lib.locators.registry import LOCATORS, get_browser_locator, get_locator_key
+from saucedemo_selenium_lib.saucedemo_utils.scripts import LOCATOR_COST_SCRIPT
+
+PROFILE_LOCATORS_ENVAR = "PROFILE_LOCATORS"
+LOCATOR_COSTS_DIR = "locator-costs"
+# Evaluations of a locator per measurement
+LOCATOR_COST_REPEAT = 50
+
+
+def _read_costs_file(file_path):
+    try:
+        with open(file_path) as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def load_locator_costs(stats_path):
+    """Return locator costs of all processes in stats dir
+
+    Returns:
+        dict of locator keys and dicts with name, page, ms(mean cost in ms), matches and uses
+    """
+    costs = {}
+    if not os.path.isdir(stats_path):
+        return costs
+    for file_name in sorted(os.listdir(stats_path)):
+        if not file_name.endswith(".json"):
+            continue
+        for key, cost in _read_costs_file(os.path.join(stats_path, file_name)).items():
+            total = costs.get(key)
+            if total is None:
+                costs[key] = dict(cost)
+                continue
+            measurements = total.get("measurements", 1) + cost.get("measurements", 1)
+            total["ms"] += (cost["ms"] - total["ms"]) * cost.get("measurements", 1) / measurements
+            total["measurements"] = measurements
+            total["uses"] += cost["uses"]
+    return costs
+
+
+def get_most_expensive_locators(costs, top=10):
+    """Return rows of the most expensive locators, by cost times uses
+
+    Args:
+        costs: Locator costs returned by load_locator_costs
+        top: Number of locators
+
+    Returns:
+        list of dicts with locator, name, page, cost_ms, uses, total_ms and matches
+    """
+    rows = [
+        {
+            "locator": key,
+            "name": cost.get("name") or "-",
+            "page": cost.get("page") or "-",
+            "cost_ms": round(cost["ms"], 3),
+            "uses": cost["uses"],
+            "total_ms": round(cost["ms"] * cost["uses"], 2),
+            "matches": cost.get("matches"),
+        }
+        for key, cost in costs.items()
+    ]
+    rows.sort(key=lambda row: -row["total_ms"])
+    return rows[:top]
+
+
+class LocatorProfiler:
+    """Locator costs of a stats dir measured by this process
+
+    Args:
+        stats_path: Dir of locator costs files
+        repeat: Evaluations of a locator per measurement
+    """
+
+    def __init__(self, stats_path, repeat=LOCATOR_COST_REPEAT):
+        self._stats_path = stats_path
+        self._repeat = repeat
+        self._costs = {}
+        self._save_registered = False
+
+    @property
+    def stats_path(self):
+        return self._stats_path
+
+    @property
+    def costs(self):
+        return self._costs
+
+    @property
+    def file_path(self):
+        """File costs of this process are saved to"""
+        return os.path.join(self._stats_path, f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.json")
+
+    def measure(self, driver, locator):
+        """Count a use of locator and measure its cost on the current page if it was not measured yet
+
+        Measuring failures e.g scripts not supported by the driver are ignored, profiling never fails a test.
+        """
+        key = get_locator_key(locator)
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = self._costs[key] = self._measure(driver, locator)
+            if not self._save_registered:
+                atexit.register(self.save)
+                self._save_registered = True
+        if cost is not None:
+            cost["uses"] += 1
+
+    def _measure(self, driver, locator):
+        profiled_locator = get_browser_locator(locator)
+        if profiled_locator is None:
+            return None
+        try:
+            result = driver.execute_script(LOCATOR_COST_SCRIPT, *profiled_locator, self._repeat)
+            page = urlsplit(driver.current_url).path or "/"
+        except WebDriverException:
+            return None
+        return {
+            "name": LOCATORS.get_name(locator),
+            "page": page,
+            "ms": float(result["ms"]),
+            "matches": result["matches"],
+            "measurements": 1,
+            "uses": 0,
+        }
+
+    def save(self):
+        """Write costs measured by this process to its file"""
+        costs = {key: cost for key, cost in self._costs.items() if cost is not None}
+        if not costs:
+            return
+        os.makedirs(self._stats_path, exist_ok=True)
+        temporary_file = f"{self.file_path}.tmp"
+        with open(temporary_file, "w") as file:
+            json.dump(costs, file)
+        os.replace(temporary_file, self.file_path)
+
+
+# { <stats dir>: LocatorProfiler }
+_locator_profilers = {}
+
+
+def get_locator_profiler():
+    """Return LocatorProfiler of the stats dir in PROFILE_LOCATORS envar. None if profiling is disabled"""
+    stats_path = os.environ.get(PROFILE_LOCATORS_ENVAR)
+    if not stats_path:
+        return None
+    stats_path = os.path.abspath(stats_path)
+    profiler = _locator_profilers.get(stats_path)
+    if profiler is None:
+        profiler = _locator_profilers[stats_path] = LocatorProfiler(stats_path)
+    return profiler
@@ -0,0 +1,73 @@
+""" Resource Blocking
+
+Block resources functional tests do not need e.g product images, fonts and analytics, so sessions load pages faster
+and download less from the target host.
+
+Resources are given as resource types of RESOURCE_TYPES and URL patterns with '*' wildcards e.g
+'images,fonts,*.example.com/*'. Chrome blocks URLs matching the patterns with DevTools Network.setBlockedURLs. Firefox
+has no URL blocking, resource types are blocked with preferences and URL patterns are ignored. Remote(grid) Chrome
+drivers have no DevTools commands, images are blocked with a preference instead.
+
+Blocking is enabled with block_resources argument of SaucedemoUtils or BLOCK_RESOURCES envar.
+"""
+import os
+
+BLOCK_RESOURCES_ENVAR = "BLOCK_RESOURCES"
+
+# Resource types and URL patterns of their resources
+RESOURCE_TYPES = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "analytics": [
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*backtrace.io*",
+        "*sentry.io*",
+    ],
+}
+# Firefox preferences blocking resource types
+FIREFOX_PREFERENCES = {
+    "images": {"permissions.default.image": 2},
+    "fonts": {"browser.display.use_document_fonts": 0},
+    "analytics": {"privacy.trackingprotection.enabled": True},
+}
+# Chrome preferences blocking resource types, used when DevTools commands are not available
+CHROME_PREFERENCES = {
+    "images": {"profile.managed_default_content_settings.images": 2},
+}
+
+
+def get_blocked_resources(block_resources=None):
+    """Return list of blocked resource types and URL patterns
+
+    Args:
+        block_resources: list or comma separated string of resource types and URL patterns. Default is set by
+                         BLOCK_RESOURCES envar
+    """
+    if block_resources is None:
+        block_resources = os.environ.get(BLOCK_RESOURCES_ENVAR, "")
+    if isinstance(block_resources, str):
+        block_resources = block_resources.split(",")
+    return [resource.strip() for resource in block_resources if resource.strip()]
+
+
+def get_blocked_url_patterns(blocked_resources):
+    """Return URL patterns of blocked resource types and URL patterns"""
+    patterns = []
+    for resource in blocked_resources:
+        patterns.extend(RESOURCE_TYPES.get(resource, [resource]))
+    return patterns
+
+
+def get_blocking_preferences(blocked_resources, browser_preferences):
+    """Return browser preferences blocking the resource types e.g of FIREFOX_PREFERENCES"""
+    preferences = {}
+    for resource in blocked_resources:
+        preferences.update(browser_preferences.get(resource, {}))
+    return preferences
+
+
+def is_blocking_images(blocked_resources):
+    return "images" in blocked_resources or any(
+        pattern in RESOURCE_TYPES["images"] for pattern in blocked_resources
+    )
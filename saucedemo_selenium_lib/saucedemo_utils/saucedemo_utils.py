@@ -1,5 +1,7 @@
 import time, os
+import shutil
 import logging
+from urllib.parse import urlencode, urljoin, urlsplit
 
 from datetime import datetime
 from string import Template
@@ -11,23 +13,46 @@ from selenium.webdriver.support.events import EventFiringWebDriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.common.proxy import Proxy, ProxyType
-from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
     NoSuchElementException,
     TimeoutException,
     JavascriptException,
+    StaleElementReferenceException,
+)
+from saucedemo_selenium_lib.config import SaucedemoTimeOuts, TestConfig, get_page_load_strategy
+from saucedemo_selenium_lib.data_models import (
+    WebBrowsers,
+    PageLoadStrategies,
+    VerificationMismatch,
+    SortVerification,
+    SORT_ORDERS,
+    SAUCEDEMO_PRODUCTS_BY_NAME,
 )
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from saucedemo_selenium_lib.config import SaucedemoTimeOuts, TestConfig
-from saucedemo_selenium_lib.data_models import WebBrowsers
-from saucedemo_selenium_lib.event_listeners import SeleniumEventListener
 from saucedemo_selenium_lib.saucedemo_utils.input_elements import InputElementByLocator
+from saucedemo_selenium_lib.saucedemo_utils.wait_timeouts import WaitTimeouts, WAIT_LATENCIES_DIR
+from saucedemo_selenium_lib.saucedemo_utils.locator_profiler import get_locator_profiler
+from saucedemo_selenium_lib.saucedemo_utils.element_cache import ElementCache
+from saucedemo_selenium_lib.saucedemo_utils.resource_blocking import (
+    CHROME_PREFERENCES,
+    FIREFOX_PREFERENCES,
+    get_blocked_resources,
+    get_blocked_url_patterns,
+    get_blocking_preferences,
+    is_blocking_images,
+)
+from saucedemo_selenium_lib.saucedemo_utils.browser_profiles import (
+    CHROME_FAST_ARGUMENTS,
+    clone_profile,
+    is_fast_profile_enabled,
+)
 from saucedemo_selenium_lib.locators.common import CommonLocators
+from saucedemo_selenium_lib.locators.pages import SaucedemoPages
+from saucedemo_selenium_lib.locators.registry import get_browser_locator
+from saucedemo_selenium_lib.saucedemo_utils.scripts import VERIFY_MANY_SCRIPT, PRODUCTS_ORDER_SCRIPT
 from saucedemo_selenium_lib.exceptions import (
     SaucedemoTestError,
     ElementWaitTimeoutException,
@@ -66,6 +91,10 @@ class SaucedemoUtils:
         webdriver_cache_valid_range=30,
         browser: WebBrowsers = WebBrowsers.CHROME,
         grid=None,
+        adaptive_timeouts=None,
+        page_load_strategy=None,
+        block_resources=None,
+        fast_profile=None,
     ):
         """initialises SaucedemoUtils
 
@@ -83,6 +112,17 @@ class SaucedemoUtils:
                              Monitoring is not completely implemented.
             browser: Enum value  of WebBrowsers. Specify which browser tests will be run in. Defaulted to WebBrowsers.
             grid: url of the grid to run the test, if it isn't defined the test will run locally .Default None
+            adaptive_timeouts: Derive timeouts of waits for elements from wait latencies recorded in
+                               <output_path>/wait-latencies. Fixed timeouts are upper bounds. Default is set by
+                               ADAPTIVE_TIMEOUTS envar
+            page_load_strategy: PageLoadStrategies value, when navigation returns. With 'eager' and 'none' pages are
+                                used as soon as their readiness condition is met, before all assets are loaded.
+                                Default is set by PAGE_LOAD_STRATEGY envar or 'normal'
+            block_resources: Resource types i.e 'images', 'fonts' and 'analytics' and URL patterns e.g '*.png' the
+                             browser does not load, as a list or comma separated string. Default is set by
+                             BLOCK_RESOURCES envar
+            fast_profile: Start the browser from a clone of a minimal, pre-initialized profile and disable its
+                          startup-heavy background services. Default is set by FAST_PROFILE envar
 
         TODO:
             * JS code coverage implementation is not complete
@@ -107,7 +147,19 @@ class SaucedemoUtils:
         self._logger = self._initialise_logger()
         self._jscover_name = jscover_folder_name
         self._grid = grid
+        self._page_load_strategy = get_page_load_strategy(page_load_strategy)
+        self._blocked_resources = get_blocked_resources(block_resources)
+        self._fast_profile = is_fast_profile_enabled(fast_profile)
+        self._profile_path = None  # clone of the fast profile template used by the current browser session
         self._common_locators = CommonLocators()
+        self._element_cache = ElementCache()
+        self._wait_timeouts = WaitTimeouts(
+            host_url,
+            os.path.join(output_path, WAIT_LATENCIES_DIR),
+            adaptive=adaptive_timeouts,
+            profiler=get_locator_profiler(),
+            element_cache=self._element_cache,
+        )
         self.logger.info(f"Running tests on Saucedemo webapp:- {self.host_url}")
 
     def __del__(self):
@@ -147,6 +199,28 @@ class SaucedemoUtils:
         """Return Instance of CommonLocators"""
         return self._common_locators
 
+    @property
+    def wait_timeouts(self):
+        """WaitTimeouts used for waiting for elements"""
+        return self._wait_timeouts
+
+    @property
+    def page_load_strategy(self):
+        return self._page_load_strategy
+
+    @property
+    def blocked_resources(self):
+        return self._blocked_resources
+
+    @property
+    def fast_profile(self):
+        return self._fast_profile
+
+    @property
+    def element_cache(self):
+        """Elements found in the current page of the browser session"""
+        return self._element_cache
+
     @property
     def logger(self):
         """Return instance of Logger"""
@@ -222,15 +296,18 @@ class SaucedemoUtils:
         user_menu_button.click()
 
         action.move_to_element(
-            WebDriverWait(self.driver, 2).until(
-                EC.presence_of_element_located(CommonLocators.LOGOUT_BUTTON)
+            self._wait_timeouts.wait(
+                self.driver, EC.presence_of_element_located, CommonLocators.LOGOUT_BUTTON, 2
             )
         ).click()
         action.perform()
         # Assert logout worked
-        login_screen = WebDriverWait(
-            self.driver, SaucedemoTimeOuts.SHORT_LOADING_TIMEOUT
-        ).until(EC.element_to_be_clickable((CommonLocators.USER_LOGIN_BTN)))
+        login_screen = self._wait_timeouts.wait(
+            self.driver,
+            EC.element_to_be_clickable,
+            CommonLocators.USER_LOGIN_BTN,
+            SaucedemoTimeOuts.SHORT_LOADING_TIMEOUT,
+        )
         assert login_screen is not None
 
     def close_browser(self):
@@ -241,6 +318,13 @@ class SaucedemoUtils:
 
         if not self.is_web_driver_quited:
             self._event_firing_driver.quit()
+        self._remove_profile()
+
+    def _remove_profile(self):
+        """Remove fast profile clone of the closed browser session"""
+        if self._profile_path is not None:
+            shutil.rmtree(self._profile_path, ignore_errors=True)
+            self._profile_path = None
 
     def _save_js_cover_report(self):
         """Save JSCover report from local storage into files"""
@@ -285,20 +369,39 @@ class SaucedemoUtils:
 
     def _setup_web_driver(self):
         """
-        Sets up the web driver for either firefox or chrome.
+        Sets up the web driver for either firefox, chrome or the simulated browser.
         """
         self._driver = None
-        if self._browser == WebBrowsers.FIREFOX:
+        # Profile of a previous session of this instance is not reused
+        self._remove_profile()
+        if self._browser == WebBrowsers.SIMULATED:
+            self._driver = self._create_simulated_driver()
+        elif self._browser == WebBrowsers.FIREFOX:
             self._driver = self._create_firefox_driver()
         else:
             self._driver = self._create_chrome_driver()
 
+        # Elements of a previous session are never reused
+        self._element_cache.invalidate()
+        self._element_cache.observe(self._driver)
+        self._block_resources_with_devtools()
         self.driver.maximize_window()
 
+        from saucedemo_selenium_lib.event_listeners import SeleniumEventListener
+
         self._event_firing_driver = EventFiringWebDriver(
             self._driver, SeleniumEventListener(self)
         )
 
+    def _block_resources_with_devtools(self):
+        """Block URLs of blocked resources with Chrome DevTools. Only local Chrome drivers have DevTools commands"""
+        if not self._blocked_resources or not hasattr(self._driver, "execute_cdp_cmd"):
+            return
+        patterns = get_blocked_url_patterns(self._blocked_resources)
+        self.logger.info(f"Blocking resources: {patterns}")
+        self._driver.execute_cdp_cmd("Network.enable", {})
+        self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
     def setup_chrome_driver_mode(self, headless=True):
         """Set the headless mode after SaucedemoUtils is instantiated
 
@@ -323,27 +426,39 @@ class SaucedemoUtils:
             desired_capabilities=desired_capabilities
         )
 
+    def _install_chrome_driver(self):
+        """Download chrome driver if it is not cached and return its path. webdriver_manager is only imported when
+        a local driver is created, runs on a grid do not need it"""
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        return ChromeDriverManager(cache_valid_range=self._webdriver_cache_valid_range).install()
+
+    def _install_firefox_driver(self):
+        """Download gecko driver if it is not cached and return its path"""
+        from webdriver_manager.firefox import GeckoDriverManager
+
+        return GeckoDriverManager(cache_valid_range=self._webdriver_cache_valid_range).install()
+
     def _create_chrome_driver(self):
         """Setup chrome driver. Call automatically right when website is being opened"""
         self.logger.info("Setting up Chrome Driver")
         chrome_options = self._get_web_driver_options()
         prefs = {"download.default_directory": self._download_path}
+        if self._grid is not None:
+            # Remote drivers can not block URLs with DevTools
+            prefs.update(get_blocking_preferences(self._blocked_resources, CHROME_PREFERENCES))
         chrome_options.add_experimental_option("prefs", prefs)
         if self._proxy_server:
             proxy = self._get_chrome_proxy()
             return webdriver.Chrome(
-                executable_path=ChromeDriverManager(
-                    cache_valid_range=self._webdriver_cache_valid_range
-                ).install(),
+                executable_path=self._install_chrome_driver(),
                 options=chrome_options,
                 desired_capabilities=proxy,
             )
         else:
             if self._grid is None:
                 return webdriver.Chrome(
-                    executable_path=ChromeDriverManager(
-                        cache_valid_range=self._webdriver_cache_valid_range
-                    ).install(),
+                    executable_path=self._install_chrome_driver(),
                     options=chrome_options,
                 )
             else:
@@ -380,8 +495,30 @@ class SaucedemoUtils:
         options.add_argument("--enable-logging")
         options.add_argument("--log-level=0")
         options.add_argument("--ignore-certificate-errors")
+        options.page_load_strategy = self._page_load_strategy
+        if self._browser == WebBrowsers.FIREFOX:
+            for name, value in get_blocking_preferences(self._blocked_resources, FIREFOX_PREFERENCES).items():
+                options.set_preference(name, value)
+        if self._fast_profile:
+            self._add_fast_profile_options(options)
         return options
 
+    def _add_fast_profile_options(self, options):
+        """Start the browser from a clone of the fast profile template. Remote(grid) browsers can not use local
+        profiles, Chrome only gets arguments disabling background services"""
+        if self._browser != WebBrowsers.FIREFOX:
+            for argument in CHROME_FAST_ARGUMENTS:
+                options.add_argument(argument)
+        if self._grid is not None:
+            return
+        self._profile_path = clone_profile(self._browser)
+        self.logger.info(f"Using fast browser profile: {self._profile_path}")
+        if self._browser == WebBrowsers.FIREFOX:
+            options.add_argument("-profile")
+            options.add_argument(self._profile_path)
+        else:
+            options.add_argument(f"--user-data-dir={self._profile_path}")
+
     def _create_firefox_driver(self):
         """Create Firefox selenium webdriver"""
         self.logger.info("Setting up Firefox Driver")
@@ -397,20 +534,28 @@ class SaucedemoUtils:
         )
         if self._grid is None:
             return webdriver.Firefox(
-                executable_path=GeckoDriverManager(
-                    cache_valid_range=self._webdriver_cache_valid_range
-                ).install(),
+                executable_path=self._install_firefox_driver(),
                 options=options,
             )
         else:
             return self._get_remote_webdriver(options=options)
 
+    def _create_simulated_driver(self):
+        """Create in-memory simulated webdriver. It loads pages over HTTP without a browser, so it runs page objects
+        against the stand-in Saucedemo server much faster. Proxy, grid and headless settings do not apply to it"""
+        self.logger.info("Setting up Simulated Driver")
+        from saucedemo_selenium_lib.saucedemo_utils.simulated_driver import SimulatedWebDriver
+
+        return SimulatedWebDriver()
+
     def is_element_available(self, locator, timeout=3, print_logs=True):
         """Check is an object of a given locator is available on the page"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            if self._browser == WebBrowsers.SIMULATED:
+                # Pages of the simulated driver are complete when a command returns, elements do not appear later
+                self._element_cache.put(locator, self.driver.find_element(*locator))
+            else:
+                self._wait_timeouts.wait(self.driver, EC.presence_of_element_located, locator, timeout)
             if print_logs:
                 self.logger.info(f"Element Found: {locator}")
             return True
@@ -456,10 +601,82 @@ class SaucedemoUtils:
         self._setup_web_driver()
         print(self._browser)
         self.driver.get(self.host_url)
-        WebDriverWait(self.driver, SaucedemoTimeOuts.LONG_LOADING_TIMEOUT).until(
-            EC.element_to_be_clickable((By.ID, "user-name"))
-        )
-        self.wait_until_element_is_available(self.common_locators.USER_LOGIN_USERNAME)
+        self.wait_until_page_is_ready(SaucedemoPages.LOGIN)
+
+    def wait_until_page_is_ready(self, page, timeout=SaucedemoTimeOuts.LONG_LOADING_TIMEOUT):
+        """Wait once until readiness condition of a page is met after navigating to it
+
+        With 'none' page load strategy navigation returns before the new document is loaded, so the url must be of
+        the page too.
+
+        Args:
+            page: SaucedemoPage
+            timeout: Timeout to wait for the page
+
+        Returns:
+            element of the ready locator of the page
+
+        Raises:
+            TimeoutException if the page is not ready until the timeout
+        """
+        check_url = self._page_load_strategy == PageLoadStrategies.NONE
+
+        def page_is_ready(locator):
+            ready_condition = page.ready_condition(locator)
+
+            def _predicate(driver):
+                if check_url and not urlsplit(driver.current_url).path.endswith(f"/{page.path}"):
+                    return False
+                return ready_condition(driver)
+
+            return _predicate
+
+        return self._wait_timeouts.wait(self.driver, page_is_ready, page.ready_locator, timeout)
+
+    def open_page(self, page, timeout=SaucedemoTimeOuts.LONG_LOADING_TIMEOUT, **query):
+        """Open a Saucedemo page with its url instead of clicking through the pages before it
+
+        The browser session is kept, so a logged user stays logged and the cart is kept. Only the readiness condition
+        of the page is waited for.
+
+        Example:
+
+            saucedemo_utils.open_page(SaucedemoPages.CHECKOUT_INFORMATION)
+
+        Args:
+            page: SaucedemoPage e.g SaucedemoPages.CART
+            timeout: Timeout to wait until the page is ready
+            query: Query parameters of the url e.g id=4
+
+        Returns:
+            element of the ready locator
+
+        Raises:
+            TimeoutException if the page is not ready until the timeout e.g Saucedemo showed login page because the
+            user is not logged
+        """
+        url = urljoin(f"{self.host_url.rstrip('/')}/", page.path)
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        self.logger.info(f"Opening page: {url}")
+        self.driver.get(url)
+        return self.wait_until_page_is_ready(page, timeout=timeout)
+
+    def open_product_page(self, product):
+        """Open page of a product with its url
+
+        Args:
+            product: Product name or Saucedemo id of the product
+
+        Raises:
+            SaucedemoTestError if there is no product with the name
+        """
+        if isinstance(product, str):
+            saucedemo_product = SAUCEDEMO_PRODUCTS_BY_NAME.get(product)
+            if saucedemo_product is None:
+                raise SaucedemoTestError(f"Unknown product: {product}")
+            product = saucedemo_product.id
+        return self.open_page(SaucedemoPages.INVENTORY_ITEM, id=product)
 
     def is_product_found(self, product_name: str):
         """Check if product in the products list is of the  given product name
@@ -471,11 +688,7 @@ class SaucedemoUtils:
             boolean
 
         """
-        product_name_locator = (
-            By.XPATH,
-            f"//div[contains(@class, 'inventory_item_name') "
-            f"and contains(., '{product_name}')]"
-        )
+        product_name_locator = self.common_locators.PRODUCT_NAME_BY_TEXT.format(product_name=product_name)
         self.logger.info(f"Checking product availability: {product_name}")
         return self.is_element_available(product_name_locator)
 
@@ -485,11 +698,7 @@ class SaucedemoUtils:
             track_warning_errors=True,
     ):
         """Click on product name in products list page"""
-        product_name_locator = (
-            By.XPATH,
-            f"//div[contains(@class, 'inventory_item_name') "
-            f"and contains(., '{product_name}')]"
-        )
+        product_name_locator = self.common_locators.PRODUCT_NAME_BY_TEXT.format(product_name=product_name)
         self.click_at_element(
             element_locator=product_name_locator,
             track_warning_errors=track_warning_errors,
@@ -501,11 +710,15 @@ class SaucedemoUtils:
             track_warning_errors=True,
     ):
         """Click on product image in products list page"""
-        product_image_locator = (
-            By.XPATH,
-            f"//img[contains(@class, 'inventory_item_img') "
-            f"and contains(@alt, '{product_name}')]"
-        )
+        product_image_locator = self.common_locators.PRODUCT_IMAGE_BY_NAME.format(product_name=product_name)
+        if is_blocking_images(self._blocked_resources):
+            # Blocked images may not be rendered and clickable. The image is found by its alt text and clicked with
+            # a script
+            image = self.get_element(product_image_locator)
+            self.driver.execute_script("arguments[0].click();", image)
+            if track_warning_errors:
+                self._take_screenshot_on_warning_errors()
+            return
         self.click_at_element(
             element_locator=product_image_locator,
             track_warning_errors=track_warning_errors,
@@ -530,7 +743,13 @@ class SaucedemoUtils:
 
         self.wait_until_element_is_available(element_locator)
         btn = self.wait_for_element(element_locator)
-        btn.location_once_scrolled_into_view
+        try:
+            btn.location_once_scrolled_into_view
+        except StaleElementReferenceException:
+            # Cached element was replaced by the page
+            self._element_cache.invalidate()
+            btn = self.wait_for_element(element_locator)
+            btn.location_once_scrolled_into_view
         try:
             btn.click()
         except ElementClickInterceptedException:
@@ -558,13 +777,9 @@ class SaucedemoUtils:
         """
         try:
             if wait_for_clickable:
-                return WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable(by_tuple)
-                )
+                return self._wait_timeouts.wait(self.driver, EC.element_to_be_clickable, by_tuple, timeout)
             else:
-                return WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located(by_tuple)
-                )
+                return self._wait_timeouts.wait(self.driver, EC.presence_of_element_located, by_tuple, timeout)
         except NoSuchElementException:
             msg = f"Timed out waiting for element {by_tuple[1]}"
             raise ElementWaitTimeoutException(msg)
@@ -618,9 +833,7 @@ class SaucedemoUtils:
         """
         self.logger.info(f"Getting element with locator :{locator}")
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            element = self._wait_timeouts.wait(self.driver, EC.presence_of_element_located, locator, timeout)
             return element
         except TimeoutException as e:
             raise
@@ -640,9 +853,7 @@ class SaucedemoUtils:
 
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located(locator)
-            )
+            element = self._wait_timeouts.wait(self.driver, EC.presence_of_all_elements_located, locator, timeout)
             return element
 
         except TimeoutException as e:
@@ -722,7 +933,7 @@ class SaucedemoUtils:
         Returns: None
 
         """
-        element = InputElementByLocator(self.driver, locator)
+        element = InputElementByLocator(self.driver, locator, wait_timeouts=self._wait_timeouts)
         element.update_value(value, press_enter)
         if click_after:
             self.click_somewhere_on_page()  # trigger  a request to save the value
@@ -740,7 +951,11 @@ class SaucedemoUtils:
 
         """
         element = self.get_element(locator)
-        element.click()
+        try:
+            element.click()
+        except StaleElementReferenceException:
+            self._element_cache.invalidate()
+            self.get_element(locator).click()
 
     def verify_input_value(self, locator, value):
         """Verify given input value is correct
@@ -754,12 +969,69 @@ class SaucedemoUtils:
 
         """
 
-        element = InputElementByLocator(self.driver, locator)
+        element = InputElementByLocator(self.driver, locator, wait_timeouts=self._wait_timeouts)
         if element.get_value() == value:
             return True
         else:
             return False
 
+    def verify_many(self, expectations, timeout=SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT, poll=0.5):
+        """Verify texts or values of many elements at once
+
+        Texts or values of all elements are read with one script call. Value is compared for input, textarea and
+        select elements and rendered text for other elements. Locators without elements are read again every poll
+        seconds until they are found or the timeout is reached, elements that were found are not read again.
+
+        Example:
+
+            mismatches = saucedemo_utils.verify_many(
+                [((By.ID, "first-name"), "Ann"), (CommonLocators.ERROR_DIALOG, "Error: Last Name is required")]
+            )
+            assert not mismatches, mismatches
+
+        Args:
+            expectations: list of (Selenium locator, expected text or value). Expected values are compared as strings
+            timeout: Timeout to wait for locators without elements. Adaptive timeouts of the locators are used if they
+                     are enabled
+            poll: Seconds between reads of locators without elements
+
+        Returns:
+            list of VerificationMismatch of every expectation that is not met, empty if all are met
+
+        Raises:
+            SaucedemoTestError if a locator can not be evaluated by the script e.g link text locators
+        """
+        browser_locators = []
+        for locator, _ in expectations:
+            browser_locator = get_browser_locator(locator)
+            if browser_locator is None:
+                raise SaucedemoTestError(f"Locator {locator} can not be verified with verify_many")
+            browser_locators.append(list(browser_locator))
+        timeout = max(
+            (self._wait_timeouts.get_timeout(locator, timeout) for locator, _ in expectations), default=timeout
+        )
+        end_time = time.monotonic() + timeout
+        actuals = {}
+        pending = list(range(len(expectations)))
+        while pending:
+            values = self.driver.execute_script(VERIFY_MANY_SCRIPT, [browser_locators[index] for index in pending])
+            for index, value in zip(pending, values):
+                if value is not None:
+                    actuals[index] = value
+            pending = [index for index in pending if index not in actuals]
+            if not pending or time.monotonic() + poll > end_time:
+                break
+            time.sleep(poll)
+
+        mismatches = []
+        for index, (locator, expected) in enumerate(expectations):
+            actual = actuals.get(index)
+            if actual != str(expected):
+                mismatches.append(VerificationMismatch(tuple(locator), str(expected), actual))
+        for mismatch in mismatches:
+            self.logger.info(f"Verification failed: {mismatch}")
+        return mismatches
+
     def sort_product_list(self, sort_type: str):
         """
         Sorts the product list based on product type.
@@ -776,13 +1048,40 @@ class SaucedemoUtils:
             text=sort_type,
         )
 
+    def verify_product_list_order(self, sort_type: str, timeout=SaucedemoTimeOuts.PRODUCT_SHOULD_BE_PRESENT_TIMEOUT):
+        """Wait until products list is rendered for the sort type and check its order in the page
+
+        Order is checked by one script in the browser, names and prices are not read one by one.
+
+        Args:
+            sort_type: SortOptions value
+            timeout: Timeout to wait until the sort select has the sort type and products are rendered
+
+        Returns:
+            SortVerification with the first pair of product names or prices out of order if the list is not sorted
+
+        Raises:
+            SaucedemoTestError if sort type is not a SortOptions value
+            TimeoutException if products are not rendered for the sort type until the timeout
+        """
+        sort_order = SORT_ORDERS.get(sort_type)
+        if sort_order is None:
+            raise SaucedemoTestError(f"Unknown sort type: {sort_type}")
+        result = WebDriverWait(self.driver, timeout, ignored_exceptions=(JavascriptException,)).until(
+            lambda driver: driver.execute_script(PRODUCTS_ORDER_SCRIPT, *sort_order)
+        )
+        verification = SortVerification(result["sorted"], tuple(result["pair"]) if result["pair"] else None)
+        self.logger.info(f"Products order for {sort_type}: {verification}")
+        return verification
+
     def get_products(self):
         """Get list of products displayed in products list page"""
         try:
-            products = WebDriverWait(
-                self.driver, SaucedemoTimeOuts.SHORT_LOADING_TIMEOUT
-            ).until(
-                EC.presence_of_all_elements_located(CommonLocators.PRODUCT)
+            products = self._wait_timeouts.wait(
+                self.driver,
+                EC.presence_of_all_elements_located,
+                CommonLocators.PRODUCT,
+                SaucedemoTimeOuts.SHORT_LOADING_TIMEOUT,
             )
             return products
 
@@ -0,0 +1,62 @@
+""" Browser Scripts
+
+JavaScript run by SaucedemoUtils with execute_script. Each script starts with a /* name */ marker, so the simulated
+driver can recognize the scripts it emulates.
+"""
+
+# Mean time in ms the browser takes to evaluate a locator on the current page.
+# Arguments: 'css selector' or 'xpath', locator value, number of evaluations.
+# Timers of browsers are coarsened (to 0.1 ms or more), so the locator is evaluated many times and the mean is taken
+LOCATOR_COST_SCRIPT = """/* locatorCost */
+const [by, value, repeat] = arguments;
+const evaluate = by === "xpath"
+    ? () => document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+    : () => document.querySelectorAll(value).length;
+let matches = evaluate();
+const start = performance.now();
+for (let i = 0; i < repeat; i++) {
+    matches = evaluate();
+}
+return {ms: (performance.now() - start) / repeat, matches: matches};
+"""
+
+# Texts or values of the first elements of locators, in one round trip.
+# Arguments: list of ['css selector' or 'xpath', locator value].
+# Returns list with value of input, textarea and select elements, rendered text of other elements and null for
+# locators without elements
+VERIFY_MANY_SCRIPT = """/* verifyMany */
+const [locators] = arguments;
+const VALUE_TAGS = ["INPUT", "TEXTAREA", "SELECT"];
+return locators.map(([by, value]) => {
+    const element = by === "xpath"
+        ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(value);
+    if (element === null) {
+        return null;
+    }
+    return VALUE_TAGS.includes(element.tagName) ? element.value : element.innerText.trim();
+});
+"""
+
+# Order of the products list checked after it is sorted.
+# Arguments: sort option value e.g 'lohi', 'name' or 'price', true for descending order.
+# Returns null until the sort select has the option value and products are rendered, then
+# {sorted: boolean, pair: first pair of product names or prices out of order or null}
+PRODUCTS_ORDER_SCRIPT = """/* productsOrder */
+const [option, field, descending] = arguments;
+const select = document.querySelector(".product_sort_container");
+const items = [...document.querySelectorAll(".inventory_item")];
+if (select === null || select.value !== option || items.length === 0) {
+    return null;
+}
+const texts = items.map(
+    (item) => item.querySelector(field === "price" ? ".inventory_item_price" : ".inventory_item_name").innerText.trim()
+);
+const keys = field === "price" ? texts.map((text) => parseFloat(text.replace("$", ""))) : texts;
+for (let i = 1; i < keys.length; i++) {
+    if (descending ? keys[i - 1] < keys[i] : keys[i - 1] > keys[i]) {
+        return {sorted: false, pair: [texts[i - 1], texts[i]]};
+    }
+}
+return {sorted: true, pair: null};
+"""
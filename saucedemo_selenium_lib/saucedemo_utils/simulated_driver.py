@@ -0,0 +1,766 @@
+""" Simulated WebDriver
+
+In-memory WebDriver backend for running page objects without a browser. Pages are fetched over HTTP, usually from the
+stand-in Saucedemo server, and parsed into an lxml DOM. WebDriver commands used by the library i.e finding elements
+with CSS selectors and XPath, clicking, typing, reading texts and attributes and the script helpers of Selenium are
+executed on that DOM.
+
+Scripts of pages are not run. Clicks follow links, submit forms and run the few inline handlers of the stand-in pages
+(location.href='...', document.querySelector('...').hidden = ..., this.closest('...').remove() and
+this.form.submit()). Only the CSS selector subset Selenium and the locators use is supported: tag, #id, .class and
+[attribute] selectors combined with descendant and child combinators.
+
+Example:
+
+    with StandinServer() as server:
+        saucedemo_utils = SaucedemoUtils(server.url, "standard_user", "secret_sauce", browser=WebBrowsers.SIMULATED)
+        saucedemo_utils.open_saucedemo_website()
+"""
+import re
+import time
+import uuid
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+import lxml.etree
+import lxml.html
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    InvalidSessionIdException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import LocalFileDetector
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+BROWSER_NAME = "simulated"
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) SaucedemoSimulatedDriver/1.0"
+WINDOW_RECT = {"x": 0, "y": 0, "width": 1920, "height": 1080}
+ELEMENT_RECT = {"x": 0, "y": 0, "width": 100, "height": 20}
+# 1x1 PNG returned by screenshots
+SCREENSHOT_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+)
+NOT_RENDERED_TAGS = ("head", "title", "meta", "style", "script", "template")
+BLOCK_TAGS = (
+    "html", "body", "div", "p", "form", "nav", "section", "header", "footer", "ul", "ol", "li", "table", "tr",
+    "h1", "h2", "h3", "h4", "h5", "h6", "br", "select", "option",
+)
+BOOLEAN_ATTRIBUTES = ("checked", "disabled", "hidden", "multiple", "readonly", "required", "selected")
+SUBMIT_INPUT_TYPES = ("submit", "image")
+NOT_SUBMITTED_INPUT_TYPES = ("submit", "image", "button", "reset", "file")
+SELECT_ALL_KEY = "a"
+# Keys of selenium.webdriver.common.keys.Keys are characters of the unicode private use area
+SPECIAL_KEYS = re.compile("[\ue000-\uf8ff]")
+
+ONCLICK_HANDLERS = (
+    ("location", re.compile(r"""^(?:window\.)?location(?:\.href)?\s*=\s*(['"])(?P<url>.*)\1$""")),
+    (
+        "hidden",
+        re.compile(r"""^document\.querySelector\((['"])(?P<selector>.+)\1\)\.hidden\s*=\s*(?P<hidden>true|false)$"""),
+    ),
+    ("remove", re.compile(r"""^this\.closest\((['"])(?P<selector>.+)\1\)\.remove\(\)$""")),
+    ("submit", re.compile(r"^this\.form\.submit\(\)$")),
+)
+CLICK_SCRIPT = re.compile(r"^(?:return\s+)?arguments\[0\]\.click\(\);?$")
+CSS_TOKEN = re.compile(
+    r"""\s*(?P<combinator>>)\s*"""
+    r"""|(?P<space>\s+)"""
+    r"""|(?P<tag>\*|[a-zA-Z][\w-]*)"""
+    r"""|\#(?P<id>[\w-]+)"""
+    r"""|\.(?P<class>[\w-]+)"""
+    r"""|\[\s*(?P<attribute>[\w-]+)\s*(?:(?P<operator>[~^$*|]?=)\s*"""
+    r"""(?:"(?P<double_quoted>[^"]*)"|'(?P<single_quoted>[^']*)'|(?P<unquoted>[\w-]+))\s*)?\]"""
+)
+
+
+def _xpath_literal(value):
+    """Quote a string for XPath"""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = ", \"'\", ".join(f"'{part}'" for part in value.split("'"))
+    return f"concat({parts})"
+
+
+def _attribute_predicate(name, operator, value):
+    attribute = f"@{name}"
+    if operator is None:
+        return attribute
+    literal = _xpath_literal(value)
+    if operator == "=":
+        return f"{attribute}={literal}"
+    if operator == "~=":
+        return f"contains(concat(' ', normalize-space({attribute}), ' '), {_xpath_literal(f' {value} ')})"
+    if operator == "^=":
+        return f"starts-with({attribute}, {literal})"
+    if operator == "$=":
+        return f"substring({attribute}, string-length({attribute}) - {len(value) - 1})={literal}"
+    if operator == "*=":
+        return f"contains({attribute}, {literal})"
+    # |= matches the value or the value followed by a hyphen
+    return f"({attribute}={literal} or starts-with({attribute}, {_xpath_literal(f'{value}-')}))"
+
+
+def css_to_xpath(selector, relative=False):
+    """Translate a CSS selector to XPath
+
+    Args:
+        selector: CSS selector. Groups(,), descendant and child(>) combinators and compound selectors of tag, #id,
+                  .class and [attribute] selectors are supported
+        relative: Match descendants of the context node only, like WebElement.find_element. Otherwise the context
+                  node is matched too
+
+    Raises:
+        InvalidSelectorException if the selector is not supported
+    """
+    groups = []
+    for group in selector.split(","):
+        group = group.strip()
+        steps, tag, predicates, axis = [], "*", [], "descendant::" if relative else "descendant-or-self::"
+        position, compound = 0, False
+        while position < len(group):
+            match = CSS_TOKEN.match(group, position)
+            if match is None or match.end() == position:
+                raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+            position = match.end()
+            if match.group("combinator") or match.group("space"):
+                if not compound:
+                    raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+                steps.append(f"{axis}{tag}{''.join(f'[{predicate}]' for predicate in predicates)}")
+                tag, predicates, compound = "*", [], False
+                axis = "" if match.group("combinator") else "descendant::"
+            elif match.group("tag"):
+                tag, compound = match.group("tag").lower(), True
+            elif match.group("id"):
+                compound = True
+                predicates.append(f"@id={_xpath_literal(match.group('id'))}")
+            elif match.group("class"):
+                compound = True
+                predicates.append(_attribute_predicate("class", "~=", match.group("class")))
+            else:
+                compound = True
+                value = match.group("double_quoted")
+                if value is None:
+                    value = match.group("single_quoted")
+                if value is None:
+                    value = match.group("unquoted")
+                predicates.append(_attribute_predicate(match.group("attribute"), match.group("operator"), value))
+        if not compound:
+            raise InvalidSelectorException(f"Unsupported CSS selector: {selector}")
+        steps.append(f"{axis}{tag}{''.join(f'[{predicate}]' for predicate in predicates)}")
+        groups.append("/".join(steps))
+    return " | ".join(groups)
+
+
+def _is_element(node):
+    """lxml comments and processing instructions have a function as tag"""
+    return isinstance(node.tag, str)
+
+
+def is_displayed(node):
+    """Check if an element would be rendered. Elements hidden by stylesheets are not detected except [hidden]"""
+    for current in node.iterancestors():
+        if current.tag in NOT_RENDERED_TAGS or current.get("hidden") is not None or _has_display_none(current):
+            return False
+    if node.tag in NOT_RENDERED_TAGS or node.get("hidden") is not None or _has_display_none(node):
+        return False
+    return not (node.tag == "input" and node.get("type", "").lower() == "hidden")
+
+
+def _has_display_none(node):
+    style = node.get("style", "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def get_rendered_text(node):
+    """Return visible text of an element like WebElement.text. Block elements are separated by new lines"""
+    if not is_displayed(node):
+        return ""
+    parts = []
+
+    def collect(current):
+        if not _is_element(current):
+            return
+        if current.tag in NOT_RENDERED_TAGS or current.get("hidden") is not None or _has_display_none(current):
+            return
+        block = current.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if current.text:
+            parts.append(current.text)
+        for child in current:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    collect(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class SimulatedWebDriver(WebDriver):
+    """WebDriver executing commands on an lxml DOM instead of a browser
+
+    It is a selenium WebDriver, so WebDriverWait, expected conditions, ActionChains, Select and EventFiringWebDriver
+    work with it. No browser process or driver service is started.
+
+    Args:
+        timeout: Timeout in seconds of HTTP requests
+    """
+
+    def __init__(self, timeout=30):
+        # WebDriver.__init__ is not called, it connects to a driver service
+        self.session_id = uuid.uuid4().hex
+        self.caps = {"browserName": BROWSER_NAME, "browserVersion": "1.0", "platformName": "any"}
+        self.pinned_scripts = {}
+        self.command_executor = None
+        self._file_detector = LocalFileDetector()
+        self._is_remote = False
+        self._authenticator_id = None
+        self._timeout = timeout
+        self._cookie_jar = CookieJar()
+        self._opener = build_opener(HTTPCookieProcessor(self._cookie_jar))
+        self._url = "about:blank"
+        self._document = lxml.html.document_fromstring("<html><head></head><body></body></html>")
+        self._elements = {}
+        self._element_ids = {}
+        self._selected_all = None
+        self._quit = False
+        self._commands = {
+            Command.QUIT: self._quit_session,
+            Command.GET: lambda params: self._navigate(params["url"]),
+            Command.GET_CURRENT_URL: lambda params: self._url,
+            Command.GET_TITLE: lambda params: self._document.findtext(".//title") or "",
+            Command.GET_PAGE_SOURCE: lambda params: lxml.html.tostring(self._document, encoding=str),
+            Command.REFRESH: lambda params: self._navigate(self._url),
+            Command.FIND_ELEMENT: lambda params: self._find(self._document, params, single=True),
+            Command.FIND_ELEMENTS: lambda params: self._find(self._document, params),
+            Command.FIND_CHILD_ELEMENT: lambda params: self._find(self._get_node(params), params, single=True),
+            Command.FIND_CHILD_ELEMENTS: lambda params: self._find(self._get_node(params), params),
+            Command.CLICK_ELEMENT: lambda params: self._click(self._get_node(params), check_interactable=True),
+            Command.CLEAR_ELEMENT: lambda params: self._clear(self._get_node(params)),
+            Command.SEND_KEYS_TO_ELEMENT: lambda params: self._send_keys(self._get_node(params), params["text"]),
+            Command.GET_ELEMENT_TEXT: lambda params: get_rendered_text(self._get_node(params)),
+            Command.GET_ELEMENT_TAG_NAME: lambda params: self._get_node(params).tag,
+            Command.GET_ELEMENT_ATTRIBUTE: lambda params: self._get_node(params).get(params["name"]),
+            Command.GET_ELEMENT_PROPERTY: lambda params: self._get_property(self._get_node(params), params["name"]),
+            Command.IS_ELEMENT_SELECTED: lambda params: self._is_selected(self._get_node(params)),
+            Command.IS_ELEMENT_ENABLED: lambda params: self._get_node(params).get("disabled") is None,
+            Command.GET_ELEMENT_RECT: lambda params: dict(ELEMENT_RECT),
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: self._get_css_property,
+            Command.ELEMENT_SCREENSHOT: lambda params: SCREENSHOT_PNG,
+            Command.SCREENSHOT: lambda params: SCREENSHOT_PNG,
+            Command.W3C_EXECUTE_SCRIPT: self._execute_script,
+            Command.W3C_ACTIONS: self._perform_actions,
+            Command.W3C_CLEAR_ACTIONS: lambda params: None,
+            Command.W3C_MAXIMIZE_WINDOW: lambda params: dict(WINDOW_RECT),
+            Command.SET_WINDOW_RECT: lambda params: dict(WINDOW_RECT),
+            Command.GET_WINDOW_RECT: lambda params: dict(WINDOW_RECT),
+            Command.SET_TIMEOUTS: lambda params: None,
+            Command.DELETE_ALL_COOKIES: lambda params: self._cookie_jar.clear(),
+        }
+
+    def __repr__(self):
+        return f'<{type(self).__module__}.{type(self).__name__} (session="{self.session_id}")>'
+
+    @property
+    def document(self):
+        """lxml document of the current page"""
+        return self._document
+
+    def execute(self, driver_command, params=None):
+        """Execute a WebDriver command on the DOM
+
+        Returns:
+            dict with 'value' of the command like the response of a driver service
+        """
+        if self._quit and driver_command != Command.QUIT:
+            raise InvalidSessionIdException("Simulated browser session is closed")
+        handler = self._commands.get(driver_command)
+        if handler is None:
+            raise WebDriverException(f"Command {driver_command} is not supported by the simulated driver")
+        return {"value": handler(params or {})}
+
+    def quit(self):
+        self.execute(Command.QUIT)
+
+    def start_client(self):
+        pass
+
+    def stop_client(self):
+        pass
+
+    def _quit_session(self, params):
+        self._quit = True
+        self._elements.clear()
+        self._element_ids.clear()
+
+    # Navigation
+
+    def _navigate(self, url, data=None):
+        """Load a page. data is urlencoded body of a POST request"""
+        url = urljoin(self._url, url)
+        if url.startswith("javascript:"):
+            return
+        if url == "about:blank":
+            self._load_document(url, "")
+            return
+        headers = {"User-Agent": USER_AGENT}
+        if self._url.startswith("http"):
+            headers["Referer"] = self._url
+        request = Request(url, data=data.encode() if data is not None else None, headers=headers)
+        try:
+            with self._opener.open(request, timeout=self._timeout) as response:
+                self._load_document(response.geturl(), self._decode(response))
+        except HTTPError as error:
+            # Browsers show error pages like any other page
+            with error:
+                self._load_document(error.geturl() or url, self._decode(error))
+        except OSError as error:
+            raise WebDriverException(f"unknown error: net::ERR_CONNECTION_FAILED {url}: {error}")
+
+    @staticmethod
+    def _decode(response):
+        charset = response.headers.get_content_charset() or "utf-8"
+        return response.read().decode(charset, errors="replace")
+
+    def _load_document(self, url, html):
+        self._url = url
+        try:
+            self._document = lxml.html.document_fromstring(html or "<html><body></body></html>")
+        except lxml.etree.ParserError:
+            self._document = lxml.html.document_fromstring("<html><body></body></html>")
+        # Elements of the previous page are stale
+        self._elements.clear()
+        self._element_ids.clear()
+        self._selected_all = None
+
+    # Elements
+
+    def _get_element(self, node):
+        """Return WebElement of an lxml element. The same element always gets the same id"""
+        element_id = self._element_ids.get(node)
+        if element_id is None:
+            element_id = uuid.uuid4().hex
+            self._element_ids[node] = element_id
+            self._elements[element_id] = node
+        return self._web_element_cls(self, element_id)
+
+    def _get_node(self, params):
+        return self._get_node_by_id(params["id"])
+
+    def _get_node_by_id(self, element_id):
+        node = self._elements.get(element_id)
+        if node is None or not self._is_attached(node):
+            raise StaleElementReferenceException(
+                "stale element reference: element is not attached to the page document"
+            )
+        return node
+
+    def _is_attached(self, node):
+        root = node
+        for root in node.iterancestors():
+            pass
+        return root is self._document
+
+    def _find(self, context, params, single=False):
+        by, value = params["using"], params["value"]
+        relative = context is not self._document
+        if by == By.CSS_SELECTOR:
+            xpath = css_to_xpath(value, relative=relative)
+        elif by == By.XPATH:
+            xpath = value
+        elif by == By.TAG_NAME:
+            xpath = f"{'descendant' if relative else 'descendant-or-self'}::{value.lower()}"
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            xpath = f"{'descendant' if relative else 'descendant-or-self'}::a[@href]"
+        else:
+            raise InvalidSelectorException(f"Locator strategy {by} is not supported by the simulated driver")
+        try:
+            nodes = context.xpath(xpath)
+        except lxml.etree.XPathError as error:
+            raise InvalidSelectorException(f"Invalid selector {value}: {error}")
+        if not isinstance(nodes, list) or any(not isinstance(node, lxml.etree._Element) for node in nodes):
+            raise InvalidSelectorException(f"Selector {value} does not select elements")
+        nodes = [node for node in nodes if _is_element(node)]
+        if by == By.LINK_TEXT:
+            nodes = [node for node in nodes if get_rendered_text(node) == value]
+        elif by == By.PARTIAL_LINK_TEXT:
+            nodes = [node for node in nodes if value in get_rendered_text(node)]
+        if single:
+            if not nodes:
+                raise NoSuchElementException(f"no such element: Unable to locate element: {by}={value}")
+            return self._get_element(nodes[0])
+        return [self._get_element(node) for node in nodes]
+
+    def _get_property(self, node, name):
+        if name == "value":
+            return self._get_value(node)
+        if name in BOOLEAN_ATTRIBUTES:
+            return self._is_selected(node) if name in ("checked", "selected") else node.get(name) is not None
+        if name in ("href", "src") and node.get(name) is not None:
+            return urljoin(self._url, node.get(name))
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else get_rendered_text(node)
+        if name == "tagName":
+            return node.tag.upper()
+        if name == "className":
+            return node.get("class", "")
+        return node.get(name)
+
+    def _get_attribute(self, node, name):
+        """Value of WebElement.get_attribute, the property is preferred over the attribute"""
+        if name in BOOLEAN_ATTRIBUTES:
+            return "true" if self._get_property(node, name) else None
+        if name == "value" or (name in ("href", "src") and node.get(name) is not None):
+            return self._get_property(node, name)
+        if name == "class":
+            return node.get("class")
+        value = node.get(name)
+        return value if value is not None else self._get_property(node, name)
+
+    def _get_css_property(self, params):
+        node = self._get_node(params)
+        if params["propertyName"] == "display":
+            return "block" if is_displayed(node) else "none"
+        if params["propertyName"] == "visibility":
+            return "visible" if is_displayed(node) else "hidden"
+        return ""
+
+    def _is_selected(self, node):
+        if node.tag == "option":
+            select = self._get_select(node)
+            if select is not None:
+                return node in self._get_selected_options(select)
+        return node.get("checked") is not None or node.get("selected") is not None
+
+    # Form controls
+
+    def _get_value(self, node):
+        if node.tag == "textarea":
+            return node.text or ""
+        if node.tag == "select":
+            options = self._get_selected_options(node)
+            return self._get_value(options[0]) if options else ""
+        if node.tag == "option":
+            value = node.get("value")
+            return value if value is not None else " ".join(node.text_content().split())
+        if node.tag == "input" and node.get("type", "").lower() in ("checkbox", "radio"):
+            return node.get("value", "on")
+        return node.get("value", "") if node.tag in ("input", "button") else node.get("value")
+
+    def _set_value(self, node, value):
+        if node.tag == "textarea":
+            node.text = value
+        elif node.tag == "input":
+            node.set("value", value)
+
+    def _clear(self, node):
+        self._check_interactable(node)
+        self._set_value(node, "")
+        self._selected_all = None
+
+    def _send_keys(self, node, text):
+        """Type text into a text input. CONTROL+a selects the value, ENTER submits the form of the input"""
+        self._check_interactable(node)
+        value = self._get_value(node) if node.tag in ("input", "textarea") else ""
+        control = False
+        for character in text:
+            if character == Keys.NULL:
+                control = False
+            elif character in (Keys.CONTROL, Keys.LEFT_CONTROL, Keys.COMMAND):
+                control = True
+            elif control:
+                if character.lower() == SELECT_ALL_KEY:
+                    self._selected_all = node
+            elif character in (Keys.ENTER, Keys.RETURN):
+                self._set_value(node, value)
+                form = self._get_form(node)
+                if form is not None:
+                    submitters = [
+                        submitter for submitter in self._iter_form_controls(form) if self._is_submitter(submitter)
+                    ]
+                    self._submit(form, submitters[0] if submitters else None)
+                return
+            elif character in (Keys.BACKSPACE, Keys.DELETE):
+                value = "" if self._selected_all is node else value[:-1]
+                self._selected_all = None
+            elif not SPECIAL_KEYS.match(character):
+                if self._selected_all is node:
+                    value, self._selected_all = "", None
+                value += character
+        if node.tag in ("input", "textarea"):
+            self._set_value(node, value)
+
+    def _get_form(self, node):
+        form_id = node.get("form")
+        if form_id:
+            forms = self._document.xpath("//form[@id=$form_id]", form_id=form_id)
+            return forms[0] if forms else None
+        for ancestor in node.iterancestors("form"):
+            return ancestor
+        return None
+
+    @staticmethod
+    def _iter_form_controls(form):
+        for node in form.iter("input", "button", "select", "textarea"):
+            yield node
+
+    @staticmethod
+    def _is_submitter(node):
+        if node.tag == "button":
+            return node.get("type", "submit").lower() == "submit"
+        return node.tag == "input" and node.get("type", "").lower() in SUBMIT_INPUT_TYPES
+
+    @staticmethod
+    def _get_select(option):
+        for ancestor in option.iterancestors("select"):
+            return ancestor
+        return None
+
+    @staticmethod
+    def _get_selected_options(select):
+        options = list(select.iter("option"))
+        selected = [option for option in options if option.get("selected") is not None]
+        if selected or select.get("multiple") is not None:
+            return selected
+        # First option of a single select is selected by default
+        return options[:1]
+
+    def _submit(self, form, submitter=None):
+        fields = []
+        for node in self._iter_form_controls(form):
+            name = node.get("name")
+            if not name or node.get("disabled") is not None:
+                continue
+            if node.tag == "select":
+                fields.extend((name, self._get_value(option)) for option in self._get_selected_options(node))
+            elif self._is_submitter(node) or node.tag == "button":
+                if node is submitter:
+                    fields.append((name, node.get("value", "")))
+            elif node.tag == "input" and node.get("type", "").lower() in NOT_SUBMITTED_INPUT_TYPES:
+                continue
+            elif node.tag == "input" and node.get("type", "").lower() in ("checkbox", "radio"):
+                if node.get("checked") is not None:
+                    fields.append((name, self._get_value(node)))
+            else:
+                fields.append((name, self._get_value(node)))
+
+        action = urljoin(self._url, form.get("action") or self._url)
+        if form.get("method", "get").lower() == "post":
+            self._navigate(action, data=urlencode(fields))
+        else:
+            scheme, netloc, path, _, _ = urlsplit(action)
+            self._navigate(urlunsplit((scheme, netloc, path, urlencode(fields), "")))
+
+    # Clicks
+
+    def _check_interactable(self, node):
+        if not is_displayed(node):
+            raise ElementNotInteractableException("element not interactable")
+
+    def _click(self, node, check_interactable=False):
+        """Click at an element like a user
+
+        A click at an element wrapping a single element lands on the wrapped element, like a click at the middle of the
+        element. The click is then handled by the nearest element that follows a link, submits a form, selects an
+        option or has an onclick handler.
+
+        Args:
+            node: lxml element
+            check_interactable: Raise ElementNotInteractableException if the element is not displayed, like
+                                WebElement.click. Clicks of scripts are not checked
+        """
+        if check_interactable:
+            self._check_interactable(node)
+        while len(node) == 1 and _is_element(node[0]) and not (node.text or "").strip():
+            node = node[0]
+        self._selected_all = None
+        for current in [node, *node.iterancestors()]:
+            if current.get("disabled") is not None:
+                return
+            onclick = current.get("onclick")
+            if onclick:
+                self._run_handler(current, onclick)
+                return
+            if current.tag == "option":
+                self._select_option(current)
+                return
+            if current.tag == "a" and current.get("href") is not None:
+                self._navigate(current.get("href"))
+                return
+            if current.tag == "input" and current.get("type", "").lower() in ("checkbox", "radio"):
+                self._toggle(current)
+                return
+            if self._is_submitter(current):
+                form = self._get_form(current)
+                if form is not None:
+                    self._submit(form, current)
+                return
+
+    def _toggle(self, node):
+        if node.get("type", "").lower() == "radio":
+            for radio in self._document.xpath("//input[@type='radio' and @name=$name]", name=node.get("name", "")):
+                radio.attrib.pop("checked", None)
+            node.set("checked", "")
+        elif node.get("checked") is not None:
+            del node.attrib["checked"]
+        else:
+            node.set("checked", "")
+
+    def _select_option(self, option):
+        select = self._get_select(option)
+        if select is None:
+            return
+        if select.get("multiple") is not None:
+            if option.get("selected") is not None:
+                del option.attrib["selected"]
+            else:
+                option.set("selected", "")
+        else:
+            if option in self._get_selected_options(select) and option.get("selected") is not None:
+                return
+            for other in select.iter("option"):
+                other.attrib.pop("selected", None)
+            option.set("selected", "")
+        onchange = select.get("onchange")
+        if onchange:
+            self._run_handler(select, onchange)
+
+    def _run_handler(self, node, script):
+        """Run an inline event handler of the stand-in pages
+
+        Raises:
+            JavascriptException if the handler is not supported
+        """
+        for statement in (statement.strip() for statement in script.split(";")):
+            if not statement:
+                continue
+            for name, pattern in ONCLICK_HANDLERS:
+                match = pattern.match(statement)
+                if match is not None:
+                    break
+            else:
+                raise JavascriptException(f"Handler is not supported by the simulated driver: {statement}")
+            if name == "location":
+                self._navigate(match.group("url"))
+                return
+            if name == "submit":
+                form = self._get_form(node)
+                if form is not None:
+                    self._submit(form)
+                return
+            if name == "hidden":
+                targets = self._document.xpath(css_to_xpath(match.group("selector")))
+                if targets:
+                    if match.group("hidden") == "true":
+                        targets[0].set("hidden", "")
+                    else:
+                        targets[0].attrib.pop("hidden", None)
+            else:
+                xpath = css_to_xpath(match.group("selector"))
+                matching = set(self._document.xpath(xpath))
+                for ancestor in [node, *node.iterancestors()]:
+                    if ancestor in matching:
+                        ancestor.drop_tree()
+                        break
+
+    def _perform_actions(self, params):
+        """Run pointer actions of ActionChains. A pointer up after a pointer down clicks at the element the pointer
+        was last moved to. Key actions are ignored"""
+        for device in params.get("actions", []):
+            if device.get("type") != "pointer":
+                continue
+            target, pressed = None, False
+            for action in device.get("actions", []):
+                if action["type"] == "pointerMove":
+                    origin = action.get("origin")
+                    if isinstance(origin, dict):
+                        target = self._get_node_by_id(next(iter(origin.values())))
+                elif action["type"] == "pointerDown":
+                    pressed = True
+                elif action["type"] == "pointerUp" and pressed:
+                    pressed = False
+                    if target is not None:
+                        self._click(target, check_interactable=True)
+                        # Elements of the previous page can not be clicked after navigation
+                        if not self._is_attached(target):
+                            target = None
+
+    # Scripts
+
+    def _execute_script(self, params):
+        """Execute the scripts Selenium and the library use. Other scripts raise JavascriptException"""
+        script = params["script"].strip()
+        args = [self._unwrap_argument(argument) for argument in params.get("args", [])]
+        if script.startswith("/* getAttribute */"):
+            return self._get_attribute(args[0], args[1])
+        if script.startswith("/* isDisplayed */"):
+            return is_displayed(args[0])
+        if script.startswith("/* locatorCost */"):
+            return self._get_locator_cost(*args)
+        if script.startswith("/* verifyMany */"):
+            return [self._get_text_or_value(by, value) for by, value in args[0]]
+        if script.startswith("/* productsOrder */"):
+            return self._get_products_order(*args)
+        if "scrollIntoView" in script or "getBoundingClientRect" in script:
+            return dict(ELEMENT_RECT)
+        if CLICK_SCRIPT.match(script):
+            self._click(args[0])
+            return None
+        if script in ("return document.readyState", "return document.readyState;"):
+            return "complete"
+        raise JavascriptException(f"Script is not supported by the simulated driver: {script[:100]}")
+
+    def _get_locator_cost(self, by, value, repeat):
+        """LOCATOR_COST_SCRIPT timed on the lxml DOM"""
+        params = {"using": by, "value": value}
+        matches = len(self._find(self._document, params))
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            self._find(self._document, params)
+        return {"ms": (time.perf_counter() - start_time) * 1000 / repeat, "matches": matches}
+
+    def _get_text_or_value(self, by, value):
+        """Item of VERIFY_MANY_SCRIPT result"""
+        elements = self._find(self._document, {"using": by, "value": value})
+        if not elements:
+            return None
+        node = self._get_node_by_id(elements[0].id)
+        if node.tag in ("input", "textarea", "select"):
+            return self._get_value(node)
+        return get_rendered_text(node).strip()
+
+    def _get_products_order(self, option, field, descending):
+        """PRODUCTS_ORDER_SCRIPT on the DOM"""
+        select = self._document.xpath(css_to_xpath(".product_sort_container"))
+        items = self._document.xpath(css_to_xpath(".inventory_item"))
+        if not select or self._get_value(select[0]) != option or not items:
+            return None
+        item_class = "inventory_item_price" if field == "price" else "inventory_item_name"
+        texts = [get_rendered_text(item.xpath(css_to_xpath(f".{item_class}", relative=True))[0]).strip() for item in items]
+        keys = [float(text.replace("$", "")) for text in texts] if field == "price" else texts
+        for index in range(1, len(keys)):
+            if keys[index - 1] < keys[index] if descending else keys[index - 1] > keys[index]:
+                return {"sorted": False, "pair": [texts[index - 1], texts[index]]}
+        return {"sorted": True, "pair": None}
+
+    def _unwrap_argument(self, argument):
+        if isinstance(argument, WebElement):
+            return self._get_node_by_id(argument.id)
+        if isinstance(argument, dict) and len(argument) == 1 and "element-6066-11e4-a52e-4f735466cecf" in argument:
+            return self._get_node_by_id(argument["element-6066-11e4-a52e-4f735466cecf"])
+        return argument
@@ -0,0 +1,248 @@
+""" Adaptive Wait Timeouts
+
+Record how long waits for elements take per host and locator, and derive timeouts of the waits from them.
+
+Every wait that succeeds records its latency. Latencies are kept in JSON files in a stats dir, one file per process
+(xdist worker), written when the process exits, so they are collected across runs. In adaptive mode the timeout of a
+wait is P99_MULTIPLIER times the p99 latency of the locator on the host. The fixed timeout of the wait e.g
+SaucedemoTimeOuts.LONG_LOADING_TIMEOUT is its upper bound. Locators without enough samples, e.g negative checks of
+elements that are never present, use p99 of all waits on the host. Failures then surface in seconds instead of after
+the full fixed timeout.
+
+Adaptive mode is enabled with ADAPTIVE_TIMEOUTS=1 envar or adaptive_timeouts argument of SaucedemoUtils.
+"""
+import atexit
+import json
+import math
+import os
+import time
+from urllib.parse import urlsplit
+
+from selenium.webdriver.support.wait import WebDriverWait
+
+from saucedemo_selenium_lib.locators.registry import get_locator_key
+
+ADAPTIVE_TIMEOUTS_ENVAR = "ADAPTIVE_TIMEOUTS"
+WAIT_LATENCIES_DIR = "wait-latencies"
+# Adaptive timeout is this multiple of the observed p99 latency
+P99_MULTIPLIER = 3
+# Latencies needed before a timeout is derived from them
+MIN_SAMPLES = 20
+# Lower bound of adaptive timeouts. Elements that are always present at once would otherwise get timeouts of a few ms
+MIN_TIMEOUT = 2.0
+# Latest latencies kept per host and locator in a file
+MAX_SAMPLES = 500
+
+
+def percentile(values, percent):
+    """Return nearest-rank percentile of values"""
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def is_adaptive_timeouts_enabled():
+    return os.environ.get(ADAPTIVE_TIMEOUTS_ENVAR, "0").lower() not in ("", "0", "false")
+
+
+def get_host_key(host_url):
+    """Hosts are identified by their network location, so paths of the same host share latencies"""
+    return urlsplit(host_url).netloc or host_url
+
+
+def _read_latencies_file(file_path):
+    try:
+        with open(file_path) as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def load_wait_latencies(stats_path):
+    """Return latencies of all processes in stats dir
+
+    Returns:
+        dict of hosts and dicts of locator keys and lists of latencies in seconds
+    """
+    latencies = {}
+    if not os.path.isdir(stats_path):
+        return latencies
+    for file_name in sorted(os.listdir(stats_path)):
+        if not file_name.endswith(".json"):
+            continue
+        for host, locators in _read_latencies_file(os.path.join(stats_path, file_name)).items():
+            for locator, samples in locators.items():
+                latencies.setdefault(host, {}).setdefault(locator, []).extend(samples)
+    return latencies
+
+
+def get_adaptive_timeout(locator_samples, host_samples, timeout):
+    """Return adaptive timeout of a wait
+
+    Args:
+        locator_samples: Latencies of the locator on the host
+        host_samples: Latencies of all locators on the host
+        timeout: Fixed timeout of the wait, upper bound of the adaptive timeout
+
+    Returns:
+        timeout in seconds. The fixed timeout if there are not enough samples
+    """
+    samples = locator_samples if len(locator_samples) >= MIN_SAMPLES else host_samples
+    if len(samples) < MIN_SAMPLES:
+        return timeout
+    return min(timeout, max(MIN_TIMEOUT, P99_MULTIPLIER * percentile(samples, 99)))
+
+
+class WaitLatencies:
+    """Wait latencies of a stats dir shared by all SaucedemoUtils of a process
+
+    Latencies of all processes are loaded once. Latencies recorded by this process are added to
+    '<xdist worker or main>.json' in the stats dir when the process exits, so parallel workers never write the same
+    file.
+    """
+
+    def __init__(self, stats_path):
+        self._stats_path = stats_path
+        self._latencies = None
+        self._host_latencies = {}
+        self._recorded = {}
+        self._save_registered = False
+
+    @property
+    def stats_path(self):
+        return self._stats_path
+
+    @property
+    def file_path(self):
+        """File latencies of this process are saved to"""
+        return os.path.join(self._stats_path, f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.json")
+
+    def _get_latencies(self):
+        if self._latencies is None:
+            self._latencies = load_wait_latencies(self._stats_path)
+        return self._latencies
+
+    def get_locator_latencies(self, host, locator_key):
+        return self._get_latencies().get(host, {}).get(locator_key, [])
+
+    def get_host_latencies(self, host):
+        """Return latencies of all locators of a host. They are cached until a latency of the host is recorded"""
+        latencies = self._host_latencies.get(host)
+        if latencies is None:
+            latencies = self._host_latencies[host] = [
+                latency for samples in self._get_latencies().get(host, {}).values() for latency in samples
+            ]
+        return latencies
+
+    def record(self, host, locator_key, latency):
+        self._get_latencies().setdefault(host, {}).setdefault(locator_key, []).append(latency)
+        self._host_latencies.pop(host, None)
+        self._recorded.setdefault(host, {}).setdefault(locator_key, []).append(latency)
+        if not self._save_registered:
+            atexit.register(self.save)
+            self._save_registered = True
+
+    def save(self):
+        """Add latencies recorded by this process to its file"""
+        if not self._recorded:
+            return
+        os.makedirs(self._stats_path, exist_ok=True)
+        latencies = _read_latencies_file(self.file_path)
+        for host, locators in self._recorded.items():
+            for locator, samples in locators.items():
+                saved = latencies.setdefault(host, {}).setdefault(locator, [])
+                saved.extend(round(latency, 4) for latency in samples)
+                del saved[:-MAX_SAMPLES]
+        temporary_file = f"{self.file_path}.tmp"
+        with open(temporary_file, "w") as file:
+            json.dump(latencies, file)
+        os.replace(temporary_file, self.file_path)
+        self._recorded = {}
+
+
+# { <stats dir>: WaitLatencies }
+_wait_latencies = {}
+
+
+def get_wait_latencies(stats_path):
+    """Return WaitLatencies of a stats dir. One instance is used per process"""
+    stats_path = os.path.abspath(stats_path)
+    wait_latencies = _wait_latencies.get(stats_path)
+    if wait_latencies is None:
+        wait_latencies = _wait_latencies[stats_path] = WaitLatencies(stats_path)
+    return wait_latencies
+
+
+class WaitTimeouts:
+    """Wait for elements of a host, record the wait latencies and derive timeouts from them in adaptive mode
+
+    Args:
+        host_url: Url of the host the waits are done on
+        stats_path: Dir of wait latencies files
+        adaptive: Use adaptive timeouts. Default is set by ADAPTIVE_TIMEOUTS envar
+        profiler: LocatorProfiler measuring costs of the locators waited for. Not measured if it is None
+        element_cache: ElementCache of the browser session. Conditions met by cached elements are not waited for
+    """
+
+    def __init__(self, host_url, stats_path, adaptive=None, profiler=None, element_cache=None):
+        self._host = get_host_key(host_url or "")
+        self._latencies = get_wait_latencies(stats_path)
+        self._adaptive = is_adaptive_timeouts_enabled() if adaptive is None else adaptive
+        self._profiler = profiler
+        self._element_cache = element_cache
+
+    @property
+    def adaptive(self):
+        return self._adaptive
+
+    @property
+    def latencies(self):
+        return self._latencies
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    @property
+    def element_cache(self):
+        return self._element_cache
+
+    def get_timeout(self, locator, timeout):
+        """Return timeout of a wait for locator. Fixed timeout is returned if adaptive mode is off"""
+        if not self._adaptive:
+            return timeout
+        return get_adaptive_timeout(
+            self._latencies.get_locator_latencies(self._host, get_locator_key(locator)),
+            self._latencies.get_host_latencies(self._host),
+            timeout,
+        )
+
+    def wait(self, driver, condition, locator, timeout):
+        """Wait until an expected condition of a locator is met and record how long it took
+
+        Conditions met by an element in the element cache return at once and are not recorded.
+
+        Args:
+            driver: Selenium webdriver
+            condition: Expected condition taking a locator e.g expected_conditions.element_to_be_clickable
+            locator: Selenium locator tuple
+            timeout: Fixed timeout of the wait in seconds
+
+        Returns:
+            Value returned by the condition e.g the element
+
+        Raises:
+            TimeoutException if the condition is not met until the timeout
+        """
+        if self._element_cache is not None:
+            cached, result = self._element_cache.find(driver, condition, locator)
+            if cached:
+                return result
+        start_time = time.perf_counter()
+        result = WebDriverWait(driver, self.get_timeout(locator, timeout)).until(condition(locator))
+        self._latencies.record(self._host, get_locator_key(locator), time.perf_counter() - start_time)
+        if self._element_cache is not None:
+            self._element_cache.store(condition, locator, result)
+        if self._profiler is not None:
+            self._profiler.measure(driver, locator)
+        return result
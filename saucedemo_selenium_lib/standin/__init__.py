@@ -0,0 +1 @@
+"""Package containing the offline stand-in Saucedemo server"""
@@ -0,0 +1,307 @@
+""" Stand-in Pages
+
+HTML of the stand-in Saucedemo pages. Pages have the same ids, classes and data-test attributes as Saucedemo, so
+CommonLocators and page objects work on them. Instead of the React app of Saucedemo, state changes are plain form
+submissions and links handled by the stand-in server. The only scripts are the ones opening and closing the menu and
+the error dialog.
+"""
+from html import escape
+
+from saucedemo_selenium_lib.data_models import SAUCEDEMO_PRODUCTS, SORT_ORDERS
+
+# Sort option values of the products sort select and their visible texts
+SORT_OPTIONS = {order.value: option for option, order in SORT_ORDERS.items()}
+DEFAULT_SORT = "az"
+PRODUCTS_BY_ID = {product.id: product for product in SAUCEDEMO_PRODUCTS}
+TAX_RATE = 0.08
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; }
+.bm-burger-button { position: absolute; left: 20px; top: 10px; }
+.bm-menu-wrap { position: fixed; left: 0; top: 0; width: 300px; height: 100%; background: #eee; z-index: 10; }
+.bm-menu-wrap[hidden] { display: none; }
+.bm-item-list a { display: block; padding: 10px; }
+.header_secondary_container { margin-top: 50px; padding: 10px; }
+.inventory_list { display: flex; flex-wrap: wrap; }
+.inventory_item { width: 45%; margin: 10px; border: 1px solid #ddd; }
+.inventory_item_img { width: 120px; height: 120px; }
+.error-message-container { min-height: 40px; }
+.error-message-container.error { background: #e2231a; color: #fff; }
+.message-box-error { background: #e2231a; color: #fff; padding: 10px; }
+"""
+
+OPEN_MENU_SCRIPT = "document.querySelector('.bm-menu-wrap').hidden = false;"
+CLOSE_MENU_SCRIPT = "document.querySelector('.bm-menu-wrap').hidden = true;"
+CLOSE_ERROR_SCRIPT = "this.closest('.error-message-container, .message-box-error').remove();"
+
+
+def _page(title, body, page_class=""):
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        f"<title>{escape(title)}</title><style>{STYLE}</style></head>"
+        f'<body><div id="root"><div class="page_wrapper {page_class}">{body}</div></div></body></html>'
+    )
+
+
+def _error_container(message):
+    if not message:
+        return '<div class="error-message-container"></div>'
+    return (
+        '<div class="error-message-container error message-box-error">'
+        f'<h3 data-test="error">{escape(message)}'
+        f'<button class="error-button" data-test="error-button" onclick="{CLOSE_ERROR_SCRIPT}">x</button>'
+        "</h3></div>"
+    )
+
+
+def login_page(error=None, username=""):
+    """Login page. Error is shown in the error container if it is given"""
+    return _page(
+        "Swag Labs",
+        '<div class="login_logo">Swag Labs</div>'
+        '<div class="login_wrapper"><div class="login_wrapper-inner"><div class="login-box">'
+        '<form method="post" action="/">'
+        '<div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" '
+        f'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" '
+        f'value="{escape(username)}"></div>'
+        '<div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" '
+        'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>'
+        f"{_error_container(error)}"
+        '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" '
+        'name="login-button" value="Login">'
+        "</form></div></div></div>",
+        page_class="login_container",
+    )
+
+
+def _header(cart, title, error=None):
+    badge = f'<span class="shopping_cart_badge">{len(cart)}</span>' if cart else ""
+    error_dialog = ""
+    if error:
+        error_dialog = (
+            f'<div class="message-box-error" data-test="error">{escape(error)}'
+            f'<button class="error-button" data-test="error-button" onclick="{CLOSE_ERROR_SCRIPT}">x</button></div>'
+        )
+    return (
+        '<div id="menu_button_container"><div class="bm-burger-menu">'
+        '<div class="bm-burger-button">'
+        f'<button id="react-burger-menu-btn" type="button" onclick="{OPEN_MENU_SCRIPT}">Open Menu</button></div>'
+        '<div class="bm-menu-wrap" hidden><nav class="bm-item-list">'
+        '<a id="inventory_sidebar_link" class="bm-item menu-item" href="/inventory.html">All Items</a>'
+        '<a id="about_sidebar_link" class="bm-item menu-item" href="https://saucelabs.com/">About</a>'
+        '<a id="logout_sidebar_link" class="bm-item menu-item" href="/logout">Logout</a>'
+        '<a id="reset_sidebar_link" class="bm-item menu-item" href="/reset">Reset App State</a>'
+        "</nav>"
+        f'<button id="react-burger-cross-btn" type="button" onclick="{CLOSE_MENU_SCRIPT}">Close Menu</button>'
+        "</div></div></div>"
+        '<div class="header_label"><div class="app_logo">Swag Labs</div></div>'
+        '<div id="shopping_cart_container" class="shopping_cart_container">'
+        f'<a class="shopping_cart_link" href="/cart.html">{badge}</a></div>'
+        f'<div class="header_secondary_container"><span class="title">{escape(title)}</span></div>'
+        f"{error_dialog}"
+    )
+
+
+def _cart_button(product, cart, next_path):
+    """Add to cart or Remove button of a product. Buttons submit a form to the server like the React app changes
+    the cart in local storage"""
+    if product.id in cart:
+        action, button = "remove", (
+            f'<button type="submit" class="btn btn_secondary btn_small btn_inventory" '
+            f'data-test="remove-{escape(product.slug)}" id="remove-{escape(product.slug)}" '
+            f'name="remove-{escape(product.slug)}">Remove</button>'
+        )
+    else:
+        action, button = "add", (
+            f'<button type="submit" class="btn btn_primary btn_small btn_inventory" '
+            f'data-test="add-to-cart-{escape(product.slug)}" id="add-to-cart-{escape(product.slug)}" '
+            f'name="add-to-cart-{escape(product.slug)}">Add to cart</button>'
+        )
+    return (
+        f'<form method="post" action="/cart/{action}" class="cart_form">'
+        f'<input type="hidden" name="id" value="{product.id}">'
+        f'<input type="hidden" name="next" value="{escape(next_path)}">{button}</form>'
+    )
+
+
+def sort_products(sort):
+    """Return products in order of a sort option value"""
+    if sort == "za":
+        return sorted(SAUCEDEMO_PRODUCTS, key=lambda product: product.name, reverse=True)
+    if sort == "lohi":
+        return sorted(SAUCEDEMO_PRODUCTS, key=lambda product: product.price)
+    if sort == "hilo":
+        return sorted(SAUCEDEMO_PRODUCTS, key=lambda product: product.price, reverse=True)
+    return sorted(SAUCEDEMO_PRODUCTS, key=lambda product: product.name)
+
+
+def inventory_page(cart, sort=DEFAULT_SORT, error=None):
+    """Products list page"""
+    options = "".join(
+        f'<option value="{value}"{" selected" if value == sort else ""}>{escape(text)}</option>'
+        for value, text in SORT_OPTIONS.items()
+    )
+    next_path = f"/inventory.html?sort={sort}"
+    items = []
+    for product in sort_products(sort):
+        link = f"/inventory-item.html?id={product.id}"
+        items.append(
+            '<div class="inventory_item">'
+            f'<div class="inventory_item_img"><a href="{link}" id="item_{product.id}_img_link">'
+            f'<img alt="{escape(product.name)}" class="inventory_item_img" src="/static/img/{product.id}.svg">'
+            "</a></div>"
+            '<div class="inventory_item_description"><div class="inventory_item_label">'
+            f'<a href="{link}" id="item_{product.id}_title_link">'
+            f'<div class="inventory_item_name">{escape(product.name)}</div></a>'
+            f'<div class="inventory_item_desc">{escape(product.description)}</div></div>'
+            f'<div class="pricebar"><div class="inventory_item_price">{product.display_price}</div>'
+            f"{_cart_button(product, cart, next_path)}</div></div></div>"
+        )
+    return _page(
+        "Swag Labs",
+        '<div id="header_container" class="header_container">'
+        f"{_header(cart, 'Products', error)}"
+        '<div class="right_component"><span class="select_container">'
+        f'<span class="active_option">{escape(SORT_OPTIONS.get(sort, SORT_OPTIONS[DEFAULT_SORT]))}</span>'
+        '<form method="get" action="/inventory.html" class="sort_form">'
+        '<select class="product_sort_container" data-test="product_sort_container" name="sort" '
+        f'onchange="this.form.submit()">{options}</select></form></span></div></div>'
+        f'<div id="inventory_container" class="inventory_container"><div class="inventory_list">{"".join(items)}'
+        "</div></div>",
+        page_class="inventory_page",
+    )
+
+
+def inventory_item_page(product, cart, error=None):
+    """Product details page"""
+    return _page(
+        "Swag Labs",
+        f'<div id="header_container" class="header_container">{_header(cart, "", error)}'
+        '<button class="btn btn_secondary back btn_large inventory_details_back_button" data-test="back-to-products" '
+        'id="back-to-products" name="back-to-products" onclick="location.href=\'/inventory.html\'">'
+        "Back to products</button></div>"
+        '<div class="inventory_details"><div class="inventory_details_container">'
+        f'<div class="inventory_details_img_container"><img alt="{escape(product.name)}" '
+        f'class="inventory_details_img" src="/static/img/{product.id}.svg"></div>'
+        '<div class="inventory_details_desc_container">'
+        f'<div class="inventory_details_name large_size">{escape(product.name)}</div>'
+        f'<div class="inventory_details_desc large_size">{escape(product.description)}</div>'
+        f'<div class="inventory_details_price">{product.display_price}</div>'
+        f"{_cart_button(product, cart, f'/inventory-item.html?id={product.id}')}"
+        "</div></div></div>",
+        page_class="inventory_item_page",
+    )
+
+
+def cart_page(cart, error=None):
+    """Shopping cart page"""
+    items = "".join(
+        '<div class="cart_item"><div class="cart_quantity">1</div><div class="cart_item_label">'
+        f'<a href="/inventory-item.html?id={product.id}" id="item_{product.id}_title_link">'
+        f'<div class="inventory_item_name">{escape(product.name)}</div></a>'
+        f'<div class="inventory_item_desc">{escape(product.description)}</div>'
+        f'<div class="item_pricebar"><div class="inventory_item_price">{product.display_price}</div>'
+        f'{_cart_button(product, cart, "/cart.html")}</div></div></div>'
+        for product in (PRODUCTS_BY_ID[product_id] for product_id in cart)
+    )
+    return _page(
+        "Swag Labs",
+        f'<div id="header_container" class="header_container">{_header(cart, "Your Cart", error)}</div>'
+        '<div id="cart_contents_container" class="cart_contents_container"><div class="cart_list">'
+        '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>'
+        f"{items}</div>"
+        '<div class="cart_footer">'
+        '<button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" '
+        "name=\"continue-shopping\" onclick=\"location.href='/inventory.html'\">Continue Shopping</button>"
+        '<form method="get" action="/checkout-step-one.html">'
+        '<button type="submit" class="btn btn_action btn_medium checkout_button" data-test="checkout" '
+        'id="checkout" name="checkout">Checkout</button></form>'
+        "</div></div>",
+        page_class="cart_page",
+    )
+
+
+def checkout_information_page(cart, error=None, first_name="", last_name="", postal_code=""):
+    """First checkout step page with customer information form"""
+    fields = (
+        ("first-name", "firstName", "First Name", first_name),
+        ("last-name", "lastName", "Last Name", last_name),
+        ("postal-code", "postalCode", "Zip/Postal Code", postal_code),
+    )
+    inputs = "".join(
+        f'<div class="form_group"><input class="input_error form_input" placeholder="{placeholder}" type="text" '
+        f'data-test="{field_id}" id="{field_id}" name="{name}" autocorrect="off" autocapitalize="none" '
+        f'value="{escape(value)}"></div>'
+        for field_id, name, placeholder, value in fields
+    )
+    return _page(
+        "Swag Labs",
+        f'<div id="header_container" class="header_container">'
+        f'{_header(cart, "Checkout: Your Information")}</div>'
+        '<div class="checkout_info_container"><div class="checkout_info_wrapper">'
+        '<form method="post" action="/checkout-step-one.html"><div class="checkout_info">'
+        f"{inputs}{_error_container(error)}</div>"
+        '<div class="checkout_buttons">'
+        '<button type="button" class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" '
+        "id=\"cancel\" name=\"cancel\" onclick=\"location.href='/cart.html'\">Cancel</button>"
+        '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" '
+        'id="continue" name="continue" value="Continue"></div></form></div></div>',
+        page_class="checkout_info_page",
+    )
+
+
+def checkout_overview_page(cart):
+    """Second checkout step page with order summary"""
+    products = [PRODUCTS_BY_ID[product_id] for product_id in cart]
+    subtotal = round(sum(product.price for product in products), 2)
+    tax = round(subtotal * TAX_RATE, 2)
+    items = "".join(
+        '<div class="cart_item"><div class="cart_quantity">1</div><div class="cart_item_label">'
+        f'<div class="inventory_item_name">{escape(product.name)}</div>'
+        f'<div class="inventory_item_desc">{escape(product.description)}</div>'
+        f'<div class="item_pricebar"><div class="inventory_item_price">{product.display_price}</div></div>'
+        "</div></div>"
+        for product in products
+    )
+    return _page(
+        "Swag Labs",
+        f'<div id="header_container" class="header_container">{_header(cart, "Checkout: Overview")}</div>'
+        f'<div id="checkout_summary_container" class="checkout_summary_container"><div class="cart_list">{items}'
+        '</div><div class="summary_info">'
+        f'<div class="summary_subtotal_label" data-test="subtotal-label">Item total: ${subtotal:.2f}</div>'
+        f'<div class="summary_tax_label" data-test="tax-label">Tax: ${tax:.2f}</div>'
+        f'<div class="summary_total_label" data-test="total-label">Total: ${subtotal + tax:.2f}</div>'
+        '<div class="cart_footer">'
+        '<button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" '
+        "name=\"cancel\" onclick=\"location.href='/inventory.html'\">Cancel</button>"
+        '<form method="post" action="/checkout-complete.html">'
+        '<button type="submit" class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" '
+        'name="finish">Finish</button></form></div></div></div>',
+        page_class="checkout_overview_page",
+    )
+
+
+def checkout_complete_page(cart):
+    """Page shown after an order is finished"""
+    return _page(
+        "Swag Labs",
+        f'<div id="header_container" class="header_container">{_header(cart, "Checkout: Complete!")}</div>'
+        '<div id="checkout_complete_container" class="checkout_complete_container">'
+        '<h2 class="complete-header">Thank you for your order!</h2>'
+        '<div class="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get '
+        "there!</div>"
+        '<form method="get" action="/inventory.html">'
+        '<button type="submit" class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" '
+        'name="back-to-products">Back Home</button></form></div>',
+        page_class="checkout_complete_page",
+    )
+
+
+def product_image(product):
+    """SVG image of a product"""
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="120" height="120" viewBox="0 0 120 120">'
+        '<rect width="120" height="120" fill="#e2e2e2"/>'
+        f'<text x="60" y="64" font-size="10" text-anchor="middle">{escape(product.name[:20])}</text></svg>'
+    )
@@ -0,0 +1,334 @@
+""" Stand-in Saucedemo Server
+
+Local HTTP server serving a static copy of Saucedemo pages, built on the standard library only. Tests, SaucedemoUtils
+and the benchmarks can run against it offline and without the latency of the real host e.g
+
+    saucedemo-tests serve --port 8000
+    saucedemo-tests run-tests --url http://127.0.0.1:8000 --username standard_user --password secret_sauce
+
+Cart and login state are kept per session cookie in the server. Artificial latency can be added to every response to
+mimic a remote host.
+"""
+import random
+import secrets
+import threading
+import time
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from saucedemo_selenium_lib.standin import pages
+
+PASSWORD = "secret_sauce"
+USERS = (
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+)
+LOCKED_OUT_USER = "locked_out_user"
+# Adding these products to the cart fails with an error dialog for error_user
+ERROR_USER = "error_user"
+ERROR_USER_FAILING_PRODUCTS = (1, 5, 3)
+# Login of performance_glitch_user is delayed like on Saucedemo
+PERFORMANCE_GLITCH_USER = "performance_glitch_user"
+PERFORMANCE_GLITCH_DELAY = 2.0
+SESSION_COOKIE = "session-username"
+
+# Pages that can only be opened by logged users
+PROTECTED_PAGES = (
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+)
+
+
+class StandinSession:
+    """State of a logged user"""
+
+    def __init__(self, username):
+        self.username = username
+        self.cart = []
+        self.error = None
+
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    """Serve stand-in pages. Server of the handler is a StandinHTTPServer"""
+
+    server_version = "SaucedemoStandin/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, body, status=HTTPStatus.OK, content_type="text/html; charset=utf-8", headers=None):
+        body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _redirect(self, location, headers=None):
+        self.send_response(HTTPStatus.SEE_OTHER)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _get_session_id(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _get_session(self):
+        return self.server.sessions.get(self._get_session_id())
+
+    def _read_form(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode(), keep_blank_values=True)
+        return {name: values[-1] for name, values in form.items()}
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        self.server.delay()
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        path = url.path
+
+        if path in ("/", "/index.html"):
+            self._send(pages.login_page())
+            return
+        if path.startswith("/static/img/"):
+            product = self._get_product(path.rsplit("/", 1)[-1].split(".")[0])
+            if product is None:
+                self._send("Not Found", status=HTTPStatus.NOT_FOUND, content_type="text/plain")
+            else:
+                self._send(pages.product_image(product), content_type="image/svg+xml")
+            return
+        if path == "/logout":
+            self.server.sessions.pop(self._get_session_id(), None)
+            self._redirect("/", headers={"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+            return
+
+        if path not in PROTECTED_PAGES and path != "/reset":
+            self._send("Not Found", status=HTTPStatus.NOT_FOUND, content_type="text/plain")
+            return
+        session = self._get_session()
+        if session is None:
+            self._send(pages.login_page(error=f"Epic sadface: You can only access '{path}' when you are logged in."))
+            return
+        if path == "/reset":
+            # Reset App State empties the cart and keeps the current page
+            session.cart.clear()
+            self._redirect(self._get_referer_path() or "/inventory.html")
+            return
+
+        # Error dialog is shown once on the page following the failed action
+        error = session.error
+        session.error = None
+        if path == "/inventory.html":
+            sort = query.get("sort", pages.DEFAULT_SORT)
+            if sort not in pages.SORT_OPTIONS:
+                sort = pages.DEFAULT_SORT
+            self._send(pages.inventory_page(session.cart, sort=sort, error=error))
+        elif path == "/inventory-item.html":
+            product = self._get_product(query.get("id"))
+            if product is None:
+                self._send("Not Found", status=HTTPStatus.NOT_FOUND, content_type="text/plain")
+            else:
+                self._send(pages.inventory_item_page(product, session.cart, error=error))
+        elif path == "/cart.html":
+            self._send(pages.cart_page(session.cart, error=error))
+        elif path == "/checkout-step-one.html":
+            self._send(pages.checkout_information_page(session.cart))
+        elif path == "/checkout-step-two.html":
+            self._send(pages.checkout_overview_page(session.cart))
+        else:
+            self._send(pages.checkout_complete_page(session.cart))
+
+    def do_POST(self):
+        self.server.delay()
+        path = urlsplit(self.path).path
+        form = self._read_form()
+        if path == "/":
+            self._login(form)
+            return
+
+        session = self._get_session()
+        if session is None:
+            self._send(pages.login_page(error=f"Epic sadface: You can only access '{path}' when you are logged in."))
+            return
+        if path in ("/cart/add", "/cart/remove"):
+            self._update_cart(session, path.rsplit("/", 1)[-1], form)
+        elif path == "/checkout-step-one.html":
+            error = None
+            if not form.get("firstName"):
+                error = "Error: First Name is required"
+            elif not form.get("lastName"):
+                error = "Error: Last Name is required"
+            elif not form.get("postalCode"):
+                error = "Error: Postal Code is required"
+            if error:
+                self._send(
+                    pages.checkout_information_page(
+                        session.cart,
+                        error=error,
+                        first_name=form.get("firstName", ""),
+                        last_name=form.get("lastName", ""),
+                        postal_code=form.get("postalCode", ""),
+                    )
+                )
+            else:
+                self._redirect("/checkout-step-two.html")
+        elif path == "/checkout-complete.html":
+            session.cart.clear()
+            self._send(pages.checkout_complete_page(session.cart))
+        else:
+            self._send("Not Found", status=HTTPStatus.NOT_FOUND, content_type="text/plain")
+
+    def _login(self, form):
+        username = form.get("user-name", "")
+        password = form.get("password", "")
+        error = None
+        if not username:
+            error = "Epic sadface: Username is required"
+        elif not password:
+            error = "Epic sadface: Password is required"
+        elif username not in USERS or password != PASSWORD:
+            error = "Epic sadface: Username and password do not match any user in this service"
+        elif username == LOCKED_OUT_USER:
+            error = "Epic sadface: Sorry, this user has been locked out."
+        if error:
+            self._send(pages.login_page(error=error, username=username))
+            return
+        if username == PERFORMANCE_GLITCH_USER:
+            time.sleep(PERFORMANCE_GLITCH_DELAY)
+        session_id = secrets.token_hex(16)
+        self.server.sessions[session_id] = StandinSession(username)
+        self._redirect("/inventory.html", headers={"Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/"})
+
+    def _update_cart(self, session, action, form):
+        product = self._get_product(form.get("id"))
+        if product is not None:
+            if action == "add" and product.id not in session.cart:
+                if session.username == ERROR_USER and product.id in ERROR_USER_FAILING_PRODUCTS:
+                    session.error = "Failed to add item to the cart."
+                else:
+                    session.cart.append(product.id)
+            elif action == "remove" and product.id in session.cart:
+                session.cart.remove(product.id)
+        next_path = form.get("next", "")
+        # Only redirect to pages of this server
+        self._redirect(next_path if next_path.startswith("/") else "/inventory.html")
+
+    def _get_referer_path(self):
+        referer = self.headers.get("Referer")
+        if not referer:
+            return None
+        url = urlsplit(referer)
+        return f"{url.path}?{url.query}" if url.query else url.path
+
+    @staticmethod
+    def _get_product(product_id):
+        try:
+            return pages.PRODUCTS_BY_ID.get(int(product_id))
+        except (TypeError, ValueError):
+            return None
+
+
+class StandinHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server with sessions of the stand-in Saucedemo"""
+
+    daemon_threads = True
+
+    def __init__(self, server_address, latency=0.0, latency_jitter=0.0, verbose=False):
+        super().__init__(server_address, StandinRequestHandler)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.verbose = verbose
+        self.sessions = {}
+
+    def delay(self):
+        """Sleep for the configured artificial latency"""
+        latency = self.latency
+        if self.latency_jitter:
+            latency += random.uniform(0, self.latency_jitter)
+        if latency > 0:
+            time.sleep(latency)
+
+
+class StandinServer:
+    """Run stand-in Saucedemo server in a background thread
+
+    Example:
+
+        with StandinServer(latency=0.05) as server:
+            saucedemo_utils = SaucedemoUtils(server.url, "standard_user", "secret_sauce")
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on. A free port is picked if it is 0
+        latency: Seconds every response is delayed
+        latency_jitter: Maximum random seconds added to latency of a response
+        verbose: Log requests to stderr
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, latency_jitter=0.0, verbose=False):
+        self._httpd = StandinHTTPServer(
+            (host, port), latency=latency, latency_jitter=latency_jitter, verbose=verbose
+        )
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def latency(self):
+        return self._httpd.latency
+
+    @latency.setter
+    def latency(self, latency):
+        self._httpd.latency = latency
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the current thread until interrupted"""
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
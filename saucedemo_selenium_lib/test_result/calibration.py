@@ -0,0 +1,236 @@
+""" Number Of Processes Calibration
+
+Pick number of parallel test processes from measured browser footprint. A short calibration launches a few browser
+sessions with the same options as SaucedemoUtils, loads the target webapp in them and measures memory(RSS) and CPU
+used by each browser and its child processes. Number of processes is then chosen from available cores and memory.
+Measured footprint is cached per machine, browser and headless mode, so later runs skip the calibration.
+
+psutil is used for measurements if it is installed, otherwise /proc is read(Linux only).
+"""
+import json
+import os
+import socket
+import time
+
+CALIBRATION_FILE_NAME = "num-procs-calibration.json"
+# Calibrations older than this are run again, browser versions and machine load change over time
+CALIBRATION_MAX_AGE = 7 * 24 * 3600
+DEFAULT_NUM_PROCESSES = 5
+# Share of available memory and cores the tests may use
+MEMORY_HEADROOM = 0.8
+CPU_HEADROOM = 0.9
+# Lower bound of CPU used by a test process. A browser is mostly idle between page loads while it is measured
+MIN_CPU_PER_PROCESS = 0.25
+
+try:
+    import psutil
+
+    _PROCESS_ERRORS = (OSError, ValueError, psutil.Error)
+except ImportError:
+    psutil = None
+    _PROCESS_ERRORS = (OSError, ValueError)
+
+
+def _get_proc_children():
+    """Return dict of pids and their child pids read from /proc"""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as file:
+                stat = file.read()
+        except OSError:
+            continue
+        # Process name in stat can contain spaces, fields after it are space separated
+        ppid = int(stat[stat.rfind(")") + 2 :].split()[1])
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+
+def get_process_tree(pid):
+    """Return pid and pids of all descendants of a process"""
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            return [pid] + [child.pid for child in process.children(recursive=True)]
+        except psutil.NoSuchProcess:
+            return []
+    children = _get_proc_children()
+    pids = [pid]
+    for current in pids:
+        pids.extend(children.get(current, []))
+    return pids
+
+
+def get_processes_usage(pids):
+    """Return (total RSS in bytes, total CPU time in seconds) of processes. Processes that exited are ignored"""
+    rss, cpu_time = 0, 0.0
+    for pid in pids:
+        try:
+            if psutil is not None:
+                process = psutil.Process(pid)
+                rss += process.memory_info().rss
+                times = process.cpu_times()
+                cpu_time += times.user + times.system
+            else:
+                with open(f"/proc/{pid}/statm") as file:
+                    rss += int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+                with open(f"/proc/{pid}/stat") as file:
+                    stat = file.read()
+                fields = stat[stat.rfind(")") + 2 :].split()
+                # utime and stime are 14th and 15th fields of stat, in clock ticks
+                cpu_time += (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except _PROCESS_ERRORS:
+            continue
+    return rss, cpu_time
+
+
+def get_available_memory():
+    """Return available memory in bytes. None if it can not be read"""
+    if psutil is not None:
+        return psutil.virtual_memory().available
+    try:
+        with open("/proc/meminfo") as file:
+            for line in file:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def get_available_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_num_processes(footprint, available_memory=None, available_cores=None):
+    """Return number of test processes that fit in available cores and memory
+
+    Args:
+        footprint: Dict with 'rss' in bytes and 'cpu' in cores used by a test process i.e its browser and pytest
+                   worker
+        available_memory: Available memory in bytes. Default is currently available memory
+        available_cores: Default is number of cores the process can run on
+    """
+    available_cores = available_cores or get_available_cores()
+    available_memory = available_memory or get_available_memory()
+    num_processes = int(available_cores * CPU_HEADROOM / max(footprint["cpu"], MIN_CPU_PER_PROCESS))
+    if available_memory is not None and footprint["rss"]:
+        num_processes = min(num_processes, int(available_memory * MEMORY_HEADROOM / footprint["rss"]))
+    return max(num_processes, 1)
+
+
+def _get_browser_pids(saucedemo_utils):
+    """Return pids of the browser of a session. Remote and simulated drivers have no local browser process"""
+    process = getattr(getattr(saucedemo_utils.driver, "service", None), "process", None)
+    return get_process_tree(process.pid) if process is not None else []
+
+
+def measure_browser_footprint(host_url, browser="chrome", headless=True, sessions=2, page_loads=3, output_path=""):
+    """Launch browser sessions with SaucedemoUtils options and measure their footprint
+
+    Args:
+        host_url: Url loaded in the sessions. about:blank is used if it is None
+        browser: 'chrome', 'firefox' or 'simulated'
+        headless: Run browsers in headless mode
+        sessions: Number of sessions launched at the same time
+        page_loads: Number of times each session loads host_url while CPU is measured
+        output_path: Dir of calibration log file
+
+    Returns:
+        dict with 'rss' in bytes and 'cpu' in cores used by one session and its pytest worker
+    """
+    from saucedemo_selenium_lib.data_models import WebBrowsers
+    from saucedemo_selenium_lib.saucedemo_utils.saucedemo_utils import SaucedemoUtils
+
+    utils = []
+    try:
+        for _ in range(sessions):
+            saucedemo_utils = SaucedemoUtils(
+                host_url,
+                headless=headless,
+                output_path=output_path,
+                log_file="num-procs-calibration",
+                browser=WebBrowsers(browser),
+            )
+            saucedemo_utils._setup_web_driver()
+            utils.append(saucedemo_utils)
+
+        pids = []
+        for saucedemo_utils in utils:
+            pids.extend(_get_browser_pids(saucedemo_utils))
+        _, start_cpu_time = get_processes_usage(pids)
+        start_time = time.time()
+        for _ in range(page_loads):
+            for saucedemo_utils in utils:
+                saucedemo_utils.driver.get(host_url or "about:blank")
+        elapsed = time.time() - start_time
+        # Browsers start renderer processes when pages are loaded
+        pids = []
+        for saucedemo_utils in utils:
+            pids.extend(_get_browser_pids(saucedemo_utils))
+        rss, cpu_time = get_processes_usage(pids)
+    finally:
+        for saucedemo_utils in utils:
+            saucedemo_utils.close_browser()
+
+    # Memory of a pytest worker is about the same as of this process
+    worker_rss, _ = get_processes_usage([os.getpid()])
+    return {
+        "rss": rss / sessions + worker_rss,
+        # Processes that exited during the measurement can make the difference negative
+        "cpu": max(cpu_time - start_cpu_time, 0.0) / elapsed / sessions if elapsed > 0 else 0.0,
+    }
+
+
+def get_calibration_key(browser, headless):
+    return f"{socket.gethostname()}:{browser}:{'headless' if headless else 'headed'}"
+
+
+def _load_calibrations(calibration_file):
+    try:
+        with open(calibration_file) as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def get_auto_num_processes(output_path, host_url=None, browser="chrome", headless=True, grid=None, measure=True):
+    """Return number of processes for this machine. Browser footprint is measured if it is not cached
+
+    Browsers of grid runs do not run on this machine, DEFAULT_NUM_PROCESSES is returned for them.
+
+    Args:
+        measure: Measure browser footprint if it is not cached or is outdated. If False, no browser is launched, an
+                 outdated footprint is used and None is returned if none is cached
+    """
+    if grid is not None:
+        print(f"Browsers run on grid, number of processes can not be calibrated. Using {DEFAULT_NUM_PROCESSES}")
+        return DEFAULT_NUM_PROCESSES
+
+    calibration_file = os.path.join(output_path, CALIBRATION_FILE_NAME)
+    calibrations = _load_calibrations(calibration_file)
+    key = get_calibration_key(browser, headless)
+    footprint = calibrations.get(key)
+    if not measure:
+        if footprint is None:
+            return None
+    elif footprint is None or time.time() - footprint["measured_at"] > CALIBRATION_MAX_AGE:
+        print(f"Measuring {browser} footprint to pick number of processes")
+        footprint = measure_browser_footprint(host_url, browser=browser, headless=headless, output_path=output_path)
+        footprint["measured_at"] = time.time()
+        calibrations[key] = footprint
+        os.makedirs(output_path, exist_ok=True)
+        with open(calibration_file, "w") as file:
+            json.dump(calibrations, file, indent=2)
+
+    num_processes = get_num_processes(footprint)
+    print(
+        f"Browser session uses {footprint['rss'] / 1024 ** 2:.0f} MB and {footprint['cpu']:.2f} cores. "
+        f"Number of processes: {num_processes}"
+    )
+    return num_processes
@@ -1,17 +1,25 @@
 """ TEST RESULT CLI
 Command Interface for running tests
 
+Runner, parsers and results history are imported in the commands that use them, so that listing commands and
+--help do not import pytest, lxml and openpyxl.
 """
+import contextlib
+import json
 import os
+import sys
 import time
 from typing import Dict
 
 import click
 from pathlib import Path
 
-from saucedemo_selenium_lib.test_result.runner import SaucedemoTestRunner, SaucedemoPipelineTestRunner
+from saucedemo_selenium_lib.config import TestConfig, HOST_POOL_STRATEGIES, ROUND_ROBIN
+from saucedemo_selenium_lib.data_models import WebBrowsers, PageLoadStrategies
+from saucedemo_selenium_lib.test_result.history import ResultsHistory, get_default_history_db_path
 
 LIB_BASE_PATH = os.path.abspath(os.path.join(__file__, "../../../"))
+AUTO_NUM_PROCS = "auto"
 
 
 def print_targets(targets: Dict):
@@ -23,6 +31,20 @@ def print_targets(targets: Dict):
         click.echo(f"{index}            {target}")
 
 
+class NumProcsType(click.ParamType):
+    """Number of processes or 'auto'"""
+
+    name = "integer|auto"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int) or value == AUTO_NUM_PROCS:
+            return value
+        try:
+            return int(value)
+        except ValueError:
+            self.fail(f"{value!r} is neither a number nor '{AUTO_NUM_PROCS}'", param, ctx)
+
+
 def get_targets(targets_path):
     """Get dir banes of all targets in targets_path"""
     p = Path(targets_path)
@@ -36,6 +58,81 @@ def get_targets(targets_path):
     return targets
 
 
+@click.option(
+    "--fast-profile",
+    is_flag=True,
+    help="Start local browsers from clones of a minimal profile built once per worker, with first run setup and "
+    "background services disabled, so they launch faster. You can set 'FAST_PROFILE=1' envar instead",
+)
+@click.option(
+    "--block-resources",
+    help="Comma separated resource types('images', 'fonts', 'analytics') and URL patterns e.g '*.png' browsers do not "
+    "load. URL patterns are only blocked in local Chrome. You can set 'BLOCK_RESOURCES' envar instead",
+    default=None,
+)
+@click.option(
+    "--page-load-strategy",
+    help="When navigation of the browser returns. With 'eager' and 'none' pages are used as soon as they are ready, "
+    "before images and other assets are loaded. You can set 'PAGE_LOAD_STRATEGY' envar instead",
+    default=None,
+    type=click.Choice(PageLoadStrategies.get_public_attribute_values()),
+)
+@click.option(
+    "--profile-locators",
+    is_flag=True,
+    help="Measure how long the browser takes to evaluate each locator the tests use, on the page it is used on. The "
+    "most expensive locators are printed at the end and saved to 'locator-costs.json' in output dir",
+)
+@click.option(
+    "--adaptive-timeouts",
+    is_flag=True,
+    help="Derive timeouts of waits for elements from wait latencies of previous runs, with the fixed timeouts as "
+    "upper bounds, so failing waits surface in seconds. You can set 'ADAPTIVE_TIMEOUTS=1' envar instead",
+)
+@click.option(
+    "--plan-output",
+    help="File the plan is written to in plan mode. Default is stdout",
+    default=None,
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--plan",
+    is_flag=True,
+    help="Do not run tests. Collect tests of the targets(all targets if no target is given) and print number of tests "
+    "and estimated wall time for --num-procs, based on mean test durations in results history, as JSON",
+)
+@click.option(
+    "--host-pool-strategy",
+    help="How xdist workers are assigned to hosts of the pool. 'least-loaded' gives hosts with higher "
+    "'max_workers' more workers",
+    default=ROUND_ROBIN,
+    type=click.Choice(HOST_POOL_STRATEGIES),
+    show_default=True,
+)
+@click.option(
+    "--host-pool",
+    help="Comma separated indexes of hosts in config file e.g '0,1,2' or 'all'. Workers are spread across the hosts "
+    "and a host is not given more workers than its 'max_workers' in the config file. You can set 'HOST_POOL' envar "
+    "to avoid setting it in every run",
+    default=lambda: os.environ.get("HOST_POOL"),
+)
+@click.option(
+    "--progress",
+    is_flag=True,
+    help="Print throughput, workers utilization, failures and ETA while a target is tested. Progress is also "
+    "written as JSON lines to '<target>-progress.jsonl' in output dir",
+)
+@click.option(
+    "--no-history",
+    is_flag=True,
+    help="Do not add results of the run to results history database",
+)
+@click.option(
+    "--history-db",
+    help="Path of SQLite results history database. Default is 'results-history.sqlite3' in output dir",
+    default=None,
+    type=click.Path(dir_okay=False),
+)
 @click.option(
     "--load-scope",
     is_flag=True,
@@ -53,12 +150,27 @@ def get_targets(targets_path):
 @click.option(
     "--num-procs",
     help="Number of processes to run run tests in parallel. You can set 'NUM_PROCS' envar once to your own designed "
-    "number of processes",
-    default=lambda: int(os.environ.get("NUM_PROCS", 5)),
-    type=int,
+    "number of processes. 'auto' picks number of processes from available cores and memory and the footprint of a "
+    "browser session, measured once per machine and browser and cached in output dir",
+    default=lambda: os.environ.get("NUM_PROCS", "5"),
+    type=NumProcsType(),
     show_default=True,
 )
 @click.option("--run-all", is_flag=True, help="Run all tests")
+@click.option(
+    "--rerun-failed",
+    is_flag=True,
+    help="Run only tests that failed in the previous run of each target. Failed tests are saved in "
+    "'<target>-failed.json' in the output dir after every run",
+)
+@click.option(
+    "--retries",
+    help="Number of times a failing test is retried in the same worker(reusing its browser session) before it "
+    "is reported as failed. Tests that pass after a retry are marked as flaky",
+    default=0,
+    type=int,
+    show_default=True,
+)
 @click.option(
     "--headless",
     default=1,
@@ -122,6 +234,20 @@ def run_tests(
     browser,
     load_scope,
     grid,
+    rerun_failed=False,
+    retries=0,
+    history_db=None,
+    no_history=False,
+    progress=False,
+    host_pool=None,
+    host_pool_strategy=ROUND_ROBIN,
+    plan=False,
+    plan_output=None,
+    adaptive_timeouts=False,
+    profile_locators=False,
+    page_load_strategy=None,
+    block_resources=None,
+    fast_profile=False,
     url=None,
     username=None,
     password=None,
@@ -138,6 +264,89 @@ def run_tests(
 
 
     """
+    start_time = time.time()
+    # In plan mode stdout is kept for the plan JSON, messages of the runner and pytest collection go to stderr
+    with contextlib.redirect_stdout(sys.stderr) if plan else contextlib.nullcontext():
+        test_runner = _create_test_runner(
+            test_results_path,
+            target,
+            run_all or plan,
+            host_index,
+            headless,
+            num_procs,
+            browser,
+            load_scope,
+            grid,
+            rerun_failed=rerun_failed,
+            retries=retries,
+            history_db=history_db,
+            no_history=no_history,
+            progress=progress,
+            host_pool=host_pool,
+            host_pool_strategy=host_pool_strategy,
+            adaptive_timeouts=adaptive_timeouts,
+            profile_locators=profile_locators,
+            page_load_strategy=page_load_strategy,
+            block_resources=block_resources,
+            fast_profile=fast_profile,
+            plan=plan,
+            url=url,
+            username=username,
+            password=password,
+        )
+        if plan:
+            run_plan = test_runner.plan()
+    if plan:
+        if plan_output:
+            with open(plan_output, "w") as file:
+                json.dump(run_plan, file, indent=2)
+        else:
+            click.echo(json.dumps(run_plan, indent=2))
+        return
+
+    test_runner.run()
+
+    print(f"--- duration {(time.time() - start_time) / 3600} Hours ---")
+
+
+def _create_test_runner(
+    test_results_path,
+    target,
+    run_all,
+    host_index,
+    headless,
+    num_procs,
+    browser,
+    load_scope,
+    grid,
+    rerun_failed=False,
+    retries=0,
+    history_db=None,
+    no_history=False,
+    progress=False,
+    host_pool=None,
+    host_pool_strategy=ROUND_ROBIN,
+    adaptive_timeouts=False,
+    profile_locators=False,
+    page_load_strategy=None,
+    block_resources=None,
+    fast_profile=False,
+    plan=False,
+    url=None,
+    username=None,
+    password=None,
+):
+    """Create tests runner of run_tests command. Targets are chosen interactively if no target is given and run_all
+    is not set. In plan mode no browser is launched to calibrate 'auto' number of processes"""
+    from saucedemo_selenium_lib.test_result.runner import SaucedemoTestRunner, SaucedemoPipelineTestRunner
+
+    is_pipeline_run = url is not None and username is not None and password is not None
+    if is_pipeline_run and host_pool:
+        # Tests of a pipeline run are all run against --url
+        raise click.UsageError(
+            "--host-pool(or 'HOST_POOL' envar) can not be used with --url, --username and --password"
+        )
+
     click.echo(f"Running tests for Base Path:- {Path(test_results_path).name}")
 
     click.echo(target)
@@ -161,10 +370,31 @@ def run_tests(
         targets_to_run = [targets[index]]
     click.echo(f"Running tests for target: {targets_to_run}")
 
-    start_time = time.time()
     output_path = os.path.join(test_results_path, "output")
+    if num_procs == AUTO_NUM_PROCS:
+        from saucedemo_selenium_lib.test_result.calibration import get_auto_num_processes, DEFAULT_NUM_PROCESSES
 
-    if url is not None and username is not None and password is not None:
+        if url is None and not plan:
+            try:
+                url = TestConfig(host_index=host_index).host_url
+            except Exception:
+                # Calibration loads about:blank if the host is not configured
+                pass
+        num_procs = get_auto_num_processes(
+            output_path, host_url=url, browser=browser, headless=bool(int(headless)), grid=grid, measure=not plan
+        )
+        if num_procs is None:
+            num_procs = DEFAULT_NUM_PROCESSES
+            click.echo(
+                f"Browser footprint is not calibrated yet, plan uses {num_procs} processes. Runs with "
+                f"--num-procs {AUTO_NUM_PROCS} measure it"
+            )
+    if no_history:
+        history_db = None
+    elif history_db is None:
+        history_db = get_default_history_db_path(output_path)
+
+    if is_pipeline_run:
         click.echo(f"Running tests using SaucedemoPipelineTestRunner")
         test_runner = SaucedemoPipelineTestRunner(
             targets_path,
@@ -178,9 +408,22 @@ def run_tests(
             load_scope_targets=load_scope_targets,
             browser=browser,
             grid=grid,
+            rerun_failed=rerun_failed,
+            retries=retries,
+            history_db=history_db,
+            show_progress=progress,
+            adaptive_timeouts=adaptive_timeouts,
+            profile_locators=profile_locators,
+            page_load_strategy=page_load_strategy,
+            block_resources=block_resources,
+            fast_profile=fast_profile,
         )
     else:
         click.echo(f"Running tests using SaucedemoTestRunner")
+        if host_pool == "all":
+            host_pool = list(range(len(TestConfig().hosts)))
+        elif host_pool:
+            host_pool = [int(index) for index in host_pool.split(",")]
         test_runner = SaucedemoTestRunner(
             targets_path,
             targets_to_run,
@@ -191,8 +434,358 @@ def run_tests(
             load_scope_targets=load_scope_targets,
             browser=browser,
             grid=grid,
+            rerun_failed=rerun_failed,
+            retries=retries,
+            history_db=history_db,
+            show_progress=progress,
+            host_pool=host_pool,
+            host_pool_strategy=host_pool_strategy,
+            adaptive_timeouts=adaptive_timeouts,
+            profile_locators=profile_locators,
+            page_load_strategy=page_load_strategy,
+            block_resources=block_resources,
+            fast_profile=fast_profile,
         )
+    return test_runner
 
-    test_runner.run()
 
-    print(f"--- duration {(time.time() - start_time) / 3600} Hours ---")
+@click.option(
+    "--processes",
+    help="Number of processes used to parse reports. Default is number of CPUs",
+    default=None,
+    type=int,
+)
+@click.option(
+    "--file-name-phrase",
+    help="Phrase added to the results table file name i.e table-test-results-<phrase>.xlsx",
+    default="all",
+    show_default=True,
+)
+@click.option(
+    "--reports-path",
+    default=os.path.join(Path(LIB_BASE_PATH).parent, "output"),
+    type=click.Path(exists=True),
+    help="Dir with '<target>-report.xml' or '<target>-report.html' reports e.g output dir of a previous run",
+    show_default=True,
+)
+@click.command()
+def create_results_table(reports_path, file_name_phrase, processes):
+    """Command for creating results table from reports of a previous run
+
+    Reports are parsed in parallel and parsed results are cached in the reports dir, so only new or changed reports
+    are parsed when the command is run again.
+    """
+    from saucedemo_selenium_lib.test_result.loader import load_results_from_directory
+    from saucedemo_selenium_lib.test_result.results import StreamingResultsTableCreator
+
+    start_time = time.time()
+    results = load_results_from_directory(reports_path, processes=processes)
+    click.echo(f"Loaded results of {len(results)} targets in {time.time() - start_time:.2f} seconds")
+    result_table_creator = StreamingResultsTableCreator(reports_path, file_name_phrase=file_name_phrase)
+    for target_results in results:
+        result_table_creator.add_target_results(target_results)
+    result_table_creator.save()
+
+
+def print_rows(rows):
+    """Print list of dicts as a table"""
+    if not rows:
+        click.echo("No results")
+        return
+    columns = list(rows[0].keys())
+    widths = [max(len(str(column)), *(len(str(row[column])) for row in rows)) for column in columns]
+    click.echo("  ".join(str(column).ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        click.echo("  ".join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+history_db_option = click.option(
+    "--history-db",
+    default=get_default_history_db_path(os.path.join(Path(LIB_BASE_PATH).parent, "output")),
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path of SQLite results history database",
+    show_default=True,
+)
+
+
+@click.group()
+def history():
+    """Query test results history of previous runs"""
+
+
+@click.option("--days", default=30, type=int, show_default=True, help="Number of days of the trend")
+@click.option("--name", default=None, help="Test name. SQL LIKE patterns e.g 'login%' are supported")
+@click.option("--test-case", default=None, help="Test case name")
+@click.option("--target", default=None, help="Target name")
+@history_db_option
+@history.command()
+def trend(history_db, target, test_case, name, days):
+    """Daily pass rate of tests"""
+    results_history = ResultsHistory(history_db)
+    print_rows(results_history.get_pass_rate_trend(target, test_case, name, days=days))
+    results_history.close()
+
+
+@click.option("--min-runs", default=5, type=int, show_default=True, help="Minimum number of runs of a test")
+@click.option("--limit", default=10, type=int, show_default=True, help="Number of tests")
+@history_db_option
+@history.command()
+def flaky(history_db, limit, min_runs):
+    """Tests with highest flakiness score"""
+    results_history = ResultsHistory(history_db)
+    print_rows(results_history.get_flaky_tests(limit=limit, min_runs=min_runs))
+    results_history.close()
+
+
+@click.option("--limit", default=10, type=int, show_default=True, help="Number of tests")
+@history_db_option
+@history.command()
+def slowest(history_db, limit):
+    """Tests with highest mean duration"""
+    results_history = ResultsHistory(history_db)
+    print_rows(results_history.get_slowest_tests(limit=limit))
+    results_history.close()
+
+
+@click.option("--days", default=30, type=int, show_default=True, help="Number of days")
+@history_db_option
+@history.command()
+def hosts(history_db, days):
+    """Pass rate and mean test duration of each host of host pool runs"""
+    results_history = ResultsHistory(history_db)
+    print_rows(results_history.get_host_pass_rates(days=days))
+    results_history.close()
+
+
+@click.option("--host", default=None, help="Only show latencies of this host e.g '127.0.0.1:8000'")
+@click.option(
+    "--stats-path",
+    default=os.path.join(Path(LIB_BASE_PATH).parent, "output", "wait-latencies"),
+    type=click.Path(file_okay=False),
+    help="Dir of wait latencies files i.e 'wait-latencies' in output dir of the tests",
+    show_default=True,
+)
+@click.command()
+def wait_latencies(stats_path, host):
+    """Recorded wait latencies of locators and adaptive timeouts derived from them
+
+    Timeouts are before they are capped by the fixed timeout of each wait. '-' means the locator and its host do not
+    have enough samples and the fixed timeout is used.
+    """
+    from saucedemo_selenium_lib.saucedemo_utils.wait_timeouts import (
+        load_wait_latencies,
+        get_adaptive_timeout,
+        percentile,
+    )
+
+    rows = []
+    for latencies_host, locators in load_wait_latencies(stats_path).items():
+        if host is not None and latencies_host != host:
+            continue
+        host_samples = [latency for samples in locators.values() for latency in samples]
+        for locator, samples in sorted(locators.items(), key=lambda item: -percentile(item[1], 99)):
+            timeout = get_adaptive_timeout(samples, host_samples, float("inf"))
+            rows.append(
+                {
+                    "host": latencies_host,
+                    "locator": locator,
+                    "samples": len(samples),
+                    "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                    "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                    "adaptive_timeout_s": round(timeout, 2) if timeout != float("inf") else "-",
+                }
+            )
+    print_rows(rows)
+
+
+@click.option("--top", default=10, type=int, show_default=True, help="Number of locators")
+@click.option(
+    "--stats-path",
+    default=os.path.join(Path(LIB_BASE_PATH).parent, "output", "locator-costs"),
+    type=click.Path(file_okay=False),
+    help="Dir of locator costs files i.e 'locator-costs' in output dir of a run with --profile-locators",
+    show_default=True,
+)
+@click.option("--registry", is_flag=True, help="List registered locators and the selectors they are compiled to")
+@click.command()
+def locator_costs(stats_path, top, registry):
+    """Most expensive locators of a run by evaluation cost in the browser times uses"""
+    if registry:
+        from saucedemo_selenium_lib.locators.common import CommonLocators  # registers the library locators
+        from saucedemo_selenium_lib.locators.registry import LOCATORS
+
+        print_rows(
+            [
+                {
+                    "name": template.name,
+                    "source": template.source[1],
+                    "compiled": template.compiled[1] if template.is_compiled_to_css else "-",
+                }
+                for template in LOCATORS
+            ]
+        )
+        return
+    from saucedemo_selenium_lib.saucedemo_utils.locator_profiler import (
+        load_locator_costs,
+        get_most_expensive_locators,
+    )
+
+    print_rows(get_most_expensive_locators(load_locator_costs(stats_path), top=top))
+
+
+@click.option("--runs", default=5, type=int, show_default=True, help="Number of times each module is imported")
+@click.command()
+def benchmark_imports(runs):
+    """Check import time of the CLI, pytest plugin and SaucedemoUtils against their budgets
+
+    Exits with status 1 if a module exceeds its budget or imports a dependency it should import lazily.
+    """
+    from saucedemo_selenium_lib.benchmarks.import_time import run_import_benchmark
+
+    results = run_import_benchmark(runs=runs)
+    print_rows(results)
+    if not all(result["ok"] for result in results):
+        raise SystemExit(1)
+
+
+@click.option(
+    "--min-delta-ms",
+    help="Smallest increase of p50 duration in ms counted as a regression, so sub-millisecond operations do not fail "
+    "on noise. You can set 'BENCH_MIN_DELTA_MS' envar",
+    default=lambda: float(os.environ.get("BENCH_MIN_DELTA_MS", 1.0)),
+    type=float,
+    show_default=True,
+)
+@click.option(
+    "--threshold",
+    help="Share by which p50 duration of an operation may exceed the baseline before the command fails. You can set "
+    "'BENCH_REGRESSION_THRESHOLD' envar",
+    default=lambda: float(os.environ.get("BENCH_REGRESSION_THRESHOLD", 0.2)),
+    type=float,
+    show_default=True,
+)
+@click.option("--save-baseline", is_flag=True, help="Save results as the new baseline instead of comparing with it")
+@click.option(
+    "--baseline",
+    default=os.path.join(Path(LIB_BASE_PATH).parent, "output", "benchmark-baseline.json"),
+    type=click.Path(dir_okay=False),
+    help="JSON baseline file",
+    show_default=True,
+)
+@click.option("--latency", default=0.0, type=float, show_default=True, help="Latency of stand-in server responses")
+@click.option("--iterations", default=5, type=int, show_default=True, help="Number of browser sessions")
+@click.option("--headless", default=1, type=int, show_default=True, help="Run browser in headless mode")
+@click.option(
+    "--browser",
+    default="chrome",
+    type=click.Choice([browser.value for browser in WebBrowsers]),
+    show_default=True,
+    help="Browser the benchmark is run in",
+)
+@click.option("--url", default=None, help="Url of Saucedemo webapp. Default is a local stand-in server")
+@click.command()
+def bench(url, browser, headless, iterations, latency, baseline, save_baseline, threshold, min_delta_ms):
+    """Benchmark SaucedemoUtils hot paths
+
+    Reports p50/p95 duration and WebDriver commands of each operation and memory. Exits with status 1 if an
+    operation regressed compared to the baseline.
+    """
+    from saucedemo_selenium_lib.benchmarks.hot_paths import (
+        run_hot_paths_benchmark,
+        are_durations_comparable,
+        compare_with_baseline,
+        MIN_COMPARED_ITERATIONS,
+        load_baseline,
+        save_baseline as save_benchmark_baseline,
+    )
+
+    results = run_hot_paths_benchmark(
+        host_url=url,
+        iterations=iterations,
+        browser=WebBrowsers(browser),
+        headless=bool(headless),
+        latency=latency,
+    )
+    print_rows([{"operation": operation, **values} for operation, values in results["operations"].items()])
+    click.echo(f"Browser RSS: {results['browser_rss_mb']} MB, benchmark process RSS: {results['process_rss_mb']} MB")
+
+    if save_baseline:
+        save_benchmark_baseline(baseline, results)
+        click.echo(f"Baseline saved: {baseline}")
+        return
+    previous = load_baseline(baseline)
+    if previous is None:
+        click.echo("No baseline to compare with. Save one with --save-baseline")
+        return
+    if not are_durations_comparable(results, previous):
+        click.echo(
+            f"Durations are not compared, both runs need at least {MIN_COMPARED_ITERATIONS} iterations. Only "
+            "WebDriver commands are compared"
+        )
+    comparison = compare_with_baseline(results, previous, threshold=threshold, min_delta_ms=min_delta_ms)
+    print_rows(comparison)
+    if any(row["regressed"] for row in comparison):
+        raise SystemExit(1)
+
+
+@click.option("--iterations", default=5, type=int, show_default=True, help="Number of launches with each profile")
+@click.option("--headless", default=1, type=int, show_default=True, help="Run browser in headless mode")
+@click.option(
+    "--browser",
+    default="chrome",
+    type=click.Choice([WebBrowsers.CHROME.value, WebBrowsers.FIREFOX.value]),
+    show_default=True,
+    help="Browser whose launch is timed",
+)
+@click.command()
+def bench_launch(browser, headless, iterations):
+    """Benchmark browser launch time with a fresh profile and with the fast profile
+
+    Reports p50/p95 time to launch a local browser session and quit it with each profile, and the saving of the fast
+    profile.
+    """
+    from saucedemo_selenium_lib.benchmarks.launch_time import run_launch_benchmark
+
+    results = run_launch_benchmark(browser=WebBrowsers(browser), headless=bool(headless), iterations=iterations)
+    print_rows([{"profile": profile, **values} for profile, values in results["profiles"].items()])
+    click.echo(f"Fast profile saves {results['saving_ms']} ms ({results['saving']:.0%}) of p50 launch time")
+
+
+@click.option("--verbose", is_flag=True, help="Log requests")
+@click.option(
+    "--latency-jitter",
+    default=0.0,
+    type=float,
+    show_default=True,
+    help="Maximum random seconds added to the latency of a response",
+)
+@click.option("--latency", default=0.0, type=float, show_default=True, help="Seconds every response is delayed")
+@click.option("--port", default=8000, type=int, show_default=True, help="Port to listen on, 0 picks a free port")
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on")
+@click.command()
+def serve(host, port, latency, latency_jitter, verbose):
+    """Serve offline stand-in Saucedemo webapp
+
+    Run tests against it with --url http://127.0.0.1:<port> --username standard_user --password secret_sauce
+    """
+    from saucedemo_selenium_lib.standin.server import StandinServer
+
+    server = StandinServer(host=host, port=port, latency=latency, latency_jitter=latency_jitter, verbose=verbose)
+    click.echo(f"Serving stand-in Saucedemo at {server.url}")
+    server.serve_forever()
+
+
+@click.group()
+def cli():
+    """Saucedemo tests commands"""
+
+
+cli.add_command(run_tests)
+cli.add_command(create_results_table)
+cli.add_command(history)
+cli.add_command(benchmark_imports)
+cli.add_command(serve)
+cli.add_command(bench)
+cli.add_command(bench_launch)
+cli.add_command(wait_latencies)
+cli.add_command(locator_costs)
@@ -0,0 +1,358 @@
+""" Test Results History
+
+Local SQLite store of test results of all runs. Besides the results of every run, aggregated statistics of each test
+are updated when results are added, so flakiness and slowest tests queries do not scan the results of all runs.
+"""
+import os
+import sqlite3
+import time
+
+from saucedemo_selenium_lib.test_result.results import (
+    TargetTestResults,
+    split_node_id,
+    get_node_module,
+    RESULTS,
+    PASSED,
+    FAILED,
+    ERROR,
+)
+
+HISTORY_DB_FILE_NAME = "results-history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    host TEXT,
+    browser TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    test_case TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (target, test_case, name)
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_id INTEGER NOT NULL REFERENCES tests (id),
+    outcome INTEGER NOT NULL,
+    duration REAL,
+    flaky INTEGER NOT NULL DEFAULT 0,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS results_test_id_run_id ON results (test_id, run_id);
+CREATE INDEX IF NOT EXISTS results_run_id ON results (run_id);
+CREATE TABLE IF NOT EXISTS test_stats (
+    test_id INTEGER PRIMARY KEY REFERENCES tests (id),
+    runs INTEGER NOT NULL,
+    passes INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    flaky INTEGER NOT NULL,
+    flips INTEGER NOT NULL,
+    last_outcome INTEGER,
+    timed_runs INTEGER NOT NULL,
+    total_duration REAL NOT NULL,
+    mean_duration REAL,
+    flakiness REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_stats_flakiness ON test_stats (flakiness);
+CREATE INDEX IF NOT EXISTS test_stats_mean_duration ON test_stats (mean_duration);
+"""
+
+# Schema changes of databases created by older versions, each a statement or a tuple of statements. Database version
+# i.e PRAGMA user_version is the number of migrations applied
+MIGRATIONS = (
+    # Host each test was run against, tests of a run can be spread across a pool of hosts
+    "ALTER TABLE results ADD COLUMN host TEXT",
+    # Module of each test, test case classes of different modules may have the same name. SQLite can not change
+    # UNIQUE constraints, the table is rebuilt with the same test ids. Module of tests added before is unknown i.e ''
+    (
+        "CREATE TABLE tests_with_module (id INTEGER PRIMARY KEY, target TEXT NOT NULL, "
+        "module TEXT NOT NULL DEFAULT '', test_case TEXT NOT NULL, name TEXT NOT NULL, "
+        "UNIQUE (target, module, test_case, name))",
+        "INSERT INTO tests_with_module (id, target, test_case, name) SELECT id, target, test_case, name FROM tests",
+        "DROP TABLE tests",
+        "ALTER TABLE tests_with_module RENAME TO tests",
+    ),
+)
+
+# Outcome codes are indexes in RESULTS, the same codes used by TargetTestResults
+PASSED_CODE = RESULTS.index(PASSED)
+FAILED_CODES = (RESULTS.index(FAILED), RESULTS.index(ERROR))
+
+
+def get_outcome_code(result):
+    try:
+        return RESULTS.index(result)
+    except ValueError:
+        return len(RESULTS)
+
+
+def _get_outcome_severity(outcome):
+    """Failures are worse than passes, passes are worse than other outcomes e.g skipped"""
+    if outcome in FAILED_CODES:
+        return 2
+    return int(outcome == PASSED_CODE)
+
+
+def merge_test_results(results):
+    """Merge results of the same test in a run e.g a passed call and an error of its teardown into one result
+
+    Args:
+        results: list of (outcome, duration, message, flaky, host) of a test
+
+    Returns:
+        (outcome, duration, message, flaky, host). The worst outcome wins and its message is kept, durations are
+        summed
+    """
+    if len(results) == 1:
+        return results[0]
+    worst = max(results, key=lambda result: _get_outcome_severity(result[0]))
+    durations = [result[1] for result in results if result[1] is not None]
+    return (
+        worst[0],
+        sum(durations) if durations else None,
+        worst[2],
+        any(result[3] for result in results),
+        next((result[4] for result in results if result[4]), None),
+    )
+
+
+def get_node_duration(mean_durations, node_id):
+    """Return mean duration of the test of a pytest node id in mean durations of ResultsHistory.get_mean_durations or
+    None if it is not known. Tests recorded before modules were recorded i.e with module '' are used as a fallback"""
+    test_case, name = split_node_id(node_id)
+    duration = mean_durations.get((get_node_module(node_id), test_case, name))
+    if duration is None:
+        duration = mean_durations.get(("", test_case, name))
+    return duration
+
+
+class ResultsHistory:
+    """SQLite store of test results history
+
+    Example:
+
+        history = ResultsHistory(db_path)
+        run_id = history.start_run(host="https://www.saucedemo.com", browser="chrome")
+        history.add_target_results(run_id, target_results)
+        history.get_flaky_tests(limit=10)
+
+    """
+
+    def __init__(self, db_path):
+        self._db_path = db_path
+        # History is opened before pytest creates the output dir of a run
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._migrate()
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def _migrate(self):
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= len(MIGRATIONS):
+            return
+        with self._connection:
+            # sqlite3 only opens transactions before DML statements, migrations are applied all or nothing
+            self._connection.execute("BEGIN")
+            for migration in MIGRATIONS[version:]:
+                for statement in (migration,) if isinstance(migration, str) else migration:
+                    self._connection.execute(statement)
+            self._connection.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+
+    def close(self):
+        self._connection.execute("PRAGMA optimize")
+        self._connection.close()
+
+    def start_run(self, host=None, browser=None, started_at=None) -> int:
+        """Add a new run and return its id"""
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, host, browser) VALUES (?, ?, ?)",
+                (started_at or time.time(), host, browser),
+            )
+        return cursor.lastrowid
+
+    def _get_test_ids(self, target_name, tests):
+        """Return dict of (module, test case, test name) and test ids. Tests are added if they are not in the
+        history"""
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO tests (target, module, test_case, name) VALUES (?, ?, ?, ?)",
+            ((target_name, module, test_case, name) for module, test_case, name in tests),
+        )
+        rows = self._connection.execute(
+            "SELECT module, test_case, name, id FROM tests WHERE target = ?", (target_name,)
+        )
+        return {(module, test_case, name): test_id for module, test_case, name, test_id in rows}
+
+    def _get_stats(self, target_name):
+        rows = self._connection.execute(
+            "SELECT test_stats.* FROM test_stats JOIN tests ON tests.id = test_stats.test_id "
+            "WHERE tests.target = ?",
+            (target_name,),
+        )
+        columns = [column[0] for column in rows.description]
+        return {row[0]: dict(zip(columns, row)) for row in rows}
+
+    def _update_stats(self, stats, test_id, outcome, duration, flaky):
+        """Update aggregated statistics of a test with a new result. Only passed and failed results are counted"""
+        passed = outcome == PASSED_CODE
+        if not passed and outcome not in FAILED_CODES:
+            return
+        test_stats = stats.get(test_id)
+        if test_stats is None:
+            test_stats = stats[test_id] = {
+                "test_id": test_id,
+                "runs": 0,
+                "passes": 0,
+                "failures": 0,
+                "flaky": 0,
+                "flips": 0,
+                "last_outcome": None,
+                "timed_runs": 0,
+                "total_duration": 0.0,
+                "mean_duration": None,
+                "flakiness": 0.0,
+            }
+        test_stats["runs"] += 1
+        test_stats["passes" if passed else "failures"] += 1
+        test_stats["flaky"] += int(flaky)
+        last_outcome = test_stats["last_outcome"]
+        if last_outcome is not None and (last_outcome == PASSED_CODE) != passed:
+            test_stats["flips"] += 1
+        test_stats["last_outcome"] = PASSED_CODE if passed else outcome
+        if duration is not None:
+            test_stats["timed_runs"] += 1
+            test_stats["total_duration"] += duration
+            test_stats["mean_duration"] = test_stats["total_duration"] / test_stats["timed_runs"]
+        # Share of runs in which a test passed only after a retry or changed between passed and failed
+        test_stats["flakiness"] = (test_stats["flaky"] + test_stats["flips"]) / test_stats["runs"]
+
+    def add_target_results(self, run_id, target_results: TargetTestResults):
+        """Add test results of a target to a run
+
+        A test may have many results in a run e.g a passed call and an error of its teardown, they are merged into one
+        result with merge_test_results, so statistics are updated once per test and run.
+        """
+        target_name = target_results.target_name
+        # { (module, test case, test name): [(outcome, duration, message, flaky, host), ...] }
+        tests = {}
+        for test_case, name, result, duration, message, flaky, host, module in target_results.iter_test_results():
+            tests.setdefault((module or "", test_case, name), []).append(
+                (get_outcome_code(result), duration, message, flaky, host)
+            )
+        with self._connection:
+            test_ids = self._get_test_ids(target_name, tests)
+            stats = self._get_stats(target_name)
+            updated_stats = {}
+            results = []
+            for test, test_results in tests.items():
+                test_id = test_ids[test]
+                outcome, duration, message, flaky, host = merge_test_results(test_results)
+                results.append((run_id, test_id, outcome, duration, int(flaky), message, host))
+                self._update_stats(stats, test_id, outcome, duration, flaky)
+                updated_stats[test_id] = stats.get(test_id)
+
+            self._connection.executemany(
+                "INSERT INTO results (run_id, test_id, outcome, duration, flaky, message, host) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                results,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO test_stats (test_id, runs, passes, failures, flaky, flips, last_outcome, "
+                "timed_runs, total_duration, mean_duration, flakiness) VALUES (:test_id, :runs, :passes, "
+                ":failures, :flaky, :flips, :last_outcome, :timed_runs, :total_duration, :mean_duration, "
+                ":flakiness)",
+                [test_stats for test_stats in updated_stats.values() if test_stats],
+            )
+
+    def _query(self, sql, parameters=()):
+        cursor = self._connection.execute(sql, parameters)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def get_pass_rate_trend(self, target=None, test_case=None, name=None, days=30):
+        """Return daily pass rates of tests matching given filters for the last days
+
+        Args:
+            target: Target name
+            test_case: Test case name
+            name: Test name. SQL LIKE patterns e.g 'login%' are supported
+
+        Returns:
+            list of dicts with target, module, test_case, name, day, runs, passes and pass_rate
+        """
+        conditions = ["runs.started_at >= ?"]
+        parameters = [time.time() - days * 24 * 3600]
+        for column, value in (("target", target), ("test_case", test_case), ("name", name)):
+            if value is not None:
+                conditions.append(f"tests.{column} LIKE ?")
+                parameters.append(value)
+        return self._query(
+            "SELECT tests.target, tests.module, tests.test_case, tests.name, "
+            "date(runs.started_at, 'unixepoch', 'localtime') AS day, "
+            "COUNT(*) AS runs, SUM(results.outcome = ?) AS passes, "
+            "ROUND(100.0 * SUM(results.outcome = ?) / COUNT(*), 1) AS pass_rate "
+            # CROSS JOIN keeps tests as outer loop so results are searched by test id index instead of scanned
+            "FROM tests CROSS JOIN results ON results.test_id = tests.id JOIN runs ON runs.id = results.run_id "
+            f"WHERE {' AND '.join(conditions)} AND results.outcome IN (?, ?, ?) "
+            "GROUP BY tests.id, day ORDER BY tests.target, tests.test_case, tests.name, tests.module, day",
+            [PASSED_CODE, PASSED_CODE, *parameters, PASSED_CODE, *FAILED_CODES],
+        )
+
+    def get_host_pass_rates(self, days=30):
+        """Return pass rate and mean duration of tests run against each host in the last days"""
+        return self._query(
+            "SELECT results.host, COUNT(*) AS runs, SUM(results.outcome = ?) AS passes, "
+            "ROUND(100.0 * SUM(results.outcome = ?) / COUNT(*), 1) AS pass_rate, "
+            "ROUND(AVG(results.duration), 3) AS mean_duration "
+            "FROM runs JOIN results ON results.run_id = runs.id "
+            "WHERE runs.started_at >= ? AND results.host IS NOT NULL AND results.outcome IN (?, ?, ?) "
+            "GROUP BY results.host ORDER BY results.host",
+            (PASSED_CODE, PASSED_CODE, time.time() - days * 24 * 3600, PASSED_CODE, *FAILED_CODES),
+        )
+
+    def get_mean_durations(self, target):
+        """Return dict of (module, test case, test name) and mean duration of tests of a target. Look up tests of node
+        ids with get_node_duration"""
+        rows = self._connection.execute(
+            "SELECT tests.module, tests.test_case, tests.name, test_stats.mean_duration "
+            "FROM tests JOIN test_stats ON test_stats.test_id = tests.id "
+            "WHERE tests.target = ? AND test_stats.mean_duration IS NOT NULL",
+            (target,),
+        )
+        return {(module, test_case, name): mean_duration for module, test_case, name, mean_duration in rows}
+
+    def get_flaky_tests(self, limit=10, min_runs=5):
+        """Return tests with highest flakiness score i.e share of runs in which a test passed only after a retry or
+        its outcome changed between passed and failed"""
+        return self._query(
+            "SELECT tests.target, tests.module, tests.test_case, tests.name, test_stats.runs, test_stats.passes, "
+            "test_stats.failures, test_stats.flaky, test_stats.flips, ROUND(test_stats.flakiness, 3) AS flakiness "
+            "FROM test_stats JOIN tests ON tests.id = test_stats.test_id "
+            "WHERE test_stats.flakiness > 0 AND test_stats.runs >= ? "
+            "ORDER BY test_stats.flakiness DESC LIMIT ?",
+            (min_runs, limit),
+        )
+
+    def get_slowest_tests(self, limit=10):
+        """Return tests with highest mean duration"""
+        return self._query(
+            "SELECT tests.target, tests.module, tests.test_case, tests.name, test_stats.timed_runs AS runs, "
+            "ROUND(test_stats.mean_duration, 3) AS mean_duration "
+            "FROM test_stats JOIN tests ON tests.id = test_stats.test_id "
+            "WHERE test_stats.mean_duration IS NOT NULL "
+            "ORDER BY test_stats.mean_duration DESC LIMIT ?",
+            (limit,),
+        )
+
+
+def get_default_history_db_path(output_path):
+    return os.path.join(output_path, HISTORY_DB_FILE_NAME)
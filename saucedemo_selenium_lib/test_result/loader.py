@@ -0,0 +1,113 @@
+""" Results Loader
+
+Load test results of many targets from reports saved in a directory e.g output dir of a previous run or a
+directory of merged shards reports. Reports are parsed in parallel processes.
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from saucedemo_selenium_lib.test_result.results import (
+    HTMLTestResultsParser,
+    JUnitXMLResultsParser,
+    TargetTestResults,
+)
+
+XML_REPORT_SUFFIX = "-report.xml"
+HTML_REPORT_SUFFIX = "-report.html"
+PARSE_CACHE_FILE_NAME = ".results-parse-cache.pickle"
+# Format of pickled parse caches. Increase it whenever TargetTestResults changes, caches of other versions are not used
+PARSE_CACHE_VERSION = 2
+
+
+def parse_report(target_name, file_path) -> TargetTestResults:
+    """Parse a JUnit XML or pytest-html report of a target"""
+    if file_path.endswith(XML_REPORT_SUFFIX):
+        parser = JUnitXMLResultsParser(target_name=target_name, file_path=file_path)
+    else:
+        parser = HTMLTestResultsParser(target_name=target_name, file_path=file_path)
+    return parser.get_tests_results()
+
+
+def get_reports_files(reports_path):
+    """Return dict of target names and their report files in reports_path. JUnit XML report is used if a target has
+    both JUnit XML and html reports"""
+    reports = {}
+    for file_name in sorted(os.listdir(reports_path)):
+        for suffix in (XML_REPORT_SUFFIX, HTML_REPORT_SUFFIX):
+            if file_name.endswith(suffix):
+                target_name = file_name[: -len(suffix)]
+                if target_name not in reports or suffix == XML_REPORT_SUFFIX:
+                    reports[target_name] = os.path.join(reports_path, file_name)
+    return reports
+
+
+def _load_parse_cache(cache_file):
+    """Return dict of report files and (report key, TargetTestResults). Missing, corrupted caches and caches of other
+    versions are empty"""
+    try:
+        with open(cache_file, "rb") as file:
+            cache = pickle.load(file)
+    except Exception:
+        # Besides missing and truncated files, unpickling caches of older versions may fail on changed classes
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != PARSE_CACHE_VERSION:
+        return {}
+    return cache["reports"]
+
+
+def _save_parse_cache(cache_file, cache):
+    with open(cache_file, "wb") as file:
+        pickle.dump({"version": PARSE_CACHE_VERSION, "reports": cache}, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_results_from_directory(
+    reports_path, processes=None, cache_file=None
+) -> List[TargetTestResults]:
+    """Parse reports of all targets in reports_path in parallel processes
+
+    Parsed results are cached in cache_file together with modification time and size of each report. Reports that
+    did not change since they were cached are not parsed again.
+
+    Args:
+        reports_path: Dir with '<target>-report.xml' and/or '<target>-report.html' files
+        processes: Maximum number of parsing processes. Default is number of CPUs
+        cache_file: Path of the parse cache. Default is '.results-parse-cache.pickle' in reports_path
+
+    Returns:
+        list of TargetTestResults sorted by target name
+
+    """
+    if cache_file is None:
+        cache_file = os.path.join(reports_path, PARSE_CACHE_FILE_NAME)
+    cache = _load_parse_cache(cache_file)
+
+    results = {}
+    to_parse = {}
+    reports_cache = {}
+    for target_name, file_path in get_reports_files(reports_path).items():
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            results[target_name] = cached[1]
+            reports_cache[file_path] = cached
+        else:
+            to_parse[target_name] = (file_path, key)
+
+    if to_parse:
+        print(f"Parsing {len(to_parse)} reports, {len(results)} reports are cached")
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = {
+                target_name: executor.submit(parse_report, target_name, file_path)
+                for target_name, (file_path, _) in to_parse.items()
+            }
+            for target_name, future in futures.items():
+                file_path, key = to_parse[target_name]
+                results[target_name] = future.result()
+                reports_cache[file_path] = (key, results[target_name])
+    if to_parse or len(reports_cache) != len(cache):
+        _save_parse_cache(cache_file, reports_cache)
+
+    return [results[target_name] for target_name in sorted(results)]
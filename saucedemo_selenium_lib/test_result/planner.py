@@ -0,0 +1,92 @@
+""" Tests Planner
+
+Plan a run without running it. Tests of each target are collected with pytest --collect-only, so no browser is
+started, and wall time of the run is estimated from mean test durations in results history.
+"""
+import heapq
+
+from saucedemo_selenium_lib.test_result.history import get_node_duration
+
+# Duration in seconds assumed for a test when neither the test nor any other test of its target has a known duration
+DEFAULT_TEST_DURATION = 10.0
+
+
+class TestsCollectorPlugin:
+    """Record node ids of collected tests. Registered with pytest.main(plugins=[...])"""
+
+    def __init__(self):
+        self._node_ids = []
+
+    @property
+    def node_ids(self):
+        return self._node_ids
+
+    def pytest_collection_finish(self, session):
+        self._node_ids = [item.nodeid for item in session.items]
+
+
+def get_scope(node_id):
+    """Return node id of the module or class of a test. Tests of a scope run in the same worker with loadscope"""
+    return node_id.rsplit("::", 1)[0]
+
+
+def estimate_wall_time(durations, num_workers):
+    """Estimate wall time of running tests in parallel workers
+
+    Work units are given to the worker that becomes free first, longest units first, like xdist gives pending tests
+    to idle workers.
+
+    Args:
+        durations: Durations of work units i.e tests, or test scopes with loadscope
+        num_workers: Number of parallel workers
+
+    Returns:
+        Time in seconds when the last worker is done
+    """
+    workers = [0.0] * max(num_workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(workers, workers[0] + duration)
+    return max(workers)
+
+
+def plan_target(target, node_ids, num_workers, expected_durations=None, load_scope=False):
+    """Return plan of a target
+
+    Args:
+        target: Target name
+        node_ids: Node ids of collected tests of the target
+        num_workers: Number of xdist workers
+        expected_durations: Dict of (module, test case, test name) and mean duration i.e mean durations of
+                            ResultsHistory.get_mean_durations
+        load_scope: Tests of a module or class run in the same worker
+
+    Returns:
+        dict with target, tests, number of tests with known duration, total test time and estimated wall time
+        in seconds
+    """
+    expected_durations = expected_durations or {}
+    known = {}
+    for node_id in node_ids:
+        duration = get_node_duration(expected_durations, node_id)
+        if duration is not None:
+            known[node_id] = duration
+    # Tests that were never run are assumed to take the mean duration of the other tests of the target
+    default_duration = sum(known.values()) / len(known) if known else DEFAULT_TEST_DURATION
+    durations = {node_id: known.get(node_id, default_duration) for node_id in node_ids}
+
+    if load_scope:
+        scopes = {}
+        for node_id, duration in durations.items():
+            scope = get_scope(node_id)
+            scopes[scope] = scopes.get(scope, 0.0) + duration
+        units = scopes.values()
+    else:
+        units = durations.values()
+
+    return {
+        "target": target,
+        "tests": len(node_ids),
+        "tests_with_history": len(known),
+        "total_test_seconds": round(sum(durations.values()), 1),
+        "estimated_seconds": round(estimate_wall_time(units, num_workers), 1),
+    }
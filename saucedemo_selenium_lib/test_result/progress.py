@@ -0,0 +1,200 @@
+""" Tests Progress
+
+Pytest plugin reporting progress of a running target i.e throughput, workers utilization, failures and ETA. Progress
+is printed to the terminal and written as JSON lines to a file which can be followed by other tools e.g tail -f.
+"""
+import json
+import time
+
+import pytest
+
+from saucedemo_selenium_lib.test_result.history import get_node_duration
+
+
+class ProgressReporterPlugin:
+    """Report progress of a pytest session
+
+    Registered by the tests runner with pytest.main(plugins=[...]) in the main pytest process where reports of all
+    xdist workers are received.
+
+    Args:
+        target_name: Name of the target being tested
+        num_workers: Number of xdist workers running the tests
+        expected_durations: Dict of (module, test case, test name) and expected test duration in seconds i.e mean
+                            durations of ResultsHistory.get_mean_durations. Used to estimate remaining time
+        progress_file: Path of JSON lines file progress events are appended to
+        show_progress: Print progress to terminal
+        interval: Minimum number of seconds between progress printed to terminal
+
+    """
+
+    def __init__(
+        self,
+        target_name,
+        num_workers=1,
+        expected_durations=None,
+        progress_file=None,
+        show_progress=True,
+        interval=10,
+    ):
+        self._target_name = target_name
+        self._num_workers = max(num_workers, 1)
+        self._expected_durations = expected_durations or {}
+        self._progress_file = progress_file
+        self._show_progress = show_progress
+        self._interval = interval
+
+        self._file = None
+        self._terminal_reporter = None
+        self._start_time = None
+        self._last_printed = 0
+        # Pending node ids and their expected durations, None if it is not known
+        self._pending = {}
+        # Sum of expected durations of pending tests and number of pending tests without expected duration, kept up
+        # to date as tests are collected and done, so ETA is not computed from all pending tests on every report
+        self._pending_expected_duration = 0.0
+        self._pending_unknown = 0
+        self._done = 0
+        self._done_duration = 0.0
+        self._running_durations = {}
+        self._failures = []
+        self._workers_busy_time = {}
+
+    @property
+    def total(self):
+        return self._done + len(self._pending)
+
+    @property
+    def done(self):
+        return self._done
+
+    @property
+    def failures(self):
+        """Node ids of tests failed so far"""
+        return self._failures
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_configure(self, config):
+        # trylast so that terminal reporter is already registered in its pytest_configure
+        self._start_time = time.time()
+        self._terminal_reporter = config.pluginmanager.get_plugin("terminalreporter")
+        if self._progress_file:
+            self._file = open(self._progress_file, "w")
+
+    def _add_pending(self, node_id):
+        if node_id in self._pending:
+            return
+        duration = self._pending[node_id] = self._get_expected_duration(node_id)
+        if duration is None:
+            self._pending_unknown += 1
+        else:
+            self._pending_expected_duration += duration
+
+    def _remove_pending(self, node_id):
+        if node_id not in self._pending:
+            return
+        duration = self._pending.pop(node_id)
+        if duration is None:
+            self._pending_unknown -= 1
+        else:
+            self._pending_expected_duration -= duration
+
+    def _set_collected(self, node_ids):
+        for node_id in node_ids:
+            self._add_pending(node_id)
+        self._emit("collected", force_print=True)
+
+    def pytest_collection_finish(self, session):
+        if not hasattr(session.config, "workerinput") and session.items:
+            self._set_collected(item.nodeid for item in session.items)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        # Every worker collects all tests
+        if not self._pending and not self._done:
+            self._set_collected(ids)
+
+    def _get_expected_duration(self, node_id):
+        return get_node_duration(self._expected_durations, node_id)
+
+    def get_eta(self):
+        """Estimated number of seconds until all tests are done. Mean duration of tests done in this session is used
+        for tests without expected duration"""
+        if not self._pending:
+            return 0.0
+        remaining = max(self._pending_expected_duration, 0.0)
+        if self._pending_unknown:
+            if not self._done:
+                return None
+            remaining += self._pending_unknown * self._done_duration / self._done
+        return remaining / self._num_workers
+
+    def get_progress(self):
+        """Return dict of current progress"""
+        elapsed = time.time() - self._start_time
+        eta = self.get_eta()
+        return {
+            "target": self._target_name,
+            "elapsed": round(elapsed, 1),
+            "done": self._done,
+            "total": self.total,
+            "failures": len(self._failures),
+            "tests_per_minute": round(self._done * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+            "eta": None if eta is None else round(eta, 1),
+            "workers_utilization": {
+                worker: round(busy_time / elapsed, 2) if elapsed > 0 else 0.0
+                for worker, busy_time in sorted(self._workers_busy_time.items())
+            },
+        }
+
+    def _emit(self, event, force_print=False, **data):
+        progress = self.get_progress()
+        if self._file is not None:
+            self._file.write(json.dumps({"event": event, "time": time.time(), **data, **progress}) + "\n")
+            self._file.flush()
+
+        now = time.time()
+        if self._show_progress and self._terminal_reporter is not None and (
+            force_print or now - self._last_printed >= self._interval
+        ):
+            self._last_printed = now
+            self._print_progress(progress)
+
+    def _print_progress(self, progress):
+        eta = "unknown" if progress["eta"] is None else f"{progress['eta'] / 60:.1f} min"
+        utilization = ", ".join(
+            f"{worker}: {value:.0%}" for worker, value in progress["workers_utilization"].items()
+        )
+        self._terminal_reporter.write_line(
+            f"[{progress['target']}] {progress['done']}/{progress['total']} tests done, "
+            f"{progress['failures']} failed, {progress['tests_per_minute']} tests/min, ETA: {eta}"
+            + (f", workers utilization: {utilization}" if utilization else ""),
+            cyan=True,
+        )
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self._workers_busy_time[worker] = self._workers_busy_time.get(worker, 0.0) + report.duration
+        self._running_durations[report.nodeid] = (
+            self._running_durations.get(report.nodeid, 0.0) + report.duration
+        )
+
+        if report.failed and report.nodeid not in self._failures:
+            self._failures.append(report.nodeid)
+            self._emit("failure", force_print=True, nodeid=report.nodeid, when=report.when)
+
+        if report.when == "teardown":
+            self._remove_pending(report.nodeid)
+            self._done += 1
+            self._done_duration += self._running_durations.pop(report.nodeid, 0.0)
+            self._emit("test", nodeid=report.nodeid, worker=worker)
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._add_pending(nodeid)
+
+    def pytest_sessionfinish(self, session):
+        self._emit("finished", force_print=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
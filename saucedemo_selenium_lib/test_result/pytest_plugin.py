@@ -0,0 +1,214 @@
+""" Pytest Plugin
+
+Pytest hooks used by the tests runner. The module is registered through the `pytest11` entry point in setup.py so
+that it is loaded in the main pytest process as well as in every xdist worker.
+
+"""
+import os
+
+import pytest
+from _pytest.runner import CallInfo, runtestprotocol
+
+from saucedemo_selenium_lib.config import get_worker_host
+from saucedemo_selenium_lib.test_result.results import (
+    TargetTestResults,
+    split_node_id,
+    get_node_module,
+    HOST_PROPERTY,
+    PASSED,
+    FAILED,
+    ERROR,
+    SKIPPED,
+    XFAILED,
+    XPASSED,
+)
+
+FLAKY_PROPERTY = "flaky"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo")
+    group.addoption(
+        "--saucedemo-retries",
+        action="store",
+        type=int,
+        default=0,
+        help="Number of times a failing test is retried in the same worker before it is reported as failed. "
+        "The retry reuses class and module level fixtures e.g the browser session",
+    )
+
+
+def pytest_runtest_protocol(item, nextitem):
+    """Run a test and retry it in the same worker if it fails
+
+    Only the item itself is torn down between attempts, class and module fixtures(and therefore an open browser
+    session) are kept. Reports of the failed attempts are dropped and the report of the attempt that passed is marked
+    with a 'flaky' user property. When an attempt before the last one passes, fixtures not needed by nextitem are
+    torn down afterwards, as the last attempt would have done.
+    """
+    retries = item.config.getoption("saucedemo_retries", default=0)
+    if not retries:
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    attempt = 0
+    while True:
+        is_last_attempt = attempt >= retries
+        # Tear down only the test function between attempts
+        reports = runtestprotocol(
+            item, nextitem=nextitem if is_last_attempt else item.parent, log=False
+        )
+        failed = any(report.failed for report in reports)
+        if not failed or is_last_attempt:
+            break
+        attempt += 1
+    if not is_last_attempt:
+        reports = _teardown_for_next_item(item, nextitem, reports)
+        failed = any(report.failed for report in reports)
+
+    for report in reports:
+        if attempt > 0 and not failed:
+            report.user_properties.append((FLAKY_PROPERTY, attempt))
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def _teardown_for_next_item(item, nextitem, reports):
+    """Tear down class and module fixtures of item that nextitem does not use, after an attempt that only tore down
+    the test function. Returns reports of the attempt with its teardown report extended by the teardown"""
+    call = CallInfo.from_call(
+        lambda: item.session._setupstate.teardown_exact(nextitem), when="teardown", reraise=None
+    )
+    report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+    # Reports of runtestprotocol end with the teardown report
+    teardown = reports[-1]
+    if report.failed:
+        # Errors of the fixtures are reported as errors of the teardown of the attempt
+        report.duration += teardown.duration
+        return reports[:-1] + [report]
+    teardown.duration += report.duration
+    return reports
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Add url of the worker host to reports of tests run against a pool of hosts"""
+    outcome = yield
+    worker_host = get_worker_host()
+    if worker_host is not None:
+        outcome.get_result().user_properties.append((HOST_PROPERTY, worker_host["url"]))
+
+
+def get_report_result(report):
+    """Return result of a test report as displayed in pytest-html results table. None is returned for reports
+    that are not displayed in the table e.g passed setup and teardown"""
+    if report.when == "call":
+        if hasattr(report, "wasxfail"):
+            return XPASSED if report.passed else XFAILED
+        if report.passed:
+            return PASSED
+        if report.failed:
+            return FAILED
+        return SKIPPED
+    if report.failed:
+        return ERROR
+    if report.skipped:
+        return XFAILED if hasattr(report, "wasxfail") else SKIPPED
+    return None
+
+
+class ResultsRecorderPlugin:
+    """Record results of a pytest session
+
+    Registered by the tests runner with pytest.main(plugins=[...]). When tests are run with xdist, reports of all
+    workers are received by the main process, so one instance records the results of a whole target. Each report
+    is added to TargetTestResults as soon as it arrives so results are available while the tests are running.
+
+    Durations of results are of the whole test i.e setup, call and teardown, like the JUnit XML report, so history
+    and plan estimates include fixtures time. Duration of passed setup is added to the result of the call and
+    duration of passed teardown to that result when the teardown is reported.
+    """
+
+    def __init__(self, target_name=None):
+        self._rootpath = ""
+        self._failed_node_ids = []
+        self._flaky_node_ids = []
+        self._results = TargetTestResults(target_name)
+        self._total_reports = 0
+        # { <node id>: <duration of passed setup> } of tests whose call was not reported yet
+        self._setup_durations = {}
+        # { <node id>: <row of the call result> } of tests whose teardown was not reported yet
+        self._call_rows = {}
+
+    @property
+    def results(self):
+        """TargetTestResults of the tests reported so far"""
+        return self._results
+
+    @property
+    def total_reports(self):
+        """Number of test reports received so far"""
+        return self._total_reports
+
+    @property
+    def rootpath(self):
+        """Root dir of the pytest session, node ids of reports are relative to it"""
+        return self._rootpath
+
+    @property
+    def failed_node_ids(self):
+        """Absolute node ids of tests that failed. They can be passed to pytest to rerun the tests"""
+        return self._failed_node_ids
+
+    @property
+    def flaky_node_ids(self):
+        """Absolute node ids of tests that passed after being retried"""
+        return self._flaky_node_ids
+
+    def _get_absolute_node_id(self, node_id):
+        return os.path.join(self._rootpath, node_id)
+
+    def pytest_configure(self, config):
+        self._rootpath = str(config.rootpath)
+
+    def pytest_runtest_logreport(self, report):
+        self._total_reports += 1
+        node_id = self._get_absolute_node_id(report.nodeid)
+        if report.failed and node_id not in self._failed_node_ids:
+            self._failed_node_ids.append(node_id)
+
+        result = get_report_result(report)
+        if result is None:
+            if report.when == "setup":
+                self._setup_durations[report.nodeid] = report.duration
+            else:
+                row = self._call_rows.pop(report.nodeid, None)
+                if row is not None:
+                    self._results.add_duration(row, report.duration)
+            return
+        message = None
+        if report.failed:
+            crash = getattr(report.longrepr, "reprcrash", None)
+            message = crash.message if crash is not None else str(report.longrepr)
+        test_case, test_name = split_node_id(report.nodeid)
+        module = get_node_module(report.nodeid)
+        user_properties = dict(report.user_properties)
+        row = self._results.add_result(
+            test_case,
+            test_name,
+            result,
+            duration=report.duration + self._setup_durations.pop(report.nodeid, 0.0),
+            message=message,
+            count_result=True,
+            host=user_properties.get(HOST_PROPERTY),
+            module=module,
+        )
+        if report.when == "call":
+            self._call_rows[report.nodeid] = row
+        elif report.when == "teardown":
+            # Errors of teardown are results of their own, history sums durations of results of a test
+            self._call_rows.pop(report.nodeid, None)
+        if user_properties.get(FLAKY_PROPERTY) and report.when == "call":
+            self._flaky_node_ids.append(node_id)
+            self._results.mark_flaky(test_case, test_name, module=module)
@@ -1,21 +1,128 @@
 """ Test Results
 
 Contains classes or functions for parsing the test results and generating test results table
+
+lxml and openpyxl are imported when reports are parsed and results tables are created, so modules that only need
+TargetTestResults e.g the pytest plugin loaded in every xdist worker do not import them.
 """
+import functools
+import math
+import sys
+from array import array
 from collections import OrderedDict
-from lxml.html import parse
+from collections.abc import Mapping
 import os
+import re
+
+
+@functools.lru_cache(maxsize=None)
+def get_table_styles():
+    """Return (bold font, title font, title alignment) of results tables. Style objects are shared by all cells"""
+    import openpyxl.styles
+
+    return (
+        openpyxl.styles.Font(bold=True),
+        openpyxl.styles.Font(bold=True, size=16),
+        openpyxl.styles.Alignment(horizontal="center", vertical="center"),
+    )
+
+
+def __getattr__(name):
+    # Styles used to be created at import time
+    styles = ("boldfont", "titlefont", "titlealignment")
+    if name in styles:
+        return get_table_styles()[styles.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Test results as displayed in pytest-html results table
+PASSED = "Passed"
+FAILED = "Failed"
+ERROR = "Error"
+SKIPPED = "Skipped"
+XFAILED = "XFailed"
+XPASSED = "XPassed"
+RESULTS = (PASSED, FAILED, ERROR, SKIPPED, XFAILED, XPASSED)
+
+# Test report user property with url of the host a test was run against
+HOST_PROPERTY = "host"
+
+
+XML_DECLARATION = re.compile(rb"<\?xml[^>]*\?>")
+
+
+def get_test_name(test_function_name: str):
+    """Convert test function name e.g 'test_do_something' into test name e.g 'do something'"""
+    return test_function_name.split("test_", 1)[-1].replace("_", " ")
+
+
+def split_node_id(node_id: str):
+    """Split pytest node id e.g 'tests/target/test_file.py::TestCase::test_do_something' into test case and
+    test name e.g ('TestCase', 'do something')"""
+    detail = node_id.split("::")
+    test_case = detail[-2]
+    test_name = get_test_name(detail[-1])
+    return test_case, test_name
+
+
+def get_node_module(node_id: str):
+    """Return dotted module of pytest node id e.g 'tests.target.test_file' of
+    'tests/target/test_file.py::TestCase::test_do_something'. Test case classes of different modules may have the
+    same name"""
+    path = node_id.split("::", 1)[0]
+    if path.endswith(".py"):
+        path = path[: -len(".py")]
+    return path.replace("/", ".").replace("\\", ".")
+
+
+class TargetResultsView(Mapping):
+    """Read only view of TargetTestResults test results in form of
+    { <test case name>: [{"name": <test 1 name>, "result": <test 1 result>}, ... ] ... }
+
+    Test dicts are created when a test case is accessed, changing them does not change the results.
+    """
+
+    __slots__ = ("_target_results",)
+
+    def __init__(self, target_results):
+        self._target_results = target_results
+
+    def __getitem__(self, test_case):
+        return self._target_results.get_test_case_results(test_case)
 
-from openpyxl import Workbook
-import openpyxl.styles
+    def __iter__(self):
+        return iter(self._target_results.test_cases)
 
-boldfont = openpyxl.styles.Font(bold=True)
-titlefont = openpyxl.styles.Font(bold=True, size=16)
-titlealignment = openpyxl.styles.Alignment(horizontal="center", vertical="center")
+    def __len__(self):
+        return len(self._target_results.test_cases)
 
 
 class TargetTestResults:
-    """Test results for a target"""
+    """Test results for a target
+
+    Results are stored in columns i.e arrays of result codes and durations and lists of interned names, instead of a
+    dict per test, to keep aggregated results of many targets and runs small. Use `results` for the results in form
+    of test dicts.
+    """
+
+    __slots__ = (
+        "_target_name",
+        "_target_id",
+        "_passes",
+        "_failures",
+        "_flaky",
+        "_percent",
+        "_test_cases",
+        "_test_case_rows",
+        "_names",
+        "_result_codes",
+        "_result_names",
+        "_durations",
+        "_messages",
+        "_flaky_rows",
+        "_hosts",
+        "_modules",
+    )
 
     def __init__(self, target_name, passes=None, failures=None, target_id=None):
 
@@ -31,21 +138,41 @@ class TargetTestResults:
             failures = 0
         self._passes = passes
         self._failures = failures
-        self._results = OrderedDict()
+        self._flaky = 0
         self._percent = None
-        self._total_tests_executed = None
+
+        # Row indexes of tests of each test case, in order of insertion
+        self._test_cases = OrderedDict()
+        self._test_case_rows = []
+        # Columns. One entry per test row
+        self._names = []
+        self._result_codes = array("B")
+        self._result_names = list(RESULTS)
+        self._durations = array("d")
+        # Sparse columns. Only failed or flaky tests, tests run against a known host or of a known module have entries
+        self._messages = {}
+        self._flaky_rows = set()
+        self._hosts = {}
+        self._modules = {}
 
     def __str__(self):
         return f"({self.target_name},Total Tests: {self.total_tests_executed},  passes: {self.passes}, failures: {self.failures}, pass rate: {self.percent})"
 
+    def __len__(self):
+        return len(self._names)
 
     @property
     def target_name(self):
         return self._target_name
 
+    @property
+    def test_cases(self):
+        """Names of test cases in order they were added"""
+        return self._test_cases.keys()
+
     @property
     def results(self):
-        return self._results
+        return TargetResultsView(self)
 
     @property
     def passes(self):
@@ -55,12 +182,15 @@ class TargetTestResults:
     def failures(self):
         return self._failures
 
+    @property
+    def flaky(self):
+        """Number of tests that passed after being retried"""
+        return self._flaky
+
     @property
     def total_tests_executed(self):
-        if self._total_tests_executed:
-            return self._total_tests_executed
-        self._total_tests_executed = self._passes + self._failures
-        return self._total_tests_executed
+        # Not cached since results can be added while tests are still running
+        return self._passes + self._failures
 
     @property
     def percent(self):
@@ -73,11 +203,151 @@ class TargetTestResults:
                 percent = round(float((self._passes / total) * 100), 1)
             return percent
 
-    def add_test_case_result(self, test_case, test: dict):
-        """Add test result of a specific test case"""
-        if test_case not in self._results:
-            self._results[test_case] = []
-        self._results[test_case].append(test)
+    def _get_result_code(self, result):
+        try:
+            return self._result_names.index(result)
+        except ValueError:
+            self._result_names.append(sys.intern(result))
+            return len(self._result_names) - 1
+
+    def _get_test_dict(self, row):
+        test = {
+            "name": self._names[row],
+            "result": self._result_names[self._result_codes[row]],
+        }
+        if not math.isnan(self._durations[row]):
+            test["duration"] = self._durations[row]
+        if row in self._messages:
+            test["message"] = self._messages[row]
+        if row in self._flaky_rows:
+            test["flaky"] = True
+        if row in self._hosts:
+            test["host"] = self._hosts[row]
+        if row in self._modules:
+            test["module"] = self._modules[row]
+        return test
+
+    def get_test_case_results(self, test_case):
+        """Return list of test dicts of a test case"""
+        rows = self._test_case_rows[self._test_cases[test_case]]
+        return [self._get_test_dict(row) for row in rows]
+
+    def iter_test_results(self):
+        """Iterate over test results as tuples of (test case, test name, result, duration, message, flaky, host,
+        module) without creating test dicts. Duration, host and module are None if they are not known"""
+        for test_case, index in self._test_cases.items():
+            for row in self._test_case_rows[index]:
+                duration = self._durations[row]
+                yield (
+                    test_case,
+                    self._names[row],
+                    self._result_names[self._result_codes[row]],
+                    None if math.isnan(duration) else duration,
+                    self._messages.get(row),
+                    row in self._flaky_rows,
+                    self._hosts.get(row),
+                    self._modules.get(row),
+                )
+
+    def add_result(
+        self,
+        test_case,
+        test_name,
+        result,
+        duration=None,
+        message=None,
+        count_result=False,
+        host=None,
+        module=None,
+    ):
+        """Add test result of a specific test case
+
+        Args:
+            test_case: Name of the test case e.g test case class name
+            test_name: Name of the test
+            result: Test result e.g 'Passed', 'Failed'
+            duration: Test duration in seconds if it is known
+            message: Failure message if any
+            count_result: Set to True to add the test result to passes and failures totals. Not needed when
+                          the totals are given in instantiation e.g when they are parsed from the report summary
+            host: Url of the host the test was run against if it is known
+            module: Dotted module of the test case e.g 'tests.target.test_file' if it is known
+
+        Returns:
+            row of the result, it can be passed to add_duration
+
+        """
+        index = self._test_cases.get(test_case)
+        if index is None:
+            index = len(self._test_case_rows)
+            self._test_cases[sys.intern(test_case)] = index
+            self._test_case_rows.append(array("L"))
+        row = len(self._names)
+        self._test_case_rows[index].append(row)
+        self._names.append(sys.intern(test_name))
+        self._result_codes.append(self._get_result_code(result))
+        self._durations.append(math.nan if duration is None else duration)
+        if message:
+            self._messages[row] = message
+        if host:
+            self._hosts[row] = sys.intern(host)
+        if module:
+            self._modules[row] = sys.intern(module)
+
+        if count_result:
+            if result == PASSED:
+                self._passes += 1
+            elif result in (FAILED, ERROR):
+                self._failures += 1
+        return row
+
+    def add_duration(self, row, duration):
+        """Add duration in seconds to the duration of a result e.g of a test phase reported after the result"""
+        if math.isnan(self._durations[row]):
+            self._durations[row] = duration
+        else:
+            self._durations[row] += duration
+
+    def add_test_case_result(self, test_case, test: dict, count_result=False):
+        """Add test result of a specific test case
+
+        Args:
+            test_case: Name of the test case e.g test case class name
+            test: Dict with test 'name' and 'result' and optionally 'duration', 'message', 'flaky', 'host' and
+                  'module'
+            count_result: Set to True to add the test result to passes and failures totals. Not needed when
+                          the totals are given in instantiation e.g when they are parsed from the report summary
+
+        """
+        self.add_result(
+            test_case,
+            test["name"],
+            test["result"],
+            duration=test.get("duration"),
+            message=test.get("message"),
+            count_result=count_result,
+            host=test.get("host"),
+            module=test.get("module"),
+        )
+        if test.get("flaky"):
+            self._flaky_rows.add(len(self._names) - 1)
+            self._flaky += 1
+
+    def mark_flaky(self, test_case, test_name, module=None):
+        """Mark test of a test case as flaky i.e it passed after being retried
+
+        Args:
+            module: Dotted module of the test case. Tests of same-named test cases of other modules are not marked
+        """
+        index = self._test_cases.get(test_case)
+        if index is None:
+            return
+        for row in self._test_case_rows[index]:
+            if module is not None and self._modules.get(row) != module:
+                continue
+            if self._names[row] == test_name and row not in self._flaky_rows:
+                self._flaky_rows.add(row)
+                self._flaky += 1
 
 
 class HTMLTestResultsParser:
@@ -87,6 +357,8 @@ class HTMLTestResultsParser:
         self._target_name = target_name
         self._file = file_path
         print(f"Parsing file: {self._file}")
+        from lxml.html import parse
+
         self._parser = parse(self._file).getroot()
         self._results = TargetTestResults(
             self._target_name, self.get_total_passed(), self.get_total_failed()
@@ -132,25 +404,146 @@ class HTMLTestResultsParser:
         elements = self._get_elements_by_xpath(xpath)
 
         for element in elements:
-            detail = self._get_text_content(element.find_class("col-name")[0]).split(
-                "::"
-            )
-            # print(f"test Name: {detail}")
+            node_id = self._get_text_content(element.find_class("col-name")[0])
+            test_case, test_name = split_node_id(node_id)
+            result = self._get_text_content(element.find_class("col-result")[0])
+            self._results.add_result(test_case, test_name, result, module=get_node_module(node_id))
+        return self._results
 
-            test_case = detail[1]
 
-            test_name = detail[2].split("test_")[1].replace("_", " ")
-            result = self._get_text_content(element.find_class("col-result")[0])
-            test = {"name": test_name, "result": result}
-            self._results.add_test_case_result(test_case=test_case, test=test)
+class ConcatenatedXMLFile:
+    """File like object for reading one or more concatenated XML documents e.g JUnit XML reports of many shards
+    joined with cat, as children of a single root element. XML declarations of the documents are removed."""
+
+    def __init__(self, file, root_tag=b"reports", chunk_size=1024 * 1024):
+        self._chunks = self._iter_chunks(file, root_tag, chunk_size)
+        self._buffer = b""
+        self._position = 0
+
+    def _iter_chunks(self, file, root_tag, chunk_size):
+        yield b"<" + root_tag + b">"
+        pending = b""
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            data = pending + chunk
+            # Keep back an incomplete tag, it might be a declaration split between two chunks
+            start = data.rfind(b"<")
+            if start != -1 and data.find(b">", start) == -1:
+                data, pending = data[:start], data[start:]
+            else:
+                pending = b""
+            yield XML_DECLARATION.sub(b"", data)
+        yield XML_DECLARATION.sub(b"", pending)
+        yield b"</" + root_tag + b">"
+
+    def read(self, size=-1):
+        if size < 0:
+            data = self._buffer[self._position:] + b"".join(self._chunks)
+            self._buffer, self._position = b"", 0
+            return data
+        while self._position >= len(self._buffer):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer, self._position = chunk, 0
+        data = self._buffer[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+
+class JUnitXMLResultsParser:
+    """Parse test results from JUnit XML generated during tests by pytest --junitxml
+
+    The report is parsed incrementally and every testcase element is cleared once it is read, so memory used for
+    parsing does not grow with the size of the report. Test durations and failure messages are added to the results.
+    """
+
+    def __init__(self, target_name, file_path):
+        self._target_name = target_name
+        self._file = file_path
+        print(f"Parsing file: {self._file}")
+        self._results = TargetTestResults(self._target_name)
+
+    @property
+    def xml_report_file_path(self):
+        return self._file
+
+    def _get_test_result(self, element):
+        """Return test result, message and host of a testcase element"""
+        result, message, host = PASSED, None, None
+        for child in element:
+            if child.tag == "properties":
+                # Test user properties e.g host of a host pool run
+                for prop in child:
+                    if prop.get("name") == HOST_PROPERTY:
+                        host = prop.get("value")
+            elif child.tag == "failure":
+                result, message = FAILED, child.get("message", child.text)
+            elif child.tag == "error" and result != FAILED:
+                result, message = ERROR, child.get("message", child.text)
+            elif child.tag == "skipped" and result == PASSED:
+                if child.get("type") == "pytest.xfail":
+                    result = XFAILED
+                else:
+                    result = SKIPPED
+                message = child.get("message", child.text)
+        return result, message, host
+
+    def get_tests_results(self) -> TargetTestResults:
+        from lxml import etree
+
+        with open(self._file, "rb") as file:
+            for _, element in etree.iterparse(
+                ConcatenatedXMLFile(file),
+                events=("end",),
+                tag="testcase",
+                huge_tree=True,
+            ):
+                # classname is dotted module and test case e.g 'tests.target.test_file.TestCase'
+                module, _, test_case = element.get("classname", "").rpartition(".")
+                result, message, host = self._get_test_result(element)
+                self._results.add_result(
+                    test_case,
+                    get_test_name(element.get("name", "")),
+                    result,
+                    duration=float(element.get("time") or 0),
+                    message=message,
+                    count_result=True,
+                    host=host,
+                    module=module or None,
+                )
+
+                # Free parsed testcase elements
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+        print(
+            f"Total number of passed tests: {self._results.passes}, failed tests: {self._results.failures}"
+        )
         return self._results
 
+
+def get_table_result(test: dict):
+    """Return test result as written in results table. None is returned for skipped tests which are not written"""
+    result = test["result"]
+    if result == SKIPPED:
+        return None
+    if result == ERROR:
+        return FAILED
+    if test.get("flaky"):
+        return "Passed (flaky)"
+    return result
+
+
 class ResultsTableCreator:
     """Create results table excel for test results"""
 
     def __init__(self, test_results: [TargetTestResults], output_path=""):
         self._test_results = test_results
         self._output_path = output_path
+        from openpyxl import Workbook
+
+        self._boldfont, self._titlefont, self._titlealignment = get_table_styles()
         self._wb = Workbook()
         self._wb.remove(self._wb.active)
 
@@ -160,8 +553,8 @@ class ResultsTableCreator:
         sheet.title = title
         sheet.merge_cells("A1:B1")
         sheet["A1"].value = title
-        sheet["A1"].font = titlefont
-        sheet["A1"].alignment = titlealignment
+        sheet["A1"].font = self._titlefont
+        sheet["A1"].alignment = self._titlealignment
         return sheet
 
     # { <use case name>: [(<test 1 name>, <test 1 status>), ... ] ... }
@@ -173,10 +566,10 @@ class ResultsTableCreator:
         overview_sheet["B2"].value = "Succeeded"
         overview_sheet["C2"].value = "Failed"
         overview_sheet["D2"].value = "Success ratio"
-        overview_sheet["A2"].font = boldfont
-        overview_sheet["B2"].font = boldfont
-        overview_sheet["C2"].font = boldfont
-        overview_sheet["D2"].font = boldfont
+        overview_sheet["A2"].font = self._boldfont
+        overview_sheet["B2"].font = self._boldfont
+        overview_sheet["C2"].font = self._boldfont
+        overview_sheet["D2"].font = self._boldfont
 
         success_counter = 0
         failure_counter = 0
@@ -210,10 +603,10 @@ class ResultsTableCreator:
             total_percent = round(float(success_counter / total_counter) * 100, 2)
         overview_sheet.cell(row=overview_iter + 1, column=4).value = total_percent
 
-        overview_sheet.cell(row=overview_iter + 1, column=1).font = boldfont
-        overview_sheet.cell(row=overview_iter + 1, column=2).font = boldfont
-        overview_sheet.cell(row=overview_iter + 1, column=3).font = boldfont
-        overview_sheet.cell(row=overview_iter + 1, column=4).font = boldfont
+        overview_sheet.cell(row=overview_iter + 1, column=1).font = self._boldfont
+        overview_sheet.cell(row=overview_iter + 1, column=2).font = self._boldfont
+        overview_sheet.cell(row=overview_iter + 1, column=3).font = self._boldfont
+        overview_sheet.cell(row=overview_iter + 1, column=4).font = self._boldfont
         file_path = os.path.join(
             self._output_path, f"table-test-results-{file_name_phrase}.xlsx"
         )
@@ -227,39 +620,162 @@ class ResultsTableCreator:
         sheet = self._create_sheet_with_title(target.target_name)
 
         sheet["A3"].value = "Summary"
-        sheet["A3"].font = boldfont
+        sheet["A3"].font = self._boldfont
 
         sheet["A4"].value = "Total Test Executed:"
         sheet["B4"].value = target.total_tests_executed
-        sheet["B4"].font = boldfont
+        sheet["B4"].font = self._boldfont
 
         sheet["A5"].value = "Total Passes:"
         sheet["B5"].value = target.passes
-        sheet["B5"].font = boldfont
+        sheet["B5"].font = self._boldfont
 
         sheet["A6"].value = "Total Failures:"
         sheet["B6"].value = target.failures
-        sheet["B6"].font = boldfont
+        sheet["B6"].font = self._boldfont
 
         sheet["A7"].value = "Pass Ratio:"
         sheet["B7"].value = target.percent
-        sheet["B7"].font = boldfont
+        sheet["B7"].font = self._boldfont
+
+        if target.flaky:
+            sheet["A8"].value = "Total Flaky:"
+            sheet["B8"].value = target.flaky
+            sheet["B8"].font = self._boldfont
 
         sheet["A9"].value = "Test Result Details"
-        sheet["A9"].font = boldfont
+        sheet["A9"].font = self._boldfont
         line_iter = 10
 
         for name, tests in target.results.items():
             print(f"Use case: {name}")
             print(f"Tests: {tests}")
             sheet.cell(row=line_iter, column=1).value = name
-            sheet.cell(row=line_iter, column=1).font = boldfont
+            sheet.cell(row=line_iter, column=1).font = self._boldfont
             line_iter += 1
             for test in tests:
-                if test["result"] != "Skipped":
-                    result = test["result"]
-                    if result == "Error":
-                        result = "Failed"
+                result = get_table_result(test)
+                if result is not None:
                     sheet.cell(row=line_iter, column=1).value = test["name"]
                     sheet.cell(row=line_iter, column=2).value = result
-                    line_iter += 1
\ No newline at end of file
+                    line_iter += 1
+
+class StreamingResultsTableCreator:
+    """Create results table excel while targets are tested
+
+    Same layout as ResultsTableCreator, but the workbook is created in openpyxl write-only mode. Sheet of a target
+    is written as soon as its results are added, so rows are not kept in memory until the workbook is saved.
+
+    Example:
+
+        table_creator = StreamingResultsTableCreator(output_path)
+        for target in targets:
+            table_creator.add_target_results(run(target))
+        table_creator.save()
+
+    """
+
+    def __init__(self, output_path="", file_name_phrase="all"):
+        self._file_path = os.path.join(
+            output_path, f"table-test-results-{file_name_phrase}.xlsx"
+        )
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+
+        self._write_only_cell = WriteOnlyCell
+        self._boldfont, self._titlefont, self._titlealignment = get_table_styles()
+        self._wb = Workbook(write_only=True)
+        self._success_counter = 0
+        self._failure_counter = 0
+        self._overview_sheet = self._create_sheet_with_title("Overview")
+        self._overview_sheet.append(
+            self._bold_row(["Name", "Succeeded", "Failed", "Success ratio"])
+        )
+
+    @property
+    def file_path(self):
+        return self._file_path
+
+    def _cell(self, sheet, value, font=None, alignment=None):
+        cell = self._write_only_cell(sheet, value=value)
+        # Font and alignment objects are shared by all cells, so they are stored once in the workbook styles
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    def _bold_row(self, values, sheet=None):
+        sheet = sheet or self._overview_sheet
+        return [self._cell(sheet, value, font=self._boldfont) for value in values]
+
+    def _create_sheet_with_title(self, title):
+        sheet = self._wb.create_sheet(title)
+        # Column dimensions and merged cells must be set before rows are written
+        sheet.column_dimensions["A"].width = 100
+        sheet.merged_cells.add("A1:B1")
+        sheet.append(
+            [self._cell(sheet, title, font=self._titlefont, alignment=self._titlealignment)]
+        )
+        return sheet
+
+    def add_target_results(self, target: TargetTestResults):
+        """Write result sheet of the target and add it to the overview sheet"""
+        self._create_service_result_sheet(target)
+
+        success_ratio = None
+        if target.passes + target.failures > 0:
+            success_ratio = round(
+                float(target.passes) * 100 / (target.passes + target.failures), 1
+            )
+        self._overview_sheet.append(
+            [target.target_name, target.passes, target.failures, success_ratio]
+        )
+        self._success_counter += target.passes
+        self._failure_counter += target.failures
+
+    def _create_service_result_sheet(self, target: TargetTestResults):
+        """Create result sheet for a service where its detail test result content is written"""
+        sheet = self._create_sheet_with_title(target.target_name)
+        sheet.append([])
+        sheet.append(self._bold_row(["Summary"], sheet))
+        summary = [
+            ("Total Test Executed:", target.total_tests_executed),
+            ("Total Passes:", target.passes),
+            ("Total Failures:", target.failures),
+            ("Pass Ratio:", target.percent),
+        ]
+        for label, value in summary:
+            sheet.append([label, self._cell(sheet, value, font=self._boldfont)])
+        if target.flaky:
+            sheet.append(["Total Flaky:", self._cell(sheet, target.flaky, font=self._boldfont)])
+        else:
+            sheet.append([])
+        sheet.append(self._bold_row(["Test Result Details"], sheet))
+
+        for name, tests in target.results.items():
+            sheet.append(self._bold_row([name], sheet))
+            for test in tests:
+                result = get_table_result(test)
+                if result is not None:
+                    if "host" in test:
+                        sheet.append([test["name"], result, test["host"]])
+                    else:
+                        sheet.append([test["name"], result])
+
+    def save(self):
+        """Write overall results and save the workbook. Workbook can not be changed after it is saved"""
+        total_counter = self._failure_counter + self._success_counter
+        total_percent = 0
+        if total_counter > 0:
+            total_percent = round(float(self._success_counter / total_counter) * 100, 2)
+        self._overview_sheet.append([])
+        self._overview_sheet.append(
+            self._bold_row(
+                ["Overall", self._success_counter, self._failure_counter, total_percent]
+            )
+        )
+        self._wb.save(self._file_path)
+
+        print("The workbook was successfully created.")
+        print(f"Excel File Path:- {self._file_path}")
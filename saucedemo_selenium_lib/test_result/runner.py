@@ -3,15 +3,47 @@
 Contain classes or functions for Tests runner. These include SaucedemoTestRunner for running tests locally.
 """
 
+import json
 import os
+import shutil
 
 import pytest
 from typing import List
 
 from saucedemo_selenium_lib.exceptions import TargetPathDoesNotExist
-from saucedemo_selenium_lib.config import TestConfig
-
-from saucedemo_selenium_lib.test_result.results import HTMLTestResultsParser, ResultsTableCreator
+from saucedemo_selenium_lib.helpers import environment_variables
+from saucedemo_selenium_lib.config import (
+    TestConfig,
+    export_configs,
+    clear_exported_configs,
+    export_host_pool,
+    clear_host_pool,
+    assign_workers_to_hosts,
+    get_host_pool_capacity,
+    ROUND_ROBIN,
+    PAGE_LOAD_STRATEGY_ENVAR,
+)
+
+from saucedemo_selenium_lib.saucedemo_utils.wait_timeouts import ADAPTIVE_TIMEOUTS_ENVAR
+from saucedemo_selenium_lib.saucedemo_utils.resource_blocking import BLOCK_RESOURCES_ENVAR
+from saucedemo_selenium_lib.saucedemo_utils.browser_profiles import FAST_PROFILE_ENVAR
+from saucedemo_selenium_lib.saucedemo_utils.locator_profiler import (
+    LOCATOR_COSTS_DIR,
+    PROFILE_LOCATORS_ENVAR,
+    get_most_expensive_locators,
+    load_locator_costs,
+)
+from saucedemo_selenium_lib.test_result.history import ResultsHistory
+from saucedemo_selenium_lib.test_result.planner import TestsCollectorPlugin, plan_target
+from saucedemo_selenium_lib.test_result.progress import ProgressReporterPlugin
+from saucedemo_selenium_lib.test_result.pytest_plugin import ResultsRecorderPlugin
+from saucedemo_selenium_lib.test_result.results import (
+    HTMLTestResultsParser,
+    JUnitXMLResultsParser,
+    StreamingResultsTableCreator,
+    split_node_id,
+    get_node_module,
+)
 
 class BaseTestRunner:
     def __init__(self, tests_path: str, output_path=TestConfig.OUTPUT_PATH, headless=1, browser="chrome", grid=None):
@@ -68,10 +100,40 @@ class SaucedemoTestRunner(BaseTestRunner):
         output_path=TestConfig.OUTPUT_PATH,
         browser="chrome",
         grid=None,
+        rerun_failed=False,
+        retries=0,
+        history_db=None,
+        show_progress=False,
+        host_pool=None,
+        host_pool_strategy=ROUND_ROBIN,
+        adaptive_timeouts=False,
+        profile_locators=False,
+        page_load_strategy=None,
+        block_resources=None,
+        fast_profile=False,
     ):
         """ "
         Run Given tests.
 
+        Args:
+            rerun_failed: Run only tests that failed in the previous run of each target
+            retries: Number of times a failing test is retried in the same worker before it is reported as failed
+            history_db: Path of SQLite results history database. Results of the run are added to it if it is set
+            show_progress: Print progress of each target while it is tested. Progress is always written to
+                           '<target>-progress.jsonl' in the output dir
+            host_pool: List of indexes of hosts in config file. If it is set, xdist workers are spread across the
+                       hosts instead of running all tests against host_index
+            host_pool_strategy: How workers are assigned to hosts of the pool, 'round-robin' or 'least-loaded'
+            adaptive_timeouts: SaucedemoUtils of the tests derive timeouts of waits from wait latencies of previous
+                               runs
+            profile_locators: Measure costs of the locators the tests use in the browser. The most expensive
+                              locators are printed and saved to 'locator-costs.json' in the output dir
+            page_load_strategy: Page load strategy of SaucedemoUtils of the tests i.e 'normal', 'eager' or 'none'.
+                                SaucedemoUtils default is used if it is None
+            block_resources: Comma separated resource types and URL patterns browsers of the tests do not load e.g
+                             'images,fonts,analytics'
+            fast_profile: Browsers of the tests start from clones of a minimal profile template built once per worker
+
         """
         super().__init__(tests_path, output_path, headless, browser=browser, grid=grid)
 
@@ -81,6 +143,19 @@ class SaucedemoTestRunner(BaseTestRunner):
         self._targets = self.get_targets_to_test(tests_to_run)
         self._num_processes = num_processes
         self._host_index = host_index
+        self._rerun_failed = rerun_failed
+        self._retries = retries
+        self._history_db = history_db
+        self._history = None
+        self._show_progress = show_progress
+        self._host_pool = host_pool
+        self._host_pool_strategy = host_pool_strategy
+        self._workers_hosts = None
+        self._adaptive_timeouts = adaptive_timeouts
+        self._profile_locators = profile_locators
+        self._page_load_strategy = page_load_strategy
+        self._block_resources = block_resources
+        self._fast_profile = fast_profile
 
         self._results = []
         self._py_tests_arguments = [
@@ -128,6 +203,37 @@ class SaucedemoTestRunner(BaseTestRunner):
     def host_index(self):
         return self._host_index
 
+    @property
+    def host_pool(self):
+        return self._host_pool
+
+    @property
+    def workers_hosts(self):
+        """List of (host index, host url) of each xdist worker in a host pool run"""
+        return self._workers_hosts
+
+    @property
+    def rerun_failed(self):
+        return self._rerun_failed
+
+    @property
+    def retries(self):
+        return self._retries
+
+    @property
+    def history_db(self):
+        return self._history_db
+
+    def _get_host_url(self):
+        """Return url of the host tests are run against. Used to label the run in results history"""
+        if self._workers_hosts:
+            return ", ".join(sorted({url for _, url in self._workers_hosts}))
+        try:
+            return TestConfig(host_index=self._host_index).host_url
+        except Exception:
+            # Config file might be missing or incomplete. The url is only a label, it must not stop the run
+            return None
+
     def get_targets_to_test(self, given_targets):
         if len(given_targets) > 0:
             print(f"Targets specified: {given_targets}")
@@ -154,38 +260,226 @@ class SaucedemoTestRunner(BaseTestRunner):
                 raise TargetPathDoesNotExist(target_name=_target, target_path=path)
         return _targets
 
+    def _get_failed_tests_file_path(self, target):
+        return os.path.join(self._output_path, f"{target}-failed.json")
+
+    def _load_failed_node_ids(self, target):
+        """Load node ids of tests that failed in the previous run of the target"""
+        file_path = self._get_failed_tests_file_path(target)
+        if not os.path.exists(file_path):
+            return []
+        with open(file_path) as file:
+            return json.load(file)["failed"]
+
+    def _save_failed_node_ids(self, target, recorder: ResultsRecorderPlugin):
+        """Persist node ids of failed and flaky tests so that failed tests can be rerun with rerun_failed"""
+        file_path = self._get_failed_tests_file_path(target)
+        with open(file_path, "w") as file:
+            json.dump(
+                {
+                    "target": target,
+                    "failed": recorder.failed_node_ids,
+                    "flaky": recorder.flaky_node_ids,
+                },
+                file,
+                indent=2,
+            )
+
+    def _set_num_processes(self, num_processes):
+        self._num_processes = num_processes
+        self._py_tests_arguments[self._py_tests_arguments.index("-n") + 1] = f"{num_processes}"
+
+    def _setup_host_pool(self):
+        """Assign xdist workers to hosts of the pool and export the assignment to the workers"""
+        hosts = TestConfig().hosts
+        pool = [hosts[index] for index in self._host_pool]
+        capacity = get_host_pool_capacity(pool)
+        if capacity is not None and self._num_processes > capacity:
+            print(f"Hosts pool can take only {capacity} workers. Number of processes is reduced to {capacity}")
+            self._set_num_processes(capacity)
+        assignment = assign_workers_to_hosts(pool, self._num_processes, self._host_pool_strategy)
+        self._workers_hosts = [(self._host_pool[index], pool[index]["url"]) for index in assignment]
+        for worker, (host_index, url) in enumerate(self._workers_hosts):
+            print(f"Worker gw{worker} runs tests against host {host_index}: {url}")
+        export_host_pool(self._workers_hosts)
+
+    def _get_tests_to_run(self, target):
+        """Return target path or node ids of failed tests of the target to pass to pytest. None if there are no
+        tests to rerun"""
+        if self._rerun_failed:
+            failed_node_ids = self._load_failed_node_ids(target)
+            if not failed_node_ids:
+                print(f"No failed tests to rerun for Target: {target}")
+                return None
+            return failed_node_ids
+        return [os.path.join(self._tests_path, target)]
+
+    def _is_load_scope(self, target):
+        return target in self.load_scope_targets or self._num_processes == 1
+
+    def _collect(self, target):
+        """Return node ids of tests of a target that would be run. Tests are only collected, no browser is started"""
+        tests = self._get_tests_to_run(target)
+        if tests is None:
+            return []
+        py_tests_arguments = self._get_copy_of_py_tests_arguments()
+        if "-n" in py_tests_arguments:
+            # Collect in this process instead of starting xdist workers
+            py_tests_arguments[py_tests_arguments.index("-n") + 1] = "0"
+        py_tests_arguments.extend(["--collect-only", "-q", *tests])
+        collector = TestsCollectorPlugin()
+        pytest.main(args=py_tests_arguments, plugins=[collector])
+        return collector.node_ids
+
+    def plan(self):
+        """Collect tests of the targets and estimate wall time of the run from results history without running them
+
+        Returns:
+            dict with number of processes, plans of the targets, total number of tests and estimated wall time in
+            seconds. Targets are tested one after another, so estimated wall time is the sum of targets estimates
+        """
+        history = None
+        if self._history_db and os.path.exists(self._history_db):
+            history = ResultsHistory(self._history_db)
+        targets = []
+        for target in self._targets:
+            targets.append(
+                plan_target(
+                    target,
+                    self._collect(target),
+                    self._num_processes,
+                    expected_durations=history.get_mean_durations(target) if history else None,
+                    load_scope=self._is_load_scope(target),
+                )
+            )
+        if history is not None:
+            history.close()
+        return {
+            "num_procs": self._num_processes,
+            "targets": targets,
+            "tests": sum(target["tests"] for target in targets),
+            "estimated_seconds": round(sum(target["estimated_seconds"] for target in targets), 1),
+        }
+
     def run(self):
         """Run given tests"""
-        for target in self._targets:
-            print(f"Testing: {target}")
-            self._run(target)
+        config_file = TestConfig().config_file_path
+        if os.path.exists(config_file):
+            # Parse config file once for all xdist workers
+            export_configs(config_file)
+        if self._profile_locators:
+            # Costs of previous runs are not mixed in
+            shutil.rmtree(self.locator_costs_path, ignore_errors=True)
+        try:
+            if self._host_pool:
+                self._setup_host_pool()
+            with environment_variables(self._get_run_environment()):
+                self._run_targets()
+        finally:
+            # Parsed configs, credentials included, and the host pool are not left to later runs and other child
+            # processes
+            clear_exported_configs()
+            if self._workers_hosts:
+                clear_host_pool()
+        if self._profile_locators:
+            self._report_locator_costs()
+
+    def _get_run_environment(self):
+        """Return envars with SaucedemoUtils options of the tests, xdist workers inherit them. Options that are not
+        set are None, SaucedemoUtils then uses envars set by the user if any"""
+        return {
+            ADAPTIVE_TIMEOUTS_ENVAR: "1" if self._adaptive_timeouts else None,
+            PROFILE_LOCATORS_ENVAR: self.locator_costs_path if self._profile_locators else None,
+            PAGE_LOAD_STRATEGY_ENVAR: self._page_load_strategy or None,
+            BLOCK_RESOURCES_ENVAR: self._block_resources or None,
+            FAST_PROFILE_ENVAR: "1" if self._fast_profile else None,
+        }
+
+    def _run_targets(self):
+        result_table_creator = StreamingResultsTableCreator(self._output_path)
+        if self._history_db:
+            self._history = ResultsHistory(self._history_db)
+            run_id = self._history.start_run(host=self._get_host_url(), browser=self.browser)
+        try:
+            for target in self._targets:
+                print(f"Testing: {target}")
+                results = self._run(target)
+                if results is not None:
+                    result_table_creator.add_target_results(results)
+                    if self._history is not None:
+                        self._history.add_target_results(run_id, results)
+        finally:
+            if self._history is not None:
+                self._history.close()
+                self._history = None
 
         print("All target done")
-        result_table_creator = ResultsTableCreator(self._results, self._output_path)
-        result_table_creator.create_results_table()
+        result_table_creator.save()
+
+    @property
+    def locator_costs_path(self):
+        return os.path.abspath(os.path.join(self._output_path, LOCATOR_COSTS_DIR))
+
+    def _report_locator_costs(self, top=10):
+        """Print the most expensive locators of the run and save costs of all locators"""
+        costs = load_locator_costs(self.locator_costs_path)
+        with open(os.path.join(self._output_path, "locator-costs.json"), "w") as file:
+            json.dump(get_most_expensive_locators(costs, top=len(costs)), file, indent=2)
+        print(f"Most expensive locators of {len(costs)}:")
+        for row in get_most_expensive_locators(costs, top=top):
+            print(
+                f"  {row['total_ms']:>9.2f} ms  {row['uses']:>5} uses x {row['cost_ms']:.3f} ms  "
+                f"{row['name']}  {row['locator']}  ({row['page']})"
+            )
 
     def _run(self, target):
         print(f"Current Target being tested: {target}")
-        path = os.path.join(self._tests_path, target)
         xml_report = os.path.join(self._output_path, f"{target}-report.xml")
         html_report = os.path.join(self._output_path, f"{target}-report.html")
         py_tests_arguments = self._get_copy_of_py_tests_arguments()
         py_tests_arguments.extend(["--junitxml", xml_report])
         py_tests_arguments.extend(["--html", html_report])
-        if target in self.load_scope_targets or self._num_processes == 1:
+        if self._is_load_scope(target):
             py_tests_arguments.extend(["--dist", "loadscope"])
+        if self._retries:
+            py_tests_arguments.extend(["--saucedemo-retries", f"{self._retries}"])
 
-        py_tests_arguments.append(path)
+        tests = self._get_tests_to_run(target)
+        if tests is None:
+            return
+        py_tests_arguments.extend(tests)
         print(f"arguments: {py_tests_arguments}")
-        pytest.main(args=py_tests_arguments)
+        recorder = ResultsRecorderPlugin(target_name=target)
+        progress_reporter = ProgressReporterPlugin(
+            target,
+            num_workers=self._num_processes,
+            expected_durations=self._history.get_mean_durations(target) if self._history else None,
+            progress_file=os.path.join(self._output_path, f"{target}-progress.jsonl"),
+            show_progress=self._show_progress,
+        )
+        pytest.main(args=py_tests_arguments, plugins=[recorder, progress_reporter])
 
         print(f"Tests for Target: {target} started")
         print("Waiting")
 
-        html_parser = HTMLTestResultsParser(target_name=target, file_path=html_report)
-        self._results.append(html_parser.get_tests_results())
+        if recorder.total_reports > 0:
+            results = recorder.results
+        else:
+            # No reports were received by the plugin e.g it was not registered. Fall back to the reports files
+            if os.path.exists(xml_report):
+                report_parser = JUnitXMLResultsParser(target_name=target, file_path=xml_report)
+            else:
+                report_parser = HTMLTestResultsParser(target_name=target, file_path=html_report)
+            results = report_parser.get_tests_results()
+            for node_id in recorder.flaky_node_ids:
+                module = get_node_module(os.path.relpath(node_id, recorder.rootpath))
+                results.mark_flaky(*split_node_id(node_id), module=module)
+        print(f"Test results: {results}")
+        self._results.append(results)
+        self._save_failed_node_ids(target, recorder)
 
         print(f"Tests for Target: {target} finished")
+        return results
 
 
 class SaucedemoPipelineTestRunner(SaucedemoTestRunner):
@@ -204,12 +498,39 @@ class SaucedemoPipelineTestRunner(SaucedemoTestRunner):
         output_path="",
         browser="chrome",
         grid=None,
+        rerun_failed=False,
+        retries=0,
+        history_db=None,
+        show_progress=False,
+        adaptive_timeouts=False,
+        profile_locators=False,
+        page_load_strategy=None,
+        block_resources=None,
+        fast_profile=False,
     ):
         """ "
         Run Given tests.
 
         """
-        super().__init__(tests_path, tests_to_run, load_scope_targets, output_path, num_processes, headless=headless, browser=browser, grid=grid)
+        super().__init__(
+            tests_path,
+            tests_to_run,
+            load_scope_targets=load_scope_targets,
+            num_processes=num_processes,
+            headless=headless,
+            output_path=output_path,
+            browser=browser,
+            grid=grid,
+            rerun_failed=rerun_failed,
+            retries=retries,
+            history_db=history_db,
+            show_progress=show_progress,
+            adaptive_timeouts=adaptive_timeouts,
+            profile_locators=profile_locators,
+            page_load_strategy=page_load_strategy,
+            block_resources=block_resources,
+            fast_profile=fast_profile,
+        )
         self._username = username
         self._password = password
         self._host_url = host_url
@@ -248,4 +569,7 @@ class SaucedemoPipelineTestRunner(SaucedemoTestRunner):
     def host_url(self):
         return self._host_url
 
+    def _get_host_url(self):
+        return self._host_url
+
 
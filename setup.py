@@ -15,4 +15,12 @@ setup(
         "click==8.1.3",
         "webdriver-manager~=3.8.5",
     ],
+    entry_points={
+        "console_scripts": [
+            "saucedemo-tests = saucedemo_selenium_lib.test_result.cli:cli",
+        ],
+        "pytest11": [
+            "saucedemo_selenium_lib = saucedemo_selenium_lib.test_result.pytest_plugin",
+        ],
+    },
 )